@@ -0,0 +1,143 @@
+# backend/benchmarks/async_db_concurrency.py
+"""Concurrent requests against sync (threadpool) vs async (AsyncSession) routes.
+
+Both apps serve GET /players with the same connection pool size and the same
+threadpool. Each request reads the players table, then holds its connection for
+`latency` ms more, standing in for the network round trips of a remote MySQL
+server: the sync route blocks a worker thread for that time, the async route
+only awaits. Every cell runs in a fresh process so peak RSS and thread counts
+are per model.
+
+    python -m backend.benchmarks.async_db_concurrency [latency_ms] [requests]
+
+Point DATABASE_URL at a real server (and pass latency 0) to measure the drivers
+themselves; by default a scratch SQLite file is used. aiosqlite runs every
+connection on a thread of its own, so on SQLite the async model still pays a
+thread per connection -- raise DATABASE_ASYNC_POOL_SIZE against MySQL to see
+concurrency beyond the threadpool at a fixed memory budget.
+"""
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+os.environ.setdefault("SPOTIFY_CLIENT_ID", "benchmark")
+os.environ.setdefault("SPOTIFY_CLIENT_SECRET", "benchmark")
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.gettempdir(), "ntt_async_benchmark.sqlite3"))
+os.environ.setdefault("THREADPOOL_SIZE", "40")
+
+CONCURRENCY = (10, 40, 200, 800)
+MODELS = ("threadpool", "async")
+
+
+def build_app(model: str, latency: float):
+    from fastapi import Depends, FastAPI
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import Session
+    from .. import database
+    from ..models.Player import Player
+
+    app = FastAPI()
+
+    if model == "threadpool":
+        @app.get("/players")
+        def players(db: Session = Depends(database.get_db)):
+            rows = db.scalars(select(Player).limit(20)).all()
+            time.sleep(latency)
+            return {"count": len(rows)}
+    else:
+        @app.get("/players")
+        async def players(db: AsyncSession = Depends(database.get_async_db)):
+            rows = (await db.scalars(select(Player).limit(20))).all()
+            await asyncio.sleep(latency)
+            return {"count": len(rows)}
+
+    return app
+
+
+def seed() -> None:
+    from .. import database, models
+    from ..models.Player import Player
+
+    database.Base.metadata.create_all(bind=database.engine)
+    db = database.SessionLocal()
+    try:
+        if db.query(Player).count() < 20:
+            db.add_all(Player(name=f"Benchmark {i}") for i in range(20))
+            db.commit()
+    finally:
+        db.close()
+
+
+async def run_cell(model: str, concurrency: int, latency: float, total: int) -> dict:
+    import anyio.to_thread
+    import httpx
+    from .. import database
+
+    threads = int(os.environ["THREADPOOL_SIZE"])
+    anyio.to_thread.current_default_thread_limiter().total_tokens = threads
+    app = build_app(model, latency)
+    latencies = []
+    peak_threads = threading.active_count()
+    remaining = total
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        (await client.get("/players")).raise_for_status()  # warm up the pool
+
+        async def worker():
+            nonlocal remaining, peak_threads
+            while remaining > 0:
+                remaining -= 1
+                start = time.perf_counter()
+                response = await client.get("/players")
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - start)
+                peak_threads = max(peak_threads, threading.active_count())
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    await database.dispose_async_engine()
+    latencies.sort()
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "threads": peak_threads,
+        "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main(latency_ms: float, total: int) -> None:
+    from .. import database
+
+    seed()
+    print(f"{database.DATABASE_URL} | {latency_ms:g} ms held per request | "
+          f"threadpool {os.environ['THREADPOOL_SIZE']} | {total} requests per cell")
+    print(f"{'model':<12}{'clients':>8}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'threads':>9}{'peak RSS MB':>13}")
+    for concurrency in CONCURRENCY:
+        for model in MODELS:
+            output = subprocess.run(
+                [sys.executable, "-m", __spec__.name, "--cell", model, str(concurrency), str(latency_ms), str(total)],
+                check=True, capture_output=True, text=True
+            ).stdout
+            cell = json.loads(output.strip().splitlines()[-1])
+            print(f"{model:<12}{concurrency:>8}{cell['rps']:>10.0f}{cell['p50_ms']:>10.1f}{cell['p99_ms']:>10.1f}"
+                  f"{cell['threads']:>9}{cell['rss_mb']:>13.1f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--cell":
+        model, concurrency, latency_ms, total = sys.argv[2], int(sys.argv[3]), float(sys.argv[4]), int(sys.argv[5])
+        print(json.dumps(asyncio.run(run_cell(model, concurrency, latency_ms / 1000, total))))
+    else:
+        main(float(sys.argv[1]) if len(sys.argv) > 1 else 20.0,
+             int(sys.argv[2]) if len(sys.argv) > 2 else 2000)
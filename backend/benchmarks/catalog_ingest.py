@@ -0,0 +1,87 @@
+# backend/benchmarks/catalog_ingest.py
+"""Catalog ingestion: one request per row vs chunked multi-row upserts.
+
+"per row" replays what seeding through /songs/, /artists/ and /track-infos/
+costs in the database alone: three single-row upserts and three commits per
+track. "bulk" runs CatalogMethods.ingest_tracks. Each model ingests the same
+synthetic playlist into a fresh catalog and then again (every row conflicts).
+
+    python -m backend.benchmarks.catalog_ingest [tracks] [chunk_size]
+
+CATALOG_BENCHMARK_URL selects the database (default: a scratch SQLite file). It is
+migrated and its catalog tables are emptied, so never point it at real data.
+"""
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SPOTIFY_CLIENT_ID", "benchmark")
+os.environ.setdefault("SPOTIFY_CLIENT_SECRET", "benchmark")
+
+from sqlalchemy import delete
+from sqlalchemy.orm import sessionmaker
+from ..config import Settings
+from ..database import create_engine_from_settings
+from .. import migrations, models
+from ..methods import CatalogMethods
+from ..methods.UpsertMethods import upsert
+from ..models.Song import Song
+from ..models.Artist import Artist
+from ..models.TrackInfo import TrackInfo
+from ..models.RoundSonglist import RoundSonglist
+
+
+def playlist(size: int):
+    # Roughly one artist per five tracks, as in a typical playlist
+    return [{"id": f"track{i}", "name": f"Track {i}",
+             "artists": [{"id": f"artist{i % max(size // 5, 1)}", "name": f"Artist {i % max(size // 5, 1)}"}]}
+            for i in range(size)]
+
+
+def per_row(db, tracks, _chunk_size) -> None:
+    for track in tracks:
+        artist = track["artists"][0]
+        db_artist = upsert(db, Artist, {"spotify_id": artist["id"], "name": artist["name"]},
+                           ["spotify_id"], ["name"], commit=True)
+        db_song = upsert(db, Song, {"spotify_id": track["id"], "title": track["name"]},
+                         ["spotify_id"], ["title"], commit=True)
+        upsert(db, TrackInfo, {"song_id": db_song.song_id, "artist_id": db_artist.artist_id},
+               ["song_id", "artist_id"], commit=True)
+
+
+def bulk(db, tracks, chunk_size) -> None:
+    CatalogMethods.ingest_tracks(db, tracks, chunk_size=chunk_size)
+
+
+def main(size: int, chunk_size: int) -> None:
+    url = os.environ.get("CATALOG_BENCHMARK_URL")
+    if not url:
+        path = os.path.join(tempfile.gettempdir(), "ntt_catalog_benchmark.sqlite3")
+        url = "sqlite:///" + path
+    engine = create_engine_from_settings(Settings(database_url=url))
+    Session = sessionmaker(bind=engine, autoflush=False)
+    migrations.upgrade(engine)
+    tracks = playlist(size)
+
+    print(f"{url} | {size} tracks | chunks of {chunk_size}")
+    print(f"{'model':<10}{'pass':<10}{'seconds':>10}{'tracks/s':>12}")
+    for label, ingest in (("per row", per_row), ("bulk", bulk)):
+        with engine.begin() as connection:
+            for model in (RoundSonglist, TrackInfo, Song, Artist):
+                connection.execute(delete(model))
+        for run in ("fresh", "again"):
+            db = Session()
+            try:
+                start = time.perf_counter()
+                ingest(db, tracks, chunk_size)
+                elapsed = time.perf_counter() - start
+            finally:
+                db.close()
+            print(f"{label:<10}{run:<10}{elapsed:>10.2f}{size / elapsed:>12.0f}")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1500,
+         int(sys.argv[2]) if len(sys.argv) > 2 else CatalogMethods.CHUNK_SIZE)
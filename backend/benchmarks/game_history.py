@@ -0,0 +1,98 @@
+# backend/benchmarks/game_history.py
+"""Latency of the game history pages at increasing depth, keyset vs OFFSET.
+
+Seeds the synthetic games of index_pack, spreads their created_at one minute
+apart (every fifth game sharing its neighbour's, so page boundaries hit ties),
+rebuilds the score totals and walks GameSummaryMethods.get_game_summaries
+through every page. Pages at a few depths are then timed whole, and the page of
+game ids alone both ways: keyset (page_query) and the OFFSET it replaces.
+
+    python -m backend.benchmarks.game_history [games] [samples]
+
+GAME_HISTORY_BENCHMARK_URL selects the database (default: a scratch SQLite file).
+Its tables are dropped and recreated, so never point it at real data.
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+os.environ.setdefault("SPOTIFY_CLIENT_ID", "benchmark")
+os.environ.setdefault("SPOTIFY_CLIENT_SECRET", "benchmark")
+
+from sqlalchemy import MetaData, bindparam, select, text, update
+from sqlalchemy.orm import Session
+from ..config import Settings
+from ..database import create_engine_from_settings
+from .. import migrations, models
+from ..methods import GameSummaryMethods, ScoreTotalsMethods
+from ..models.Game import Game
+from .index_pack import seed
+
+PAGE_SIZE = 20
+
+
+def offset_page(db: Session, offset: int):
+    return db.scalars(
+        select(Game.game_id).order_by(Game.created_at.desc(), Game.game_id.desc())
+        .offset(offset).limit(PAGE_SIZE)
+    ).all()
+
+
+def main(games: int, samples: int) -> None:
+    url = os.environ.get("GAME_HISTORY_BENCHMARK_URL")
+    if not url:
+        path = os.path.join(tempfile.gettempdir(), "ntt_game_history_benchmark.sqlite3")
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+        url = "sqlite:///" + path
+    engine = create_engine_from_settings(Settings(database_url=url))
+    with engine.begin() as connection:
+        existing = MetaData()
+        existing.reflect(bind=connection)
+        existing.drop_all(bind=connection)
+    migrations.upgrade(engine)
+    seed(engine, games)
+    start = datetime(2024, 1, 1)
+    with engine.begin() as connection:
+        connection.execute(
+            update(Game).where(Game.game_id == bindparam("b_game_id")).values(created_at=bindparam("b_created_at")),
+            [{"b_game_id": game_id, "b_created_at": start + timedelta(minutes=game_id - game_id % 5 // 4)}
+             for game_id in range(1, games + 1)]
+        )
+        ScoreTotalsMethods.rebuild(connection)
+        if connection.dialect.name == "sqlite":
+            connection.execute(text("ANALYZE"))
+
+    with Session(engine) as db:
+        # Every page once: the cursors to time from, and a check that no game repeats or goes missing
+        cursors, seen, cursor = [None], [], None
+        while True:
+            page, cursor = GameSummaryMethods.get_game_summaries(db, limit=PAGE_SIZE, cursor=cursor)
+            seen.extend(summary["game_id"] for summary in page)
+            if cursor is None:
+                break
+            cursors.append(cursor)
+        assert sorted(seen) == list(range(1, games + 1)), "pages skipped or repeated games"
+
+        print(f"{url} | {games} games, {len(cursors)} pages of {PAGE_SIZE} | {samples} samples")
+        print(f"{'page':>8}{'page ms':>12}{'keyset ids':>12}{'offset ids':>12}")
+        for page_number in sorted({1, len(cursors) // 10 or 1, len(cursors) // 2 or 1, len(cursors)}):
+            cursor = cursors[page_number - 1]
+            timings = []
+            for run in (lambda: GameSummaryMethods.get_game_summaries(db, limit=PAGE_SIZE, cursor=cursor),
+                        lambda: db.scalars(GameSummaryMethods.page_query(PAGE_SIZE, cursor)).all(),
+                        lambda: offset_page(db, (page_number - 1) * PAGE_SIZE)):
+                start = time.perf_counter()
+                for _ in range(samples):
+                    run()
+                timings.append((time.perf_counter() - start) / samples * 1000)
+            print(f"{page_number:>8}" + "".join(f"{ms:>12.2f}" for ms in timings))
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 50)
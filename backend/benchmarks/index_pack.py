@@ -0,0 +1,165 @@
+# backend/benchmarks/index_pack.py
+"""EXPLAIN plans and latency of the hot lookups before and after migration 0003.
+
+Builds a scratch database at the baseline schema (tables without the index
+pack), fills it with synthetic games -- participants, rounds, teams, team players
+and songlists -- then runs the same queries as methods/ before and after
+applying the migrations.
+
+    python -m backend.benchmarks.index_pack [games] [samples]
+
+INDEX_BENCHMARK_URL selects the database (default: a scratch SQLite file). Its
+tables are dropped and recreated, so never point it at real data.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SPOTIFY_CLIENT_ID", "benchmark")
+os.environ.setdefault("SPOTIFY_CLIENT_SECRET", "benchmark")
+
+from sqlalchemy import MetaData, insert, select, text
+from sqlalchemy.engine import Engine
+from ..config import Settings
+from ..database import Base, create_engine_from_settings
+from .. import migrations, models
+from ..models.Enums import Role, ScoreType
+
+PARTICIPANTS_PER_GAME = 4
+ROUNDS_PER_GAME = 3
+SONGS_PER_ROUND = 10
+CATALOG_SIZE = 5000
+
+
+def chunked_insert(connection, table, rows, size=5000) -> None:
+    for start in range(0, len(rows), size):
+        connection.execute(insert(table), rows[start:start + size])
+
+
+def seed(engine: Engine, games: int) -> None:
+    rng = random.Random(7)
+    t = Base.metadata.tables
+    players = [{"player_id": i, "name": f"Player {i}"} for i in range(1, 201)]
+    songs = [{"song_id": i, "spotify_id": f"song{i}", "title": f"Song {i}"} for i in range(1, CATALOG_SIZE + 1)]
+    artists = [{"artist_id": i, "spotify_id": f"artist{i}", "name": f"Artist {i}"} for i in range(1, CATALOG_SIZE + 1)]
+    track_infos = [{"track_info_id": i, "song_id": i, "artist_id": rng.randint(1, CATALOG_SIZE)}
+                   for i in range(1, CATALOG_SIZE + 1)]
+    game_rows, participants, rounds, teams, team_players, songlists = [], [], [], [], [], []
+    for game_id in range(1, games + 1):
+        game_rows.append({"game_id": game_id, "songs_per_round": SONGS_PER_ROUND, "current_track_index": 0})
+        seats = []
+        for seat, player_id in enumerate(rng.sample(range(1, 201), PARTICIPANTS_PER_GAME), start=1):
+            participant_id = len(participants) + 1
+            participants.append({"participant_id": participant_id, "game_id": game_id,
+                                 "player_id": player_id, "seat_number": seat})
+            seats.append(participant_id)
+        for round_number in range(1, ROUNDS_PER_GAME + 1):
+            round_id = len(rounds) + 1
+            # Only the last round of the most recent games is still in progress
+            rounds.append({"round_id": round_id, "game_id": game_id, "round_number": round_number,
+                           "is_complete": not (round_number == ROUNDS_PER_GAME and game_id > games - 50)})
+            for role, members in ((Role.DJ, seats[:2]), (Role.PLAYER, seats[2:])):
+                round_team_id = len(teams) + 1
+                teams.append({"round_team_id": round_team_id, "round_id": round_id, "role": role.name})
+                for participant_id in members:
+                    team_players.append({"round_team_player_id": len(team_players) + 1,
+                                         "round_team_id": round_team_id, "participant_id": participant_id})
+            for _ in range(SONGS_PER_ROUND):
+                track = rng.choice(track_infos)
+                songlists.append({"round_songlist_id": len(songlists) + 1, "round_id": round_id,
+                                  "song_id": track["song_id"], "round_team_id": len(teams),
+                                  "track_info_id": track["track_info_id"], "score_type": ScoreType.STANDARD.name})
+    with engine.begin() as connection:
+        for table, rows in (("player", players), ("song", songs), ("artist", artists), ("track_info", track_infos),
+                            ("game", game_rows), ("participant", participants), ("round", rounds),
+                            ("round_team", teams), ("round_team_player", team_players),
+                            ("round_songlist", songlists)):
+            chunked_insert(connection, t[table], rows)
+
+
+def queries(games: int):
+    """(label, statement factory) for the lookups methods/ issues"""
+    t = Base.metadata.tables
+    rounds = games * ROUNDS_PER_GAME
+    return [
+        ("active round of a game", lambda rng: select(t["round"]).where(
+            t["round"].c.game_id == rng.randint(1, games), t["round"].c.is_complete == False).limit(1)),
+        ("rounds of a game", lambda rng: select(t["round"]).where(
+            t["round"].c.game_id == rng.randint(1, games)).order_by(t["round"].c.round_number)),
+        ("participants of a game", lambda rng: select(t["participant"]).where(
+            t["participant"].c.game_id == rng.randint(1, games)).order_by(t["participant"].c.seat_number)),
+        ("teams of a round", lambda rng: select(t["round_team"]).where(
+            t["round_team"].c.round_id == rng.randint(1, rounds))),
+        ("team by role", lambda rng: select(t["round_team"]).where(
+            t["round_team"].c.round_id == rng.randint(1, rounds), t["round_team"].c.role == Role.DJ).limit(1)),
+        ("players of a team", lambda rng: select(t["round_team_player"]).where(
+            t["round_team_player"].c.round_team_id == rng.randint(1, rounds * 2))),
+        ("songs of a round", lambda rng: select(t["round_songlist"]).where(
+            t["round_songlist"].c.round_id == rng.randint(1, rounds))),
+        ("track info by song/artist", lambda rng: select(t["track_info"]).where(
+            t["track_info"].c.song_id == rng.randint(1, CATALOG_SIZE),
+            t["track_info"].c.artist_id == rng.randint(1, CATALOG_SIZE))),
+    ]
+
+
+def explain(connection, statement) -> str:
+    sql = str(statement.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True}))
+    if connection.dialect.name == "sqlite":
+        return "; ".join(row[-1] for row in connection.execute(text("EXPLAIN QUERY PLAN " + sql)))
+    rows = connection.execute(text("EXPLAIN " + sql)).mappings().all()
+    return "; ".join(f"{row.get('type')} key={row.get('key')} rows={row.get('rows')}" for row in rows)
+
+
+def measure(engine: Engine, games: int, samples: int):
+    results = {}
+    with engine.connect() as connection:
+        for label, factory in queries(games):
+            rng = random.Random(label)
+            plan = explain(connection, factory(rng))
+            statements = [factory(rng) for _ in range(samples)]
+            start = time.perf_counter()
+            for statement in statements:
+                connection.execute(statement).all()
+            results[label] = (plan, (time.perf_counter() - start) / samples * 1e6)
+    return results
+
+
+def main(games: int, samples: int) -> None:
+    url = os.environ.get("INDEX_BENCHMARK_URL")
+    if not url:
+        path = os.path.join(tempfile.gettempdir(), "ntt_index_benchmark.sqlite3")
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+        url = "sqlite:///" + path
+    engine = create_engine_from_settings(Settings(database_url=url))
+    with engine.begin() as connection:
+        existing = MetaData()
+        existing.reflect(bind=connection)
+        existing.drop_all(bind=connection)
+    # The baseline has none of the index pack
+    migrations.upgrade(engine, 1)
+
+    start = time.perf_counter()
+    seed(engine, games)
+    print(f"{url} | {games} games seeded in {time.perf_counter() - start:.1f}s | {samples} samples per query")
+    before = measure(engine, games, samples)
+    start = time.perf_counter()
+    migrations.upgrade(engine)
+    print(f"migrations applied in {time.perf_counter() - start:.1f}s\n")
+    after = measure(engine, games, samples)
+
+    print(f"{'query':<28}{'before us':>12}{'after us':>12}{'speedup':>10}")
+    for label in before:
+        print(f"{label:<28}{before[label][1]:>12.1f}{after[label][1]:>12.1f}{before[label][1] / after[label][1]:>9.1f}x")
+    print()
+    for label in before:
+        print(f"{label}\n  before: {before[label][0]}\n  after:  {after[label][0]}")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 300)
@@ -0,0 +1,88 @@
+# backend/benchmarks/leaderboard.py
+"""Latency of the server-side leaderboard.
+
+Seeds the synthetic games of index_pack (10 songs per round, 30 per game), marks
+a share of the songs as correctly guessed, rebuilds the score totals (the seed
+writes through Core, past the session hooks that normally maintain them), then
+times LeaderboardMethods.get_leaderboard with and without filters.
+
+    python -m backend.benchmarks.leaderboard [games] [samples]
+
+LEADERBOARD_BENCHMARK_URL selects the database (default: a scratch SQLite file).
+Its tables are dropped and recreated, so never point it at real data.
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+os.environ.setdefault("SPOTIFY_CLIENT_ID", "benchmark")
+os.environ.setdefault("SPOTIFY_CLIENT_SECRET", "benchmark")
+
+from sqlalchemy import MetaData, func, select, text, update
+from sqlalchemy.orm import Session
+from ..config import Settings
+from ..database import create_engine_from_settings
+from .. import migrations, models
+from ..methods import LeaderboardMethods, ScoreTotalsMethods
+from ..models.RoundSonglist import RoundSonglist
+from .index_pack import seed
+
+FILTERS = (
+    ("all time, top 10", {}),
+    ("all time, top 100", {"limit": 100}),
+    ("min 100 games", {"min_games": 100}),
+    ("last 30 days", {"since": datetime.now() - timedelta(days=30)}),
+)
+
+
+def main(games: int, samples: int) -> None:
+    url = os.environ.get("LEADERBOARD_BENCHMARK_URL")
+    if not url:
+        path = os.path.join(tempfile.gettempdir(), "ntt_leaderboard_benchmark.sqlite3")
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+        url = "sqlite:///" + path
+    engine = create_engine_from_settings(Settings(database_url=url))
+    with engine.begin() as connection:
+        existing = MetaData()
+        existing.reflect(bind=connection)
+        existing.drop_all(bind=connection)
+    migrations.upgrade(engine)
+    seed(engine, games)
+    with engine.begin() as connection:
+        connection.execute(update(RoundSonglist).where(RoundSonglist.round_songlist_id % 2 == 0)
+                           .values(correct_artist_guess=True))
+        connection.execute(update(RoundSonglist).where(RoundSonglist.round_songlist_id % 3 == 0)
+                           .values(correct_song_title_guess=True))
+        connection.execute(update(RoundSonglist).where(RoundSonglist.round_songlist_id % 7 == 0)
+                           .values(bonus_correct_movie_guess=True))
+    start = time.perf_counter()
+    with engine.begin() as connection:
+        counts = ScoreTotalsMethods.rebuild(connection)
+        if connection.dialect.name == "sqlite":
+            connection.execute(text("ANALYZE"))
+    rebuilt = time.perf_counter() - start
+
+    with Session(engine) as db:
+        songs = db.scalar(select(func.count()).select_from(RoundSonglist))
+        print(f"{url} | {games} games, {songs} songlist rows | {samples} samples")
+        print(f"score totals rebuilt in {rebuilt:.2f}s ({counts['game_rows']} game rows, "
+              f"{counts['player_rows']} player rows)")
+        print(f"{'filter':<22}{'ms':>10}  top entry")
+        for label, filters in FILTERS:
+            rows = LeaderboardMethods.get_leaderboard(db, **filters)
+            start = time.perf_counter()
+            for _ in range(samples):
+                LeaderboardMethods.get_leaderboard(db, **filters)
+            elapsed = (time.perf_counter() - start) / samples * 1000
+            top = f"{rows[0][0].name}: {rows[0][1]} points, {rows[0][2]} games" if rows else "-"
+            print(f"{label:<22}{elapsed:>10.1f}  {top}")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 3400,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 50)
@@ -0,0 +1,95 @@
+# backend/benchmarks/middleware_overhead.py
+"""Per-request cost of the Spotify auth middleware.
+
+Compares a bare app, the previous BaseHTTPMiddleware-style pass-through and the
+current pure-ASGI SpotifyAuthMiddleware, for a non-Spotify route and a Spotify
+route that reads the injected token. Runs in-process over httpx's ASGI
+transport, so the numbers are middleware + routing cost only.
+
+    python -m backend.benchmarks.middleware_overhead [requests]
+"""
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+os.environ.setdefault("SPOTIFY_CLIENT_ID", "benchmark")
+os.environ.setdefault("SPOTIFY_CLIENT_SECRET", "benchmark")
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from ..middleware import SpotifyAuthMiddleware
+from ..services.SpotifyTokenStore import spotify_token_store
+
+
+class LegacySpotifyAuthMiddleware(BaseHTTPMiddleware):
+    """The old BaseHTTPMiddleware shape, reading from the same token store"""
+
+    async def dispatch(self, request: Request, call_next):
+        if not request.url.path.startswith("/api/spotify"):
+            return await call_next(request)
+        tokens = spotify_token_store.snapshot()
+        if not tokens or not tokens.access_token:
+            return JSONResponse({"detail": "No Spotify authorization"}, status_code=401)
+        request.state.spotify_token = tokens.access_token
+        return await call_next(request)
+
+
+def build_app(middleware=None) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.get("/api/spotify/ping")
+    async def spotify_ping(request: Request):
+        return {"token": request.state.spotify_token}
+
+    if middleware is not None:
+        app.add_middleware(middleware)
+    return app
+
+
+async def time_requests(app: FastAPI, path: str, count: int) -> float:
+    """Mean microseconds per request"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(200):  # warm up
+            (await client.get(path)).raise_for_status()
+        start = time.perf_counter()
+        for _ in range(count):
+            await client.get(path)
+        return (time.perf_counter() - start) / count * 1e6
+
+
+async def main(count: int) -> None:
+    spotify_token_store.load({
+        "SPOTIFY_ACCESS_TOKEN": "benchmark-token",
+        "SPOTIFY_TOKEN_EXPIRES_AT": (datetime.now() + timedelta(hours=1)).isoformat(),
+    })
+    apps = {
+        "none": build_app(),
+        "BaseHTTPMiddleware (before)": build_app(LegacySpotifyAuthMiddleware),
+        "pure ASGI (after)": build_app(SpotifyAuthMiddleware),
+    }
+
+    print(f"{count} sequential requests per cell, microseconds/request")
+    print(f"{'middleware':<30}{'/api/ping':>12}{'/api/spotify/ping':>20}")
+    baseline = {}
+    for name, app in apps.items():
+        plain = await time_requests(app, "/api/ping", count)
+        spotify = await time_requests(app, "/api/spotify/ping", count) if name != "none" else None
+        if name == "none":
+            baseline["plain"] = plain
+            print(f"{name:<30}{plain:>12.1f}{'-':>20}")
+            continue
+        overhead = plain - baseline["plain"]
+        print(f"{name:<30}{plain:>12.1f}{spotify:>20.1f}   ({overhead:+.1f} on non-Spotify routes)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000))
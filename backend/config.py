@@ -7,6 +7,72 @@ class Settings(BaseSettings):
     """Application settings"""
     spotify_client_id: str
     spotify_client_secret: str
+
+    # Database: DATABASE_URL wins; otherwise the profile's default URL ("mysql" or embedded "sqlite")
+    database_url: str = ""
+    database_profile: str = "mysql"
+    database_pool_size: int = 0  # 0 = one connection per threadpool worker
+    database_max_overflow: int = 10
+    database_pool_timeout: float = 30.0
+    database_pool_recycle: int = 1800
+    database_pool_pre_ping: bool = True
+    database_statement_timeout_ms: int = 0  # 0 = no limit (SQLite: lock wait, default 5s)
+    database_echo: bool = False
+    # Apply pending migrations in the lifespan (python -m backend.migrations upgrade otherwise);
+    # a database that is down only produces a warning
+    database_migrate_on_startup: bool = True
+    # Async engine for routes on get_async_db: derived from the URL above unless set
+    # (aiomysql for MySQL, aiosqlite for SQLite, asyncpg for PostgreSQL)
+    database_async_url: str = ""
+    database_async_pool_size: int = 0  # 0 = same as the sync pool
+
+    # Worker threads for sync routes and dependencies (AnyIO's default is 40)
+    threadpool_size: int = 40
+
+    # Import and register the API routers on the first request instead of at import
+    lazy_routers: bool = False
+
+    # Shared Spotify HTTP client (connection pool + timeouts)
+    spotify_http_max_connections: int = 20
+    spotify_http_max_keepalive_connections: int = 10
+    spotify_http_keepalive_expiry: float = 30.0
+    spotify_http_connect_timeout: float = 5.0
+    spotify_http_read_timeout: float = 10.0
+    spotify_http_pool_timeout: float = 5.0
+    spotify_http2: bool = True
+
+    # App-wide cache (OAuth state, token snapshot, shared response tier).
+    # "memory" is per process; "sqlite" is a WAL file shared by every worker on the host.
+    cache_backend: str = "memory"
+    cache_path: str = os.path.join(os.path.dirname(__file__), ".cache", "shared_cache.sqlite3")
+    cache_max_entries: int = 20000
+    cache_max_bytes: int = 64 * 1024 * 1024
+
+    # Per-process memory tier of the Spotify catalog response cache
+    # (backed by the app-wide cache when that is shared)
+    spotify_cache_max_entries: int = 2048
+    spotify_cache_max_bytes: int = 32 * 1024 * 1024
+
+    # Spotify rate limiting (Spotify enforces a rolling 30 second window)
+    spotify_rate_limit_requests: int = 150
+    spotify_rate_limit_window: float = 30.0
+    spotify_rate_limit_burst: int = 20
+    spotify_max_retries: int = 3
+
+    # Seconds a finished player-state GET is shared with identical callers (0 = in-flight only)
+    spotify_player_state_window: float = 0.5
+
+    # Shared player-state poller intervals (seconds)
+    spotify_poll_playing_interval: float = 1.0
+    spotify_poll_paused_interval: float = 5.0
+    spotify_poll_idle_interval: float = 15.0
+
+    # Seconds between play-random's background checks of a playlist's snapshot_id
+    playlist_mirror_check_interval: float = 60.0
+
+    # Background token refresh: renew this many seconds before expiry, retry after failures
+    spotify_token_refresh_margin: float = 300.0
+    spotify_token_refresh_retry_interval: float = 30.0
     
     class Config:
         env_file = os.path.join(os.path.dirname(__file__), ".env")
@@ -16,4 +82,4 @@ class Settings(BaseSettings):
 @lru_cache()
 def get_settings() -> Settings:
     """Get cached settings instance"""
-    return Settings()
\ No newline at end of file
+    return Settings()
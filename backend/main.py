@@ -1,75 +1,123 @@
 # Update: backend/main.py
+import asyncio
 import os
+import anyio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from sqlalchemy.exc import SQLAlchemyError
 from . import database
-from .models import Player, Game, Participant, Round, RoundTeam, RoundTeamPlayer, Song, Artist, TrackInfo, RoundSonglist, GameplaySettings
-from .routes.PlayerRoutes import router as player_router
-from .routes.GameRoutes import router as game_router
-from .routes.ParticipantRoutes import router as participant_router
-from .routes.RoundRoutes import router as round_router
-from .routes.RoundTeamRoutes import router as round_team_router
-from .routes.RoundTeamPlayerRoutes import router as round_team_player_router
-from .routes.SongRoutes import router as song_router
-from .routes.ArtistRoutes import router as artist_router
-from .routes.TrackInfoRoutes import router as track_info_router
-from .routes.RoundSonglistRoutes import router as round_songlist_router
-from .routes.UploadRoutes import router as upload_router
-from .routes.SpotifyRoutes import router as spotify_router
-from .routes.SpotifyAuthRoutes import router as spotify_auth_router
-from .routes.GameplaySettingsRoutes import router as gameplay_settings_router
+from . import migrations
+from . import models  # noqa: F401 -- every mapper registered before the first query
+from .routes import include_routers
+from .methods.ScoreTotalsMethods import track_score_totals
 from .config import get_settings
-from .SpotifyAuth import SpotifyAuth
-from .middleware import SpotifyAuthMiddleware
-from .database import Base, engine
+from .services.SpotifyHttpClient import SpotifyHttpClient
+from .services.SpotifyResponseCache import SpotifyResponseCache
+from .services.SharedCache import create_cache_backend
+from .services.SpotifyRequestScheduler import SpotifyRequestScheduler
+from .services.SpotifySingleFlight import SpotifySingleFlight
+from .services.PlayerStateHub import PlayerStateHub
+from .services.SpotifyTokenStore import spotify_token_store
+from .services.SettingsSnapshot import settings_snapshot
+from .services.SpotifyTokenRefresher import SpotifyTokenRefresher
+from .middleware import LazyRouterMiddleware, SpotifyAuthMiddleware
+from .database import engine
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 IMAGES_DIR = os.path.join(BASE_DIR, "../frontend/public/images")
 
-# Create all tables
-Base.metadata.create_all(bind=engine)
-
 settings = get_settings()
-spotify_auth = SpotifyAuth(
-    client_id=settings.spotify_client_id,
-    client_secret=settings.spotify_client_secret,
-)
+
+# Every session this app opens keeps the leaderboard totals in step with its writes
+track_score_totals()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Own long-lived resources for the lifetime of the app"""
+    if settings.database_migrate_on_startup:
+        try:
+            applied = await asyncio.to_thread(migrations.upgrade, engine)
+            if applied:
+                print(f"Applied migrations: {', '.join(f'{version:04d}' for version in applied)}")
+        except SQLAlchemyError as e:
+            # Serve anyway: routes that need the database fail until it is reachable
+            print(f"Warning: could not migrate the database at startup: {e}")
+    # Sync routes each hold at most one pooled connection, so a pool at least as
+    # large as the threadpool means they never queue for a connection
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+    if database.pool_size_for(settings) + settings.database_max_overflow < settings.threadpool_size:
+        print("Warning: database pool is smaller than the threadpool; sync routes may wait for connections")
+    app.state.shared_cache = create_cache_backend(settings)
+    spotify_token_store.use(app.state.shared_cache)
+    settings_snapshot.use(app.state.shared_cache)
+    app.state.spotify_http = SpotifyHttpClient.from_settings(settings)
+    app.state.spotify_cache = SpotifyResponseCache(
+        max_entries=settings.spotify_cache_max_entries,
+        max_bytes=settings.spotify_cache_max_bytes,
+        # A per-process memory tier in front of a cache every worker shares
+        shared=app.state.shared_cache if settings.cache_backend != "memory" else None
+    )
+    app.state.spotify_scheduler = SpotifyRequestScheduler(
+        requests_per_window=settings.spotify_rate_limit_requests,
+        window_seconds=settings.spotify_rate_limit_window,
+        burst=settings.spotify_rate_limit_burst,
+        max_retries=settings.spotify_max_retries
+    )
+    app.state.spotify_single_flight = SpotifySingleFlight(
+        player_state_window=settings.spotify_player_state_window
+    )
+    app.state.player_state_hub = PlayerStateHub(
+        playing_interval=settings.spotify_poll_playing_interval,
+        paused_interval=settings.spotify_poll_paused_interval,
+        idle_interval=settings.spotify_poll_idle_interval
+    )
+    app.state.spotify_token_refresher = SpotifyTokenRefresher(
+        app.state.spotify_http,
+        spotify_token_store,
+        database.SessionLocal,
+        client_id=settings.spotify_client_id,
+        client_secret=settings.spotify_client_secret,
+        margin=settings.spotify_token_refresh_margin,
+        retry_interval=settings.spotify_token_refresh_retry_interval
+    )
+    app.state.spotify_token_refresher.start()
+    yield
+    await app.state.spotify_token_refresher.stop()
+    app.state.player_state_hub.close()
+    await app.state.spotify_http.aclose()
+    await database.dispose_async_engine()
+    app.state.shared_cache.close()
+
 
 app = FastAPI(
     title="Name That Tune API",
     description="API for the Name That Tune game application",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-# CORS Middleware
+# Routers: registered now, or on the first request when LAZY_ROUTERS is set
+if settings.lazy_routers:
+    app.add_middleware(LazyRouterMiddleware)
+else:
+    include_routers(app)
+
+# Spotify Auth Middleware
+app.add_middleware(SpotifyAuthMiddleware)
+
+# CORS Middleware (added last so it wraps the auth middleware's 401s too)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],  # gameplay settings reads revalidate with If-None-Match
 )
 
-# Spotify Auth Middleware
-app.add_middleware(SpotifyAuthMiddleware, spotify_auth=spotify_auth)
-
-# Include all routers
-app.include_router(player_router, prefix="/api", tags=["players"])
-app.include_router(game_router, prefix="/api", tags=["games"])
-app.include_router(participant_router, prefix="/api", tags=["participants"])
-app.include_router(round_router, prefix="/api", tags=["rounds"])
-app.include_router(round_team_router, prefix="/api", tags=["round-teams"])
-app.include_router(round_team_player_router, prefix="/api", tags=["round-team-players"])
-app.include_router(song_router, prefix="/api", tags=["songs"])
-app.include_router(artist_router, prefix="/api", tags=["artists"])
-app.include_router(track_info_router, prefix="/api", tags=["track-infos"])
-app.include_router(round_songlist_router, prefix="/api", tags=["round-songlists"])
-app.include_router(upload_router, prefix="/api", tags=["upload"])
-app.include_router(spotify_router, prefix="/api", tags=["spotify"])
-app.include_router(spotify_auth_router, tags=["spotify-auth"])
-app.include_router(gameplay_settings_router, prefix="/api", tags=["gameplay-settings"])
-
 # Static files
 app.mount("/images", StaticFiles(directory=IMAGES_DIR), name="images")
 
@@ -85,4 +133,42 @@ def read_root():
 @app.get("/health")
 def health_check():
     """Health check endpoint"""
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy"}
+
+@app.get("/health/db")
+def database_stats():
+    """Connection pool occupancy and how long checkouts waited for a connection"""
+    stats = {**database.pool_stats(engine), "threadpool_size": settings.threadpool_size}
+    if database.async_engine is not None:
+        stats["async"] = database.pool_stats(database.async_engine)
+    return stats
+
+@app.get("/health/spotify-cache")
+def spotify_cache_stats():
+    """Hit/miss/evict counters for the Spotify response cache"""
+    return app.state.spotify_cache.stats()
+
+@app.get("/health/spotify-scheduler")
+def spotify_scheduler_stats():
+    """Queue depth and throttle counters for the Spotify request scheduler"""
+    return app.state.spotify_scheduler.stats()
+
+@app.get("/health/shared-cache")
+def shared_cache_stats():
+    """Size and evictions of the app-wide cache backend"""
+    return {"backend": settings.cache_backend, **app.state.shared_cache.stats()}
+
+@app.get("/health/spotify-coalescing")
+def spotify_coalescing_stats():
+    """How many Spotify GETs were served by sharing another caller's request"""
+    return app.state.spotify_single_flight.stats()
+
+@app.get("/health/spotify-token")
+def spotify_token_stats():
+    """When the background refresher will next renew the Spotify token"""
+    return app.state.spotify_token_refresher.stats()
+
+@app.get("/health/player-state")
+def player_state_stats():
+    """Subscribers and upstream polls per shared player-state poller"""
+    return app.state.player_state_hub.stats()
\ No newline at end of file
@@ -0,0 +1,73 @@
+# backend/methods/AsyncGameMethods.py
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from ..models.Game import Game
+from ..models.Participant import Participant
+from ..schemas.GameBase import GameCreate, GameUpdate
+
+# Relationships are loaded eagerly: an AsyncSession cannot lazy-load on attribute access.
+# Collections use selectinload (one extra IN query) rather than joinedload, which would
+# need .unique() on every result.
+
+async def get_game(db: AsyncSession, game_id: int):
+    """Get basic game without relationships"""
+    return await db.get(Game, game_id)
+
+async def get_games(db: AsyncSession, skip: int = 0, limit: int = 100):
+    """Get all games without relationships"""
+    result = await db.scalars(select(Game).offset(skip).limit(limit))
+    return result.all()
+
+async def get_game_with_participants(db: AsyncSession, game_id: int):
+    """Get game with participants and their player details"""
+    return await db.scalar(
+        select(Game)
+        .options(selectinload(Game.participants).selectinload(Participant.player))
+        .where(Game.game_id == game_id)
+    )
+
+async def get_game_full(db: AsyncSession, game_id: int):
+    """Get game with all relationships"""
+    return await db.scalar(
+        select(Game)
+        .options(
+            selectinload(Game.participants).selectinload(Participant.player),
+            selectinload(Game.rounds)
+        )
+        .where(Game.game_id == game_id)
+    )
+
+async def create_game(db: AsyncSession, game: GameCreate):
+    """Create a new game"""
+    db_game = Game(
+        started_at=game.started_at,
+        ended_at=game.ended_at,
+        playlist_id=game.playlist_id,
+        current_track_index=game.current_track_index,
+        all_time_dj_participant_id=game.all_time_dj_participant_id,
+        songs_per_round=game.songs_per_round if game.songs_per_round is not None else 10
+    )
+    db.add(db_game)
+    await db.commit()
+    await db.refresh(db_game)
+    return db_game
+
+async def update_game(db: AsyncSession, game_id: int, game: GameUpdate):
+    """Update a game"""
+    db_game = await db.get(Game, game_id)
+    if db_game:
+        update_data = game.model_dump(exclude_unset=True)
+        for key, value in update_data.items():
+            setattr(db_game, key, value)
+        await db.commit()
+        await db.refresh(db_game)
+    return db_game
+
+async def delete_game(db: AsyncSession, game_id: int):
+    """Delete a game (cascades to participants and rounds)"""
+    db_game = await db.get(Game, game_id)
+    if db_game:
+        await db.delete(db_game)
+        await db.commit()
+    return db_game
@@ -0,0 +1,88 @@
+# backend/methods/AsyncGameplaySettingsMethods.py
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..models.GameplaySettings import GameplaySettings
+from ..schemas.GameplaySettingsBase import GameplaySettingsBase, GameplaySettingsCreate, GameplaySettingsUpdate
+from ..services.SettingsSnapshot import settings_snapshot
+from .AsyncUpsertMethods import upsert
+from .GameplaySettingsMethods import _committed as _committed_sync
+
+async def _committed(key: str, value: Optional[str]):
+    """GameplaySettingsMethods._committed in a thread (it writes to the shared cache)"""
+    await asyncio.to_thread(_committed_sync, key, value)
+
+async def get_setting_by_key(db: AsyncSession, key: str):
+    """Get a setting by key"""
+    return await db.scalar(select(GameplaySettings).where(GameplaySettings.key == key))
+
+async def get_all_settings(db: AsyncSession, skip: int = 0, limit: int = 100):
+    """Get all settings"""
+    result = await db.scalars(select(GameplaySettings).offset(skip).limit(limit))
+    return result.all()
+
+async def get_settings_snapshot(db: AsyncSession,
+                                keys: Optional[List[str]] = None) -> Tuple[str, List[Dict[str, Any]]]:
+    """(version, settings) from the cached snapshot; only touches the DB when it is stale
+
+    Rows come back in key order, limited to `keys` when given (unknown keys are skipped).
+    """
+    version, rows = await settings_snapshot.get_async(db)
+    if keys is None:
+        return version, [rows[key] for key in sorted(rows)]
+    return version, [rows[key] for key in keys if key in rows]
+
+async def bulk_upsert_settings(db: AsyncSession, settings: List[GameplaySettingsBase]):
+    """Create or update several settings in one transaction.
+
+    One upsert per key, in key order so concurrent writers lock rows in the same
+    order; two writers adding the same new key cannot hit a duplicate-key error.
+    """
+    values = {setting.key: setting.value for setting in settings}
+    rows = {}
+    for key in sorted(values):
+        rows[key] = await upsert(db, GameplaySettings, {"key": key, "value": values[key]}, ["key"], ["value"])
+    for row in rows.values():
+        db.expunge(row)  # keep the returned values through the commit
+    await db.commit()
+    for key, value in values.items():
+        await _committed(key, value)
+    return [rows[key] for key in values]
+
+async def create_setting(db: AsyncSession, setting: GameplaySettingsCreate):
+    """Create a new setting"""
+    if await get_setting_by_key(db, setting.key):
+        raise ValueError(f"Setting with key '{setting.key}' already exists")
+
+    db_setting = GameplaySettings(key=setting.key, value=setting.value)
+    db.add(db_setting)
+    await db.commit()
+    await db.refresh(db_setting)
+    await _committed(db_setting.key, db_setting.value)
+    return db_setting
+
+async def update_setting(db: AsyncSession, key: str, setting: GameplaySettingsUpdate):
+    """Update a setting by key"""
+    db_setting = await get_setting_by_key(db, key)
+    if db_setting:
+        db_setting.value = setting.value
+        await db.commit()
+        await db.refresh(db_setting)
+        await _committed(key, db_setting.value)
+    return db_setting
+
+async def upsert_setting(db: AsyncSession, key: str, value: str):
+    """Create or update a setting (one INSERT ... ON CONFLICT/ON DUPLICATE KEY statement)"""
+    db_setting = await upsert(db, GameplaySettings, {"key": key, "value": value}, ["key"], ["value"], commit=True)
+    await _committed(key, value)
+    return db_setting
+
+async def delete_setting(db: AsyncSession, key: str):
+    """Delete a setting by key"""
+    db_setting = await get_setting_by_key(db, key)
+    if db_setting:
+        await db.delete(db_setting)
+        await db.commit()
+        await _committed(key, None)
+    return db_setting
@@ -0,0 +1,74 @@
+# backend/methods/AsyncParticipantMethods.py
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from ..models.Participant import Participant
+from ..schemas.ParticipantBase import ParticipantCreate, ParticipantUpdate
+
+async def get_participant(db: AsyncSession, participant_id: int):
+    """Get basic participant"""
+    return await db.get(Participant, participant_id)
+
+async def get_participants(db: AsyncSession, skip: int = 0, limit: int = 100):
+    """Get all participants"""
+    result = await db.scalars(select(Participant).offset(skip).limit(limit))
+    return result.all()
+
+async def get_participants_by_game(db: AsyncSession, game_id: int):
+    """Get all participants for a game with player details"""
+    result = await db.scalars(
+        select(Participant)
+        .options(joinedload(Participant.player))
+        .where(Participant.game_id == game_id)
+        .order_by(Participant.seat_number)
+    )
+    return result.all()
+
+async def get_participant_with_player(db: AsyncSession, participant_id: int):
+    """Get participant with player details"""
+    return await db.scalar(
+        select(Participant)
+        .options(joinedload(Participant.player))
+        .where(Participant.participant_id == participant_id)
+    )
+
+async def create_participant(db: AsyncSession, participant: ParticipantCreate):
+    """Create a new participant"""
+    # Check if player already participating in this game
+    existing = await db.scalar(
+        select(Participant).where(
+            Participant.game_id == participant.game_id,
+            Participant.player_id == participant.player_id
+        )
+    )
+    if existing:
+        return existing  # Return existing instead of error
+
+    db_participant = Participant(
+        game_id=participant.game_id,
+        player_id=participant.player_id,
+        seat_number=participant.seat_number
+    )
+    db.add(db_participant)
+    await db.commit()
+    await db.refresh(db_participant)
+    return db_participant
+
+async def update_participant(db: AsyncSession, participant_id: int, participant: ParticipantUpdate):
+    """Update a participant"""
+    db_participant = await db.get(Participant, participant_id)
+    if db_participant:
+        update_data = participant.model_dump(exclude_unset=True)
+        for key, value in update_data.items():
+            setattr(db_participant, key, value)
+        await db.commit()
+        await db.refresh(db_participant)
+    return db_participant
+
+async def delete_participant(db: AsyncSession, participant_id: int):
+    """Delete a participant"""
+    db_participant = await db.get(Participant, participant_id)
+    if db_participant:
+        await db.delete(db_participant)
+        await db.commit()
+    return db_participant
@@ -0,0 +1,40 @@
+# backend/methods/AsyncPlayerMethods.py
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..models.Player import Player
+from ..schemas.PlayerBase import PlayerCreate, PlayerUpdate
+
+async def get_player(db: AsyncSession, player_id: int):
+    """Get a single player"""
+    return await db.get(Player, player_id)
+
+async def get_players(db: AsyncSession, skip: int = 0, limit: int = 100):
+    """Get all players"""
+    result = await db.scalars(select(Player).offset(skip).limit(limit))
+    return result.all()
+
+async def create_player(db: AsyncSession, player: PlayerCreate):
+    """Create a new player"""
+    db_player = Player(name=player.name, image_url=player.image_url)
+    db.add(db_player)
+    await db.commit()
+    await db.refresh(db_player)
+    return db_player
+
+async def update_player(db: AsyncSession, player_id: int, player: PlayerUpdate):
+    """Update a player's name and image"""
+    db_player = await db.get(Player, player_id)
+    if db_player:
+        db_player.name = player.name
+        db_player.image_url = player.image_url
+        await db.commit()
+        await db.refresh(db_player)
+    return db_player
+
+async def delete_player(db: AsyncSession, player_id: int):
+    """Delete a player (and, by cascade, their participations)"""
+    db_player = await db.get(Player, player_id)
+    if db_player:
+        await db.delete(db_player)
+        await db.commit()
+    return db_player
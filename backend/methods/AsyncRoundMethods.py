@@ -0,0 +1,106 @@
+# backend/methods/AsyncRoundMethods.py
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from ..models.Round import Round
+from ..models.RoundTeam import RoundTeam
+from ..models.RoundTeamPlayer import RoundTeamPlayer
+from ..models.Participant import Participant
+from ..models.RoundSonglist import RoundSonglist
+from ..models.TrackInfo import TrackInfo
+from ..models.Enums import Role
+from ..schemas.RoundBase import RoundCreate, RoundUpdate
+
+async def get_round(db: AsyncSession, round_id: int):
+    """Get basic round"""
+    return await db.get(Round, round_id)
+
+async def get_rounds(db: AsyncSession, skip: int = 0, limit: int = 100):
+    """Get all rounds"""
+    result = await db.scalars(select(Round).offset(skip).limit(limit))
+    return result.all()
+
+async def get_rounds_by_game(db: AsyncSession, game_id: int):
+    """Get all rounds for a game"""
+    result = await db.scalars(
+        select(Round)
+        .where(Round.game_id == game_id)
+        .order_by(Round.round_number)
+    )
+    return result.all()
+
+async def get_active_round_for_game(db: AsyncSession, game_id: int):
+    """Get the active (incomplete) round for a game, if any"""
+    return await db.scalar(
+        select(Round)
+        .where(Round.game_id == game_id, Round.is_complete == False)
+        .limit(1)
+    )
+
+async def get_round_team_by_role(db: AsyncSession, round_id: int, role: Role):
+    """Get the team playing a given role in a round"""
+    return await db.scalar(
+        select(RoundTeam)
+        .where(RoundTeam.round_id == round_id, RoundTeam.role == role)
+        .limit(1)
+    )
+
+async def get_round_with_teams(db: AsyncSession, round_id: int):
+    """Get round with teams and their players"""
+    return await db.scalar(
+        select(Round)
+        .options(
+            selectinload(Round.round_teams)
+            .selectinload(RoundTeam.round_team_players)
+        )
+        .where(Round.round_id == round_id)
+    )
+
+async def get_round_with_details(db: AsyncSession, round_id: int):
+    """Get round with all details (teams and songs with full info)"""
+    return await db.scalar(
+        select(Round)
+        .options(
+            selectinload(Round.round_teams)
+            .selectinload(RoundTeam.round_team_players)
+            .joinedload(RoundTeamPlayer.participant)
+            .joinedload(Participant.player),
+            selectinload(Round.round_songlists)
+            .joinedload(RoundSonglist.song),
+            selectinload(Round.round_songlists)
+            .joinedload(RoundSonglist.track_info)
+            .joinedload(TrackInfo.artist)
+        )
+        .where(Round.round_id == round_id)
+    )
+
+async def create_round(db: AsyncSession, round: RoundCreate):
+    """Create a new round"""
+    db_round = Round(
+        game_id=round.game_id,
+        round_number=round.round_number,
+        is_complete=False
+    )
+    db.add(db_round)
+    await db.commit()
+    await db.refresh(db_round)
+    return db_round
+
+async def update_round(db: AsyncSession, round_id: int, round: RoundUpdate):
+    """Update a round"""
+    db_round = await db.get(Round, round_id)
+    if db_round:
+        update_data = round.model_dump(exclude_unset=True)
+        for key, value in update_data.items():
+            setattr(db_round, key, value)
+        await db.commit()
+        await db.refresh(db_round)
+    return db_round
+
+async def delete_round(db: AsyncSession, round_id: int):
+    """Delete a round"""
+    db_round = await db.get(Round, round_id)
+    if db_round:
+        await db.delete(db_round)
+        await db.commit()
+    return db_round
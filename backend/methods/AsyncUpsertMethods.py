@@ -0,0 +1,18 @@
+# backend/methods/AsyncUpsertMethods.py
+from typing import Any, Dict, Sequence, Type
+from sqlalchemy.ext.asyncio import AsyncSession
+from .UpsertMethods import returns_row, upsert_statement
+
+async def upsert(db: AsyncSession, model: Type, values: Dict[str, Any], conflict_columns: Sequence[str],
+                 update_columns: Sequence[str] = (), commit: bool = False):
+    """Async UpsertMethods.upsert: the same single statement, awaited"""
+    dialect = db.get_bind().dialect.name
+    stmt = upsert_statement(dialect, model, values, conflict_columns, update_columns)
+    if returns_row(dialect):
+        row = (await db.execute(stmt, execution_options={"populate_existing": True})).scalar_one()
+    else:
+        row = await db.get(model, (await db.execute(stmt)).lastrowid, populate_existing=True)
+    if commit:
+        db.expunge(row)
+        await db.commit()
+    return row
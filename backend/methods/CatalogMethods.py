@@ -0,0 +1,106 @@
+# backend/methods/CatalogMethods.py
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from ..models.Song import Song
+from ..models.Artist import Artist
+from ..models.TrackInfo import TrackInfo
+from .UpsertMethods import upsert_many
+
+# Tracks per transaction: three multi-row upserts of at most this many rows each,
+# well under SQLite's and MySQL's bind parameter limits
+CHUNK_SIZE = 500
+
+def new_result() -> Dict[str, Any]:
+    """Running totals and Spotify id -> row id maps of an ingestion"""
+    return {"tracks": 0, "skipped": 0, "songs": {}, "artists": {}, "track_infos": {}}
+
+def parse_track(payload: Any) -> Optional[Tuple[Dict[str, str], Dict[str, str]]]:
+    """(song values, artist values) of a Spotify track, or None if it can't be catalogued.
+
+    Accepts a track object or a playlist item wrapping one under "track". Local
+    files and unavailable tracks have no Spotify id and are skipped. As with
+    record_played_track, the song is linked to its first artist.
+    """
+    if isinstance(payload, dict) and isinstance(payload.get("track"), dict):
+        payload = payload["track"]
+    try:
+        artist = payload["artists"][0]
+        song = {"spotify_id": payload["id"], "title": payload["name"]}
+        artist = {"spotify_id": artist["id"], "name": artist["name"]}
+    except (KeyError, IndexError, TypeError):
+        return None
+    if not all(song.values()) or not all(artist.values()):
+        return None
+    return song, artist
+
+def _ids_by_spotify_id(db: Session, model, spotify_ids: Iterable[str]) -> Dict[str, int]:
+    pk = model.__table__.primary_key.columns.values()[0]
+    rows = db.execute(select(model.spotify_id, pk).where(model.spotify_id.in_(list(spotify_ids))))
+    return {spotify_id: row_id for spotify_id, row_id in rows}
+
+def ingest_chunk(db: Session, tracks: List[Any], result: Dict[str, Any]) -> Dict[str, Any]:
+    """Upsert one chunk of tracks in a single transaction and add it to `result`.
+
+    Three multi-row upserts (artists, songs, track infos) and three SELECTs to map
+    the rows back to their ids, whatever the chunk size.
+    """
+    songs: Dict[str, Dict[str, str]] = {}
+    artists: Dict[str, Dict[str, str]] = {}
+    links: Dict[str, str] = {}  # song spotify id -> artist spotify id
+    for payload in tracks:
+        parsed = parse_track(payload)
+        if parsed is None:
+            result["skipped"] += 1
+            continue
+        song, artist = parsed
+        # Later duplicates win, as they would with one request per track
+        songs[song["spotify_id"]] = song
+        artists[artist["spotify_id"]] = artist
+        links[song["spotify_id"]] = artist["spotify_id"]
+        result["tracks"] += 1
+    if not songs:
+        return result
+
+    upsert_many(db, Artist, list(artists.values()), ["spotify_id"], ["name"])
+    upsert_many(db, Song, list(songs.values()), ["spotify_id"], ["title"])
+    artist_ids = _ids_by_spotify_id(db, Artist, artists)
+    song_ids = _ids_by_spotify_id(db, Song, songs)
+
+    pairs = {song_ids[song]: artist_ids[artist] for song, artist in links.items()}
+    upsert_many(db, TrackInfo, [{"song_id": song_id, "artist_id": artist_id}
+                                for song_id, artist_id in pairs.items()], ["song_id", "artist_id"])
+    track_info_ids = {
+        (song_id, artist_id): track_info_id
+        for track_info_id, song_id, artist_id in db.execute(
+            select(TrackInfo.track_info_id, TrackInfo.song_id, TrackInfo.artist_id)
+            .where(TrackInfo.song_id.in_(list(pairs)))
+        )
+    }
+    db.commit()
+
+    result["artists"].update(artist_ids)
+    result["songs"].update(song_ids)
+    result["track_infos"].update(
+        (song, track_info_ids[(song_ids[song], artist_ids[artist])]) for song, artist in links.items()
+    )
+    return result
+
+def ingest_tracks(db: Session, tracks: Iterable[Any], chunk_size: int = CHUNK_SIZE,
+                  result: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Catalog Spotify tracks in transactions of `chunk_size` tracks.
+
+    Returns how many tracks were catalogued and skipped, plus the artist, song and
+    track info ids keyed by Spotify id (track infos by the song's Spotify id). A
+    failing chunk is not committed; the chunks before it are.
+    """
+    result = result if result is not None else new_result()
+    chunk: List[Any] = []
+    for payload in tracks:
+        chunk.append(payload)
+        if len(chunk) >= chunk_size:
+            ingest_chunk(db, chunk, result)
+            chunk = []
+    if chunk:
+        ingest_chunk(db, chunk, result)
+    return result
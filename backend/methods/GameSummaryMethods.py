@@ -0,0 +1,115 @@
+# backend/methods/GameSummaryMethods.py
+import base64
+from datetime import datetime
+from typing import Optional, Tuple
+from sqlalchemy import DateTime, bindparam, func, select, tuple_
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import Session
+from ..models.Game import Game
+from ..models.GameScoreTotal import GameScoreTotal
+from ..models.Participant import Participant
+from ..models.Player import Player
+from ..models.Round import Round
+
+# SQLite stores created_at as CURRENT_TIMESTAMP text, without microseconds; a
+# cursor bound in the same form compares equal to it and ties break on game_id
+CURSOR_TIMESTAMP = DateTime(timezone=True).with_variant(sqlite.DATETIME(truncate_microseconds=True), "sqlite")
+
+def encode_cursor(created_at: datetime, game_id: int) -> str:
+    """Opaque position after the game (created_at, game_id)"""
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{game_id}".encode()).decode()
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """(created_at, game_id) of an encode_cursor string; ValueError if it is not one"""
+    try:
+        created_at, game_id = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(game_id)
+    except ValueError:
+        raise ValueError("Invalid cursor")
+
+def _winner(participants):
+    """Highest total, ties to the earliest participant -- as calculateGameWinner picked it"""
+    if not participants:
+        return None
+    return min(participants, key=lambda p: (-p["total_score"], p["participant_id"]))["player"]
+
+def page_query(limit: int, cursor: Optional[str] = None):
+    """game_id of the `limit` games after `cursor`, newest first: a range seek on ix_game_created_at"""
+    page = select(Game.game_id)\
+        .order_by(Game.created_at.desc(), Game.game_id.desc())\
+        .limit(limit)
+    if cursor is not None:
+        created_at, game_id = decode_cursor(cursor)
+        page = page.where(tuple_(Game.created_at, Game.game_id)
+                          < tuple_(bindparam("cursor_created_at", created_at, type_=CURSOR_TIMESTAMP), game_id))
+    return page
+
+def get_game_summaries(db: Session, limit: int = 20, cursor: Optional[str] = None):
+    """One page of game history, newest first, as (summaries, next_cursor).
+
+    Pages are keyset-paginated on (created_at, game_id) over ix_game_created_at:
+    the cursor names the last game of the previous page and the next page is a
+    range seek past it, so deep pages cost the same as the first. The page, its
+    participants with their final scores (the maintained game_score_totals) and
+    the round counts come from one statement. next_cursor is None on the last page.
+    """
+    page = page_query(limit + 1, cursor).subquery()
+
+    rounds = select(func.count()).select_from(Round)\
+        .where(Round.game_id == Game.game_id).scalar_subquery()
+    rounds_played = select(func.count()).select_from(Round)\
+        .where(Round.game_id == Game.game_id, Round.is_complete == True).scalar_subquery()
+    # Plain columns: one page is ~limit x participants rows, and entities cost more to build than to fetch
+    rows = db.execute(
+        select(Game.game_id, Game.playlist_id, Game.songs_per_round, Game.created_at, Game.started_at,
+               Game.ended_at, rounds.label("rounds"), rounds_played.label("rounds_played"),
+               Participant.participant_id, Participant.seat_number, Player.player_id, Player.name,
+               Player.image_url, Player.created_at.label("player_created_at"),
+               Player.updated_at.label("player_updated_at"), GameScoreTotal.total_score)
+        .join(page, page.c.game_id == Game.game_id)
+        .outerjoin(Participant, Participant.game_id == Game.game_id)
+        .outerjoin(Player, Player.player_id == Participant.player_id)
+        .outerjoin(GameScoreTotal, GameScoreTotal.participant_id == Participant.participant_id)
+        .order_by(Game.created_at.desc(), Game.game_id.desc(), Participant.seat_number)
+    ).all()
+
+    summaries = {}
+    for row in rows:
+        summary = summaries.get(row.game_id)
+        if summary is None:
+            duration = None
+            if row.started_at is not None and row.ended_at is not None:
+                duration = int((row.ended_at - row.started_at).total_seconds())
+            summary = summaries[row.game_id] = {
+                "game_id": row.game_id,
+                "playlist_id": row.playlist_id,
+                "songs_per_round": row.songs_per_round,
+                "created_at": row.created_at,
+                "started_at": row.started_at,
+                "ended_at": row.ended_at,
+                "duration_seconds": duration,
+                "rounds": row.rounds,
+                "rounds_played": row.rounds_played,
+                "participants": [],
+            }
+        if row.participant_id is not None:
+            player = None
+            if row.player_id is not None:
+                player = {"player_id": row.player_id, "name": row.name, "image_url": row.image_url,
+                          "created_at": row.player_created_at, "updated_at": row.player_updated_at}
+            # A participant who was never on a team has no totals row
+            summary["participants"].append({
+                "participant_id": row.participant_id,
+                "seat_number": row.seat_number,
+                "player": player,
+                "total_score": row.total_score or 0,
+            })
+
+    games = list(summaries.values())
+    next_cursor = None
+    if len(games) > limit:
+        games = games[:limit]
+        next_cursor = encode_cursor(games[-1]["created_at"], games[-1]["game_id"])
+    for summary in games:
+        summary["winner"] = _winner(summary["participants"])
+    return games, next_cursor
@@ -0,0 +1,121 @@
+# backend/methods/GameTrackDeckMethods.py
+import random
+import struct
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+from ..models.Game import Game
+from ..models.GameTrackDeck import GameTrackDeck
+from .PlaylistMirrorMethods import get_positions
+
+SLOT = struct.Struct("<I")
+
+def pack_positions(positions: List[int]) -> bytes:
+    """Pack playlist positions as little-endian uint32s"""
+    return struct.pack(f"<{len(positions)}I", *positions)
+
+def shuffled(positions: List[int], seed: int) -> List[int]:
+    """Deterministic permutation of `positions` for a seed"""
+    deck = list(positions)
+    random.Random(seed).shuffle(deck)
+    return deck
+
+def position_at(deck: GameTrackDeck, index: int) -> int:
+    """O(1) lookup of the playlist position in slot `index`"""
+    return SLOT.unpack_from(deck.positions, index * SLOT.size)[0]
+
+def get_deck(db: Session, game_id: int):
+    """Get a game's track deck"""
+    return db.query(GameTrackDeck).filter(GameTrackDeck.game_id == game_id).first()
+
+def create_deck(db: Session, game_id: int, playlist_id: str, positions: List[int],
+                seed: Optional[int] = None):
+    """Shuffle `positions` into a new deck for the game and rewind its track index"""
+    if seed is None:
+        seed = random.getrandbits(52)
+    db_deck = get_deck(db, game_id)
+    if db_deck is None:
+        db_deck = GameTrackDeck(game_id=game_id)
+        db.add(db_deck)
+    db_deck.playlist_id = playlist_id
+    db_deck.seed = seed
+    db_deck.cycle = 0
+    db_deck.size = len(positions)
+    db_deck.positions = pack_positions(shuffled(positions, seed))
+    db.execute(update(Game).where(Game.game_id == game_id).values(current_track_index=0))
+    db.commit()
+    db.refresh(db_deck)
+    return db_deck
+
+def draw_next_position(db: Session, game_id: int) -> Optional[Tuple[int, int]]:
+    """Draw the next playlist position from the game's deck.
+
+    Returns (index, position), or None if the game has no deck. The deck row is
+    locked and current_track_index advanced with a conditional UPDATE in the same
+    transaction, so concurrent clients never draw the same slot. When every slot
+    has been played the deck is reshuffled with a new seed and starts over.
+    """
+    db_deck = db.query(GameTrackDeck)\
+        .filter(GameTrackDeck.game_id == game_id)\
+        .with_for_update()\
+        .first()
+    if db_deck is None or db_deck.size == 0:
+        db.rollback()
+        return None
+
+    advanced = db.execute(
+        update(Game)
+        .where(Game.game_id == game_id, Game.current_track_index < db_deck.size)
+        .values(current_track_index=Game.current_track_index + 1)
+    )
+    if advanced.rowcount == 0:
+        # Deck exhausted: reshuffle the same positions for the next cycle
+        positions = [position_at(db_deck, i) for i in range(db_deck.size)]
+        db_deck.seed = random.getrandbits(52)
+        db_deck.cycle += 1
+        db_deck.positions = pack_positions(shuffled(positions, db_deck.seed))
+        db.execute(update(Game).where(Game.game_id == game_id).values(current_track_index=1))
+
+    index = db.query(Game.current_track_index).filter(Game.game_id == game_id).scalar() - 1
+    position = position_at(db_deck, index)
+    db.commit()
+    return index, position
+
+def rebuild_decks(db: Session, playlist_id: str, old_tracks: Dict[int, str],
+                  tracks: List[Dict[str, Any]]) -> None:
+    """Re-deal every deck of `playlist_id` against a new mirror without repeating a drawn track.
+
+    `old_tracks` maps the positions the decks were dealt from to track IDs (empty if
+    the playlist was not mirrored yet: the positions are then read against the new
+    mirror). Tracks already drawn this cycle keep the first slots and the game's
+    track index stays just past them; the rest of the new mirror is shuffled in
+    after. Runs inside the caller's transaction, which commits it.
+    """
+    new_tracks = {track["position"]: track["spotify_track_id"] for track in tracks}
+    dealt_from = old_tracks or new_tracks
+    decks = db.query(GameTrackDeck)\
+        .filter(GameTrackDeck.playlist_id == playlist_id)\
+        .with_for_update()\
+        .all()
+    for db_deck in decks:
+        index = db.query(Game.current_track_index).filter(Game.game_id == db_deck.game_id).scalar() or 0
+        drawn = {dealt_from.get(position_at(db_deck, i)) for i in range(min(index, db_deck.size))}
+        played = [track["position"] for track in tracks if track["spotify_track_id"] in drawn]
+        remaining = [track["position"] for track in tracks if track["spotify_track_id"] not in drawn]
+        db_deck.seed = random.getrandbits(52)
+        db_deck.size = len(played) + len(remaining)
+        db_deck.positions = pack_positions(played + shuffled(remaining, db_deck.seed))
+        db.execute(update(Game).where(Game.game_id == db_deck.game_id).values(current_track_index=len(played)))
+
+def draw_for_playlist(db: Session, game_id: int, playlist_id: str) -> Optional[Tuple[int, int]]:
+    """Draw from the game's deck for `playlist_id`, dealing a new one from the playlist mirror if needed.
+
+    Returns None when there is no deck for the playlist and it has not been mirrored.
+    """
+    db_deck = get_deck(db, game_id)
+    if db_deck is None or db_deck.playlist_id != playlist_id:
+        positions = get_positions(db, playlist_id)
+        if not positions:
+            return None
+        create_deck(db, game_id, playlist_id, positions)
+    return draw_next_position(db, game_id)
@@ -1,7 +1,16 @@
 # backend/methods/GameplaySettingsMethods.py
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
 from ..models.GameplaySettings import GameplaySettings
-from ..schemas.GameplaySettingsBase import GameplaySettingsCreate, GameplaySettingsUpdate
+from ..schemas.GameplaySettingsBase import GameplaySettingsBase, GameplaySettingsCreate, GameplaySettingsUpdate
+from ..services.SpotifyTokenStore import spotify_token_store
+from ..services.SettingsSnapshot import settings_snapshot
+from .UpsertMethods import upsert
+
+def _committed(key: str, value: Optional[str]):
+    """Keep the cached copies in step with a committed write (value None = deleted)"""
+    spotify_token_store.apply(key, value)
+    settings_snapshot.invalidate()
 
 def get_setting_by_key(db: Session, key: str):
     """Get a setting by key"""
@@ -11,6 +20,35 @@ def get_all_settings(db: Session, skip: int = 0, limit: int = 100):
     """Get all settings"""
     return db.query(GameplaySettings).offset(skip).limit(limit).all()
 
+def get_settings_snapshot(session_factory: Callable[[], Session],
+                          keys: Optional[List[str]] = None) -> Tuple[str, List[Dict[str, Any]]]:
+    """(version, settings) from the cached snapshot; only touches the DB when it is stale
+
+    Rows come back in key order, limited to `keys` when given (unknown keys are skipped).
+    """
+    version, rows = settings_snapshot.get(session_factory)
+    if keys is None:
+        return version, [rows[key] for key in sorted(rows)]
+    return version, [rows[key] for key in keys if key in rows]
+
+def bulk_upsert_settings(db: Session, settings: List[GameplaySettingsBase]):
+    """Create or update several settings in one transaction.
+
+    One upsert per key, in key order so concurrent writers lock rows in the same
+    order; two writers adding the same new key cannot hit a duplicate-key error.
+    """
+    values = {setting.key: setting.value for setting in settings}
+    rows = {
+        key: upsert(db, GameplaySettings, {"key": key, "value": values[key]}, ["key"], ["value"])
+        for key in sorted(values)
+    }
+    for row in rows.values():
+        db.expunge(row)  # keep the returned values through the commit
+    db.commit()
+    for key, value in values.items():
+        _committed(key, value)
+    return [rows[key] for key in values]
+
 def create_setting(db: Session, setting: GameplaySettingsCreate):
     """Create a new setting"""
     # Check if key already exists
@@ -25,6 +63,7 @@ def create_setting(db: Session, setting: GameplaySettingsCreate):
     db.add(db_setting)
     db.commit()
     db.refresh(db_setting)
+    _committed(db_setting.key, db_setting.value)
     return db_setting
 
 def update_setting(db: Session, key: str, setting: GameplaySettingsUpdate):
@@ -34,18 +73,13 @@ def update_setting(db: Session, key: str, setting: GameplaySettingsUpdate):
         db_setting.value = setting.value
         db.commit()
         db.refresh(db_setting)
+        _committed(key, db_setting.value)
     return db_setting
 
 def upsert_setting(db: Session, key: str, value: str):
-    """Create or update a setting"""
-    db_setting = get_setting_by_key(db, key)
-    if db_setting:
-        db_setting.value = value
-    else:
-        db_setting = GameplaySettings(key=key, value=value)
-        db.add(db_setting)
-    db.commit()
-    db.refresh(db_setting)
+    """Create or update a setting (one INSERT ... ON CONFLICT/ON DUPLICATE KEY statement)"""
+    db_setting = upsert(db, GameplaySettings, {"key": key, "value": value}, ["key"], ["value"], commit=True)
+    _committed(key, value)
     return db_setting
 
 def delete_setting(db: Session, key: str):
@@ -54,4 +88,5 @@ def delete_setting(db: Session, key: str):
     if db_setting:
         db.delete(db_setting)
         db.commit()
+        _committed(key, None)
     return db_setting
\ No newline at end of file
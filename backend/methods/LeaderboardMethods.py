@@ -0,0 +1,63 @@
+# backend/methods/LeaderboardMethods.py
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session
+from ..models.Game import Game
+from ..models.GameScoreTotal import GameScoreTotal
+from ..models.Player import Player
+from ..models.PlayerScoreTotal import PlayerScoreTotal
+from ..models.RoundSonglist import RoundSonglist
+
+def song_points(songlist=RoundSonglist):
+    """Points a scored song is worth to the team it is credited to.
+
+    The same rule as calculateTeamScore on the frontend: one point each for the
+    artist, the title and the movie bonus. A steal moves the song to the stealer
+    team (round_team_id), so score_type needs no term of its own.
+    """
+    return (
+        case((songlist.correct_artist_guess == True, 1), else_=0)
+        + case((songlist.correct_song_title_guess == True, 1), else_=0)
+        + case((songlist.bonus_correct_movie_guess == True, 1), else_=0)
+    )
+
+def game_played_at():
+    """When a game was played: started_at, or created_at if it never started"""
+    return func.coalesce(Game.started_at, Game.created_at)
+
+def get_leaderboard(db: Session, limit: int = 10, since: Optional[datetime] = None,
+                    until: Optional[datetime] = None, min_games: int = 1):
+    """Top players by total score, as (player, total_score, games_played) rows.
+
+    Reads the totals ScoreTotalsMethods maintains: all time, the top N come
+    straight off the player_score_totals score index; with a date range, the
+    per-game totals of the games in range are summed. Players without points are
+    left out, as on the leaderboard page.
+    """
+    if since is None and until is None:
+        totals = select(PlayerScoreTotal.player_id, PlayerScoreTotal.total_score, PlayerScoreTotal.games_played)\
+            .where(PlayerScoreTotal.total_score > 0)
+        if min_games > 1:
+            totals = totals.where(PlayerScoreTotal.games_played >= min_games)
+    else:
+        total_score = func.sum(GameScoreTotal.total_score).label("total_score")
+        games_played = func.count().label("games_played")
+        totals = select(GameScoreTotal.player_id, total_score, games_played)\
+            .join(Game, Game.game_id == GameScoreTotal.game_id)\
+            .group_by(GameScoreTotal.player_id)\
+            .having(total_score > 0)
+        if since is not None:
+            totals = totals.where(game_played_at() >= since)
+        if until is not None:
+            totals = totals.where(game_played_at() < until)
+        if min_games > 1:
+            totals = totals.having(games_played >= min_games)
+    totals = totals.subquery()
+
+    return db.execute(
+        select(Player, totals.c.total_score, totals.c.games_played)
+        .join(totals, totals.c.player_id == Player.player_id)
+        .order_by(totals.c.total_score.desc(), Player.player_id)
+        .limit(limit)
+    ).all()
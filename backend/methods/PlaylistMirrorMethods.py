@@ -0,0 +1,115 @@
+# backend/methods/PlaylistMirrorMethods.py
+import random
+from datetime import datetime
+from typing import List, Dict, Any
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from ..models.PlaylistMirror import PlaylistMirror
+from ..models.PlaylistMirrorTrack import PlaylistMirrorTrack
+
+def get_mirror(db: Session, playlist_id: str):
+    """Get the sync state of a mirrored playlist"""
+    return db.query(PlaylistMirror).filter(PlaylistMirror.playlist_id == playlist_id).first()
+
+def get_track_count(db: Session, playlist_id: str) -> int:
+    """Number of playable tracks in the mirror (0 if never synced)"""
+    mirror = get_mirror(db, playlist_id)
+    return mirror.track_count if mirror else 0
+
+def get_tracks(db: Session, playlist_id: str, skip: int = 0, limit: int = 100):
+    """Get mirrored tracks in playlist order"""
+    return db.query(PlaylistMirrorTrack)\
+        .filter(PlaylistMirrorTrack.playlist_id == playlist_id)\
+        .order_by(PlaylistMirrorTrack.track_index)\
+        .offset(skip)\
+        .limit(limit)\
+        .all()
+
+def get_positions(db: Session, playlist_id: str) -> List[int]:
+    """Playlist positions of every playable mirrored track"""
+    rows = db.query(PlaylistMirrorTrack.position)\
+        .filter(PlaylistMirrorTrack.playlist_id == playlist_id)\
+        .order_by(PlaylistMirrorTrack.track_index)\
+        .all()
+    return [row.position for row in rows]
+
+def get_track_by_index(db: Session, playlist_id: str, track_index: int):
+    """Get the n-th playable track of the mirror"""
+    return db.query(PlaylistMirrorTrack)\
+        .filter(
+            PlaylistMirrorTrack.playlist_id == playlist_id,
+            PlaylistMirrorTrack.track_index == track_index
+        )\
+        .first()
+
+def get_track_at_position(db: Session, playlist_id: str, position: int):
+    """Get the track at a Spotify playlist position"""
+    return db.query(PlaylistMirrorTrack)\
+        .filter(
+            PlaylistMirrorTrack.playlist_id == playlist_id,
+            PlaylistMirrorTrack.position == position
+        )\
+        .first()
+
+def get_track_by_spotify_id(db: Session, playlist_id: str, spotify_track_id: str):
+    """Find a track in the mirror by its Spotify ID"""
+    return db.query(PlaylistMirrorTrack)\
+        .filter(
+            PlaylistMirrorTrack.playlist_id == playlist_id,
+            PlaylistMirrorTrack.spotify_track_id == spotify_track_id
+        )\
+        .first()
+
+def get_random_tracks(db: Session, playlist_id: str, count: int = 1):
+    """Pick distinct random tracks via indexed lookups on the dense track_index"""
+    total = get_track_count(db, playlist_id)
+    if total == 0:
+        return []
+    indexes = random.sample(range(total), min(count, total))
+    tracks = db.query(PlaylistMirrorTrack)\
+        .filter(
+            PlaylistMirrorTrack.playlist_id == playlist_id,
+            PlaylistMirrorTrack.track_index.in_(indexes)
+        )\
+        .all()
+    order = {index: i for i, index in enumerate(indexes)}
+    return sorted(tracks, key=lambda track: order[track.track_index])
+
+def replace_tracks(db: Session, playlist_id: str, snapshot_id: str, name: str,
+                   tracks: List[Dict[str, Any]]):
+    """Swap in a new snapshot of the playlist in a single transaction.
+
+    Decks dealt from the old snapshot are re-dealt from the new one in the same
+    transaction, so games keep their place and never repeat a drawn track.
+    """
+    from .GameTrackDeckMethods import rebuild_decks  # it imports this module
+
+    db_mirror = get_mirror(db, playlist_id)
+    if db_mirror is None:
+        db_mirror = PlaylistMirror(playlist_id=playlist_id)
+        db.add(db_mirror)
+
+    old_tracks = dict(
+        db.query(PlaylistMirrorTrack.position, PlaylistMirrorTrack.spotify_track_id)
+        .filter(PlaylistMirrorTrack.playlist_id == playlist_id)
+        .all()
+    )
+    db.query(PlaylistMirrorTrack)\
+        .filter(PlaylistMirrorTrack.playlist_id == playlist_id)\
+        .delete(synchronize_session=False)
+    db.flush()
+    if tracks:
+        db.execute(
+            insert(PlaylistMirrorTrack),
+            [{**track, "playlist_id": playlist_id, "track_index": i} for i, track in enumerate(tracks)]
+        )
+
+    rebuild_decks(db, playlist_id, old_tracks, tracks)
+
+    db_mirror.snapshot_id = snapshot_id
+    db_mirror.name = name
+    db_mirror.track_count = len(tracks)
+    db_mirror.synced_at = datetime.now()
+    db.commit()
+    db.refresh(db_mirror)
+    return db_mirror
@@ -1,10 +1,14 @@
+from sqlalchemy import insert
 from sqlalchemy.orm import Session, joinedload, selectinload
 from ..models.Round import Round
 from ..models.RoundTeam import RoundTeam
+from ..models.RoundTeamPlayer import RoundTeamPlayer
+from ..models.Participant import Participant
 from ..models.RoundSonglist import RoundSonglist
 from ..models.TrackInfo import TrackInfo
 from ..models.Artist import Artist
-from ..schemas.RoundBase import RoundCreate, RoundUpdate
+from ..models.Enums import Role
+from ..schemas.RoundBase import RoundCreate, RoundSetup, RoundUpdate
 
 def get_round(db: Session, round_id: int):
     """Get basic round"""
@@ -27,6 +31,12 @@ def get_active_round_for_game(db: Session, game_id: int):
         .filter(Round.game_id == game_id, Round.is_complete == False)\
         .first()
 
+def get_round_team_by_role(db: Session, round_id: int, role: Role):
+    """Get the team playing a given role in a round"""
+    return db.query(RoundTeam)\
+        .filter(RoundTeam.round_id == round_id, RoundTeam.role == role)\
+        .first()
+
 def get_round_with_teams(db: Session, round_id: int):
     """Get round with teams and their players"""
     return db.query(Round)\
@@ -42,7 +52,9 @@ def get_round_with_details(db: Session, round_id: int):
     return db.query(Round)\
         .options(
             selectinload(Round.round_teams)
-            .selectinload(RoundTeam.round_team_players),
+            .selectinload(RoundTeam.round_team_players)
+            .joinedload(RoundTeamPlayer.participant)
+            .joinedload(Participant.player),
             selectinload(Round.round_songlists)
             .joinedload(RoundSonglist.song),
             selectinload(Round.round_songlists)
@@ -64,6 +76,52 @@ def create_round(db: Session, round: RoundCreate):
     db.refresh(db_round)
     return db_round
 
+def setup_round(db: Session, setup: RoundSetup):
+    """Create a round with its teams and team players in one transaction.
+
+    Raises ValueError if a role appears twice, or a participant is not part of the
+    game or is on two teams; nothing is written in that case.
+    """
+    roles = [team.role for team in setup.teams]
+    if len(roles) != len(set(roles)):
+        raise ValueError("Each role can only have one team per round")
+    participant_ids = [participant_id for team in setup.teams for participant_id in team.participant_ids]
+    if len(participant_ids) != len(set(participant_ids)):
+        raise ValueError("A participant can only be on one team per round")
+    in_game = {
+        participant_id for (participant_id,) in db.query(Participant.participant_id).filter(
+            Participant.game_id == setup.game_id,
+            Participant.participant_id.in_(participant_ids)
+        )
+    }
+    missing = [participant_id for participant_id in participant_ids if participant_id not in in_game]
+    if missing:
+        raise ValueError(f"Participants {missing} are not part of game {setup.game_id}")
+
+    db_round = Round(game_id=setup.game_id, round_number=setup.round_number, is_complete=False)
+    db.add(db_round)
+    db.flush()
+    team_rows = [{"round_id": db_round.round_id, "role": team.role} for team in setup.teams]
+    if db.get_bind().dialect.insert_executemany_returning:
+        # One multi-row INSERT ... RETURNING for the teams; roles are unique, so ids map back by role
+        team_ids = dict(
+            (role, round_team_id) for round_team_id, role in
+            db.execute(insert(RoundTeam).returning(RoundTeam.round_team_id, RoundTeam.role), team_rows)
+        )
+    else:
+        # No RETURNING (MySQL): one INSERT per team, ids from lastrowid
+        team_ids = {row["role"]: db.execute(insert(RoundTeam).values(**row)).inserted_primary_key[0]
+                    for row in team_rows}
+    team_players = [
+        {"round_team_id": team_ids[team.role], "participant_id": participant_id}
+        for team in setup.teams
+        for participant_id in team.participant_ids
+    ]
+    if team_players:
+        db.execute(insert(RoundTeamPlayer), team_players)
+    db.commit()
+    return get_round_with_details(db, db_round.round_id)
+
 def update_round(db: Session, round_id: int, round: RoundUpdate):
     """Update a round"""
     db_round = db.query(Round).filter(Round.round_id == round_id).first()
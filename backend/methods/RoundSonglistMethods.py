@@ -0,0 +1,55 @@
+# backend/methods/RoundSonglistMethods.py
+from typing import Dict, Any
+from sqlalchemy.orm import Session, joinedload
+from ..models.RoundSonglist import RoundSonglist
+from ..models.Song import Song
+from ..models.Artist import Artist
+from ..models.TrackInfo import TrackInfo
+from ..models.Enums import ScoreType
+from .UpsertMethods import upsert_id
+
+def get_round_songlist_with_details(db: Session, round_songlist_id: int):
+    """Get a round songlist entry with song, track info and artist"""
+    return db.query(RoundSonglist)\
+        .options(
+            joinedload(RoundSonglist.song),
+            joinedload(RoundSonglist.track_info).joinedload(TrackInfo.artist),
+            joinedload(RoundSonglist.track_info).joinedload(TrackInfo.song)
+        )\
+        .filter(RoundSonglist.round_songlist_id == round_songlist_id)\
+        .first()
+
+def record_played_track(db: Session, round_id: int, round_team_id: int, track: Dict[str, Any]):
+    """Save a raw Spotify track as the next song of a round.
+
+    Upserts the (first) artist, the song and their track info -- one statement
+    each -- then adds the round songlist entry with no guesses scored yet, all in
+    one transaction. Raises ValueError if the track is missing its id, name or artist.
+    """
+    try:
+        spotify_artist = track["artists"][0]
+        artist_values = {"spotify_id": spotify_artist["id"], "name": spotify_artist["name"]}
+        song_values = {"spotify_id": track["id"], "title": track["name"]}
+    except (KeyError, IndexError, TypeError):
+        raise ValueError("Track needs an id, a name and at least one artist with an id and a name")
+
+    artist_id = upsert_id(db, Artist, artist_values, conflict_columns=["spotify_id"], update_columns=["name"])
+    song_id = upsert_id(db, Song, song_values, conflict_columns=["spotify_id"], update_columns=["title"])
+    track_info_id = upsert_id(
+        db, TrackInfo,
+        {"song_id": song_id, "artist_id": artist_id},
+        conflict_columns=["song_id", "artist_id"]
+    )
+
+    db_songlist = RoundSonglist(
+        round_id=round_id,
+        song_id=song_id,
+        round_team_id=round_team_id,
+        track_info_id=track_info_id,
+        score_type=ScoreType.STANDARD
+    )
+    db.add(db_songlist)
+    db.flush()
+    round_songlist_id = db_songlist.round_songlist_id  # read before commit expires it
+    db.commit()
+    return get_round_songlist_with_details(db, round_songlist_id)
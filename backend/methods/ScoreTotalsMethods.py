@@ -0,0 +1,220 @@
+# backend/methods/ScoreTotalsMethods.py
+"""Maintained score totals: game_score_totals and player_score_totals.
+
+Every flush that creates, rescores, moves or deletes a round song, or changes
+who is on a team (including deletes cascading from rounds, games, participants
+and players), recomputes the game totals of the participants involved from the
+source rows and moves their players' totals by the difference -- in the same
+transaction as the change. ORM INSERT statements for team players and round
+songs (RoundMethods.setup_round) are tracked too; bulk UPDATE/DELETE statements
+on those tables are not, so follow them with refresh_participants or rebuild.
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import bindparam, delete, event, func, insert, inspect, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from ..models.GameScoreTotal import GameScoreTotal
+from ..models.Participant import Participant
+from ..models.PlayerScoreTotal import PlayerScoreTotal
+from ..models.RoundSonglist import RoundSonglist
+from ..models.RoundTeamPlayer import RoundTeamPlayer
+from .LeaderboardMethods import song_points
+from .UpsertMethods import upsert_many
+
+# RoundSonglist columns that change who scores what
+SCORED_ATTRIBUTES = ("round_team_id", "correct_artist_guess", "correct_song_title_guess",
+                     "bonus_correct_movie_guess", "score_type")
+
+def participant_totals_query(participant_ids: Optional[Iterable[int]] = None):
+    """(participant_id, game_id, player_id, total_score) for participants on at least one team.
+
+    Each membership is credited with its team's points, as on the leaderboard.
+    """
+    stmt = select(
+            RoundTeamPlayer.participant_id,
+            Participant.game_id,
+            Participant.player_id,
+            func.coalesce(func.sum(song_points()), 0).label("total_score")
+        )\
+        .select_from(RoundTeamPlayer)\
+        .join(Participant, Participant.participant_id == RoundTeamPlayer.participant_id)\
+        .outerjoin(RoundSonglist, RoundSonglist.round_team_id == RoundTeamPlayer.round_team_id)\
+        .group_by(RoundTeamPlayer.participant_id, Participant.game_id, Participant.player_id)
+    if participant_ids is not None:
+        stmt = stmt.where(RoundTeamPlayer.participant_id.in_(list(participant_ids)))
+    return stmt
+
+def participant_totals(connection: Connection, participant_ids: Optional[Iterable[int]] = None
+                       ) -> Dict[int, Tuple[int, int, int]]:
+    """participant_id -> (game_id, player_id, total_score), from the source tables"""
+    return {
+        participant_id: (game_id, player_id, total_score)
+        for participant_id, game_id, player_id, total_score
+        in connection.execute(participant_totals_query(participant_ids))
+    }
+
+def _apply_player_deltas(connection: Connection, deltas: Dict[int, List[int]]) -> None:
+    players = sorted(deltas)  # one lock order for concurrent writers
+    upsert_many(connection, PlayerScoreTotal,
+                [{"player_id": player_id, "total_score": 0, "games_played": 0} for player_id in players],
+                ["player_id"])
+    connection.execute(
+        update(PlayerScoreTotal)
+        .where(PlayerScoreTotal.player_id == bindparam("b_player_id"))
+        .values(total_score=PlayerScoreTotal.total_score + bindparam("b_score"),
+                games_played=PlayerScoreTotal.games_played + bindparam("b_games")),
+        [{"b_player_id": player_id, "b_score": deltas[player_id][0], "b_games": deltas[player_id][1]}
+         for player_id in players]
+    )
+    connection.execute(delete(PlayerScoreTotal).where(
+        PlayerScoreTotal.player_id.in_(players), PlayerScoreTotal.games_played <= 0
+    ))
+
+def refresh_participants(connection: Connection, participant_ids: Iterable[int]) -> None:
+    """Recompute the game totals of `participant_ids` and move their players' totals.
+
+    A participant no longer on any team (or deleted) loses its row; the player
+    totals change by the difference, so other games are never re-read.
+    """
+    participant_ids = sorted({participant_id for participant_id in participant_ids if participant_id is not None})
+    if not participant_ids:
+        return
+    old = {
+        participant_id: (player_id, total_score)
+        for participant_id, player_id, total_score in connection.execute(
+            select(GameScoreTotal.participant_id, GameScoreTotal.player_id, GameScoreTotal.total_score)
+            .where(GameScoreTotal.participant_id.in_(participant_ids))
+            .with_for_update()
+        )
+    }
+    new = participant_totals(connection, participant_ids)
+
+    if new:
+        upsert_many(connection, GameScoreTotal, [
+            {"participant_id": participant_id, "game_id": game_id, "player_id": player_id, "total_score": total_score}
+            for participant_id, (game_id, player_id, total_score) in new.items()
+        ], ["participant_id"], ["game_id", "player_id", "total_score"])
+    gone = [participant_id for participant_id in old if participant_id not in new]
+    if gone:
+        connection.execute(delete(GameScoreTotal).where(GameScoreTotal.participant_id.in_(gone)))
+
+    deltas: Dict[int, List[int]] = defaultdict(lambda: [0, 0])  # player_id -> [score, games]
+    for player_id, total_score in old.values():
+        deltas[player_id][0] -= total_score
+        deltas[player_id][1] -= 1
+    for _, player_id, total_score in new.values():
+        deltas[player_id][0] += total_score
+        deltas[player_id][1] += 1
+    deltas = {player_id: delta for player_id, delta in deltas.items() if delta != [0, 0]}
+    if deltas:
+        _apply_player_deltas(connection, deltas)
+
+def rebuild(connection: Connection) -> Dict[str, int]:
+    """Recompute both tables from the source tables (backfill, or repair after drift)"""
+    connection.execute(delete(GameScoreTotal))
+    connection.execute(delete(PlayerScoreTotal))
+    connection.execute(insert(GameScoreTotal).from_select(
+        ["participant_id", "game_id", "player_id", "total_score"], participant_totals_query()
+    ))
+    connection.execute(insert(PlayerScoreTotal).from_select(
+        ["player_id", "total_score", "games_played"],
+        select(GameScoreTotal.player_id, func.sum(GameScoreTotal.total_score), func.count())
+        .group_by(GameScoreTotal.player_id)
+    ))
+    return {
+        "game_rows": connection.scalar(select(func.count()).select_from(GameScoreTotal)),
+        "player_rows": connection.scalar(select(func.count()).select_from(PlayerScoreTotal)),
+    }
+
+def check(connection: Connection) -> Dict[str, List[tuple]]:
+    """Rows that differ from the source tables, as (id, stored, expected) per table"""
+    expected_games = participant_totals(connection)
+    stored_games = {
+        participant_id: (game_id, player_id, total_score)
+        for participant_id, game_id, player_id, total_score in connection.execute(
+            select(GameScoreTotal.participant_id, GameScoreTotal.game_id,
+                   GameScoreTotal.player_id, GameScoreTotal.total_score)
+        )
+    }
+    expected_players: Dict[int, Tuple[int, int]] = {}
+    for _, player_id, total_score in expected_games.values():
+        score, games = expected_players.get(player_id, (0, 0))
+        expected_players[player_id] = (score + total_score, games + 1)
+    stored_players = {
+        player_id: (total_score, games_played)
+        for player_id, total_score, games_played in connection.execute(
+            select(PlayerScoreTotal.player_id, PlayerScoreTotal.total_score, PlayerScoreTotal.games_played)
+        )
+    }
+
+    def differences(stored, expected):
+        return [(key, stored.get(key), expected.get(key))
+                for key in sorted(set(stored) | set(expected)) if stored.get(key) != expected.get(key)]
+
+    return {
+        "game_score_totals": differences(stored_games, expected_games),
+        "player_score_totals": differences(stored_players, expected_players),
+    }
+
+def _values(obj, key: str) -> Set:
+    """The attribute's value now and before this flush"""
+    history = inspect(obj).attrs[key].history
+    return {inspect(obj).dict.get(key), *history.deleted} - {None}
+
+def _changed(obj, keys: Iterable[str]) -> bool:
+    return any(inspect(obj).attrs[key].history.has_changes() for key in keys)
+
+def _affected(session: Session) -> Tuple[Set[int], Set[int]]:
+    """(round_team_ids, participant_ids) touched by the flush in progress"""
+    teams: Set[int] = set()
+    participants: Set[int] = set()
+    for obj in list(session.new) + list(session.deleted) + list(session.dirty):
+        dirty = obj not in session.new and obj not in session.deleted
+        if isinstance(obj, RoundSonglist):
+            if not dirty or _changed(obj, SCORED_ATTRIBUTES):
+                teams |= _values(obj, "round_team_id")
+        elif isinstance(obj, RoundTeamPlayer):
+            if not dirty or _changed(obj, ("round_team_id", "participant_id")):
+                participants |= _values(obj, "participant_id")
+        elif isinstance(obj, Participant):
+            if not dirty or _changed(obj, ("player_id", "game_id")):
+                participants |= _values(obj, "participant_id")
+    return teams, participants
+
+def _after_flush(session: Session, flush_context) -> None:
+    teams, participants = _affected(session)
+    if not teams and not participants:
+        return
+    connection = session.connection()
+    if teams:
+        participants |= set(connection.scalars(
+            select(RoundTeamPlayer.participant_id).where(RoundTeamPlayer.round_team_id.in_(teams))
+        ))
+    refresh_participants(connection, participants)
+
+def _after_bulk_insert(orm_execute_state):
+    if not orm_execute_state.is_insert:
+        return None
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or mapper.class_ not in (RoundTeamPlayer, RoundSonglist):
+        return None
+    rows = orm_execute_state.parameters
+    rows = [rows] if isinstance(rows, dict) else list(rows or [])
+    result = orm_execute_state.invoke_statement()
+    connection = orm_execute_state.session.connection()
+    if mapper.class_ is RoundTeamPlayer:
+        refresh_participants(connection, {row.get("participant_id") for row in rows})
+    else:
+        teams = {row.get("round_team_id") for row in rows} - {None}
+        if teams:
+            refresh_participants(connection, connection.scalars(
+                select(RoundTeamPlayer.participant_id).where(RoundTeamPlayer.round_team_id.in_(teams))
+            ))
+    return result
+
+def track_score_totals() -> None:
+    """Maintain the totals from every Session (sync, and the ones behind AsyncSession)"""
+    if not event.contains(Session, "after_flush", _after_flush):
+        event.listen(Session, "after_flush", _after_flush)
+        event.listen(Session, "do_orm_execute", _after_bulk_insert)
@@ -0,0 +1,114 @@
+# backend/methods/UpsertMethods.py
+from typing import Any, Dict, List, Sequence, Type, Union
+from sqlalchemy import case, func, or_
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+def _primary_key(model: Type):
+    return model.__table__.primary_key.columns.values()[0]
+
+def _conflict_updates(model: Type, update_columns: Sequence[str], excluded) -> List[tuple]:
+    """SET list for the conflict branch, as ordered (column, value) pairs.
+
+    `updated_at` only moves when one of `update_columns` actually changes, and it is
+    assigned first because MySQL evaluates ON DUPLICATE KEY UPDATE left to right.
+    With nothing to update, the key is set to itself so the row is still returned.
+    """
+    table = model.__table__
+    if not update_columns:
+        pk = _primary_key(model).name
+        return [(pk, table.c[pk])]
+    updates = []
+    if "updated_at" in table.c:
+        changed = or_(*[table.c[column] != excluded[column] for column in update_columns])
+        updates.append(("updated_at", case((changed, func.now()), else_=table.c.updated_at)))
+    updates.extend((column, excluded[column]) for column in update_columns)
+    return updates
+
+def _finish(db: Session, row, commit: bool):
+    if commit:
+        db.expunge(row)
+        db.commit()
+    return row
+
+def _on_conflict(dialect: str, model: Type, values, conflict_columns: Sequence[str],
+                 update_columns: Sequence[str], pk_update=None):
+    """INSERT `values` (one row or a list of rows) with the dialect's conflict clause"""
+    if dialect in ("sqlite", "postgresql"):
+        insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        stmt = insert(model).values(values)
+        return stmt.on_conflict_do_update(
+            index_elements=list(conflict_columns),
+            set_=dict(_conflict_updates(model, update_columns, stmt.excluded))
+        )
+
+    if dialect in ("mysql", "mariadb"):
+        pk = _primary_key(model)
+        stmt = mysql.insert(model).values(values)
+        updates = [update for update in _conflict_updates(model, update_columns, stmt.inserted)
+                   if update[0] != pk.name]
+        updates.append((pk.name, pk_update if pk_update is not None else model.__table__.c[pk.name]))
+        return stmt.on_duplicate_key_update(updates)
+
+    raise NotImplementedError(f"No single-statement upsert for dialect '{dialect}'")
+
+def upsert_statement(dialect: str, model: Type, values: Dict[str, Any], conflict_columns: Sequence[str],
+                     update_columns: Sequence[str] = (), id_only: bool = False):
+    """The single upsert statement for `dialect`.
+
+    On SQLite and PostgreSQL it returns the row (or just its id with `id_only`); on
+    MySQL the row id comes back as the result's lastrowid and the row has to be read
+    by primary key.
+    """
+    pk = _primary_key(model)
+    if dialect in ("mysql", "mariadb"):
+        # LAST_INSERT_ID(pk) makes lastrowid the existing row's id on the update branch
+        return _on_conflict(dialect, model, values, conflict_columns, update_columns,
+                            pk_update=func.last_insert_id(model.__table__.c[pk.name]))
+    return _on_conflict(dialect, model, values, conflict_columns, update_columns)\
+        .returning(pk if id_only else model)
+
+def returns_row(dialect: str) -> bool:
+    return dialect in ("sqlite", "postgresql")
+
+def upsert(db: Session, model: Type, values: Dict[str, Any], conflict_columns: Sequence[str],
+           update_columns: Sequence[str] = (), commit: bool = False):
+    """Insert a row or update the one that clashes on `conflict_columns`, and return it.
+
+    One statement on every dialect: INSERT ... ON CONFLICT ... RETURNING on SQLite
+    and PostgreSQL, INSERT ... ON DUPLICATE KEY UPDATE on MySQL (where the row id
+    comes back through LAST_INSERT_ID and the row is then read by primary key).
+    Concurrent callers cannot hit a duplicate-key error.
+
+    With `commit=True` the row is detached and the transaction committed, so the
+    returned values survive the commit without being reloaded.
+    """
+    dialect = db.get_bind().dialect.name
+    stmt = upsert_statement(dialect, model, values, conflict_columns, update_columns)
+    if returns_row(dialect):
+        row = db.execute(stmt, execution_options={"populate_existing": True}).scalar_one()
+    else:
+        row = db.get(model, db.execute(stmt).lastrowid, populate_existing=True)
+    return _finish(db, row, commit)
+
+def upsert_id(db: Session, model: Type, values: Dict[str, Any], conflict_columns: Sequence[str],
+              update_columns: Sequence[str] = ()) -> int:
+    """Like upsert, but return only the row's primary key -- the one statement, no read-back"""
+    dialect = db.get_bind().dialect.name
+    stmt = upsert_statement(dialect, model, values, conflict_columns, update_columns, id_only=True)
+    if returns_row(dialect):
+        return db.execute(stmt).scalar_one()
+    return db.execute(stmt).lastrowid
+
+def upsert_many(db: Union[Session, Connection], model: Type, rows: List[Dict[str, Any]],
+                conflict_columns: Sequence[str], update_columns: Sequence[str] = ()) -> None:
+    """Upsert `rows` with one multi-row statement; nothing is returned or committed.
+
+    Rows must not repeat a conflict key (PostgreSQL refuses to update a row twice in
+    one statement), and the caller keeps batches small enough for the dialect's
+    bind parameter limit. Read the ids back by the conflict columns afterwards.
+    """
+    if rows:
+        dialect = db.dialect if isinstance(db, Connection) else db.get_bind().dialect
+        db.execute(_on_conflict(dialect.name, model, rows, conflict_columns, update_columns))
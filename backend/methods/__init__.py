@@ -32,9 +32,11 @@ from .RoundMethods import (
     get_rounds,
     get_rounds_by_game,
     get_active_round_for_game,  # NEW
+    get_round_team_by_role,
     get_round_with_teams,
     get_round_with_details,
     create_round,
+    setup_round,
     update_round,
     delete_round
 )
@@ -70,9 +72,11 @@ class RoundMethods:
     get_rounds = get_rounds
     get_rounds_by_game = get_rounds_by_game
     get_active_round_for_game = get_active_round_for_game  # NEW
+    get_round_team_by_role = get_round_team_by_role
     get_round_with_teams = get_round_with_teams
     get_round_with_details = get_round_with_details
     create_round = create_round
+    setup_round = setup_round
     update_round = update_round
     delete_round = delete_round
 
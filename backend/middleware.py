@@ -1,120 +1,109 @@
 # backend/middleware.py
-from fastapi import Request, HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 from .database import SessionLocal
-from .methods.GameplaySettingsMethods import get_setting_by_key, upsert_setting
+from .services.SpotifyTokenStore import spotify_token_store
+from .services.SpotifyTokenRefresher import SpotifyTokenRefreshError
 from .config import get_settings
-from datetime import datetime, timedelta
-import requests
+from .routes import include_routers
+from datetime import datetime
+import asyncio
 
 
-class SpotifyAuthMiddleware(BaseHTTPMiddleware):
-    """Middleware to inject Spotify access token into requests"""
-    
-    def __init__(self, app, spotify_auth=None):
-        super().__init__(app)
+class SpotifyAuthMiddleware:
+    """Middleware to inject Spotify access token into requests.
+
+    Plain ASGI rather than BaseHTTPMiddleware: requests outside /api/spotify go
+    straight to the app, and streaming/SSE responses are passed through untouched.
+    The token ends up in `request.state.spotify_token`.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
         self.settings = get_settings()
-    
-    async def dispatch(self, request: Request, call_next):
-        # Skip auth for non-Spotify API routes
-        if not request.url.path.startswith("/api/spotify"):
-            return await call_next(request)
-        
-        # Skip auth for auth routes themselves
-        if request.url.path.startswith("/api/spotify/auth"):
-            return await call_next(request)
-        
-        # Skip auth for docs
-        if request.url.path in ["/docs", "/redoc", "/openapi.json"]:
-            return await call_next(request)
-        
-        # Get database session
-        db = SessionLocal()
-        
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        path = scope["path"]
+
+        # Skip auth for non-Spotify API routes and the auth routes themselves
+        if not path.startswith("/api/spotify") or path.startswith("/api/spotify/auth"):
+            return await self.app(scope, receive, send)
+
+        try:
+            token = await self.current_token(scope)
+        except HTTPException as e:
+            response = JSONResponse({"detail": e.detail}, status_code=e.status_code)
+            return await response(scope, receive, send)
+
+        scope.setdefault("state", {})["spotify_token"] = token
+        await self.app(scope, receive, send)
+
+    async def current_token(self, scope: Scope) -> str:
+        """A valid access token, refreshing through the shared refresher if it has expired"""
+        # One read of the token store per request; only the first request touches
+        # the database
+        tokens = await spotify_token_store.read_async(SessionLocal)
+
+        access_token = tokens.access_token
+        expires_value = tokens.expires_at
+
+        if not access_token or not expires_value:
+            raise HTTPException(
+                status_code=401,
+                detail="No Spotify authorization. Please authorize in settings."
+            )
+
+        # Check if token is expired
+        try:
+            expires_at = datetime.fromisoformat(expires_value)
+        except ValueError:
+            raise HTTPException(
+                status_code=500,
+                detail="Invalid token expiration format"
+            )
+
+        if datetime.now() < expires_at:
+            return access_token
+
+        # The background refresher normally gets here first; if it has not,
+        # wait on (or start) the single shared refresh
         try:
-            # Try to get valid token from gameplay_settings
-            token_setting = get_setting_by_key(db, "SPOTIFY_ACCESS_TOKEN")
-            expires_setting = get_setting_by_key(db, "SPOTIFY_TOKEN_EXPIRES_AT")
-            
-            if not token_setting or not expires_setting:
-                db.close()
+            return await scope["app"].state.spotify_token_refresher.refresh()
+        except SpotifyTokenRefreshError:
+            if not tokens.refresh_token:
                 raise HTTPException(
                     status_code=401,
-                    detail="No Spotify authorization. Please authorize in settings."
-                )
-            
-            # Check if token is expired
-            try:
-                expires_at = datetime.fromisoformat(expires_setting.value)
-                
-                if datetime.now() >= expires_at:
-                    # Try to refresh the token
-                    refresh_token_setting = get_setting_by_key(db, "SPOTIFY_REFRESH_TOKEN")
-                    
-                    if refresh_token_setting:
-                        try:
-                            # Refresh the token
-                            token_data = {
-                                "grant_type": "refresh_token",
-                                "refresh_token": refresh_token_setting.value,
-                                "client_id": self.settings.spotify_client_id,
-                                "client_secret": self.settings.spotify_client_secret
-                            }
-                            
-                            response = requests.post(
-                                "https://accounts.spotify.com/api/token",
-                                data=token_data
-                            )
-                            response.raise_for_status()
-                            tokens = response.json()
-                            
-                            # Calculate new expiration
-                            expires_in = tokens.get("expires_in", 3600)
-                            new_expires_at = (datetime.now() + timedelta(seconds=expires_in)).isoformat()
-                            
-                            # Update tokens in database
-                            upsert_setting(db, "SPOTIFY_ACCESS_TOKEN", tokens["access_token"])
-                            upsert_setting(db, "SPOTIFY_TOKEN_EXPIRES_AT", new_expires_at)
-                            
-                            if "refresh_token" in tokens:
-                                upsert_setting(db, "SPOTIFY_REFRESH_TOKEN", tokens["refresh_token"])
-                            
-                            # Use the new token
-                            request.state.spotify_token = tokens["access_token"]
-                            
-                        except Exception as e:
-                            db.close()
-                            raise HTTPException(
-                                status_code=401,
-                                detail="Token expired and refresh failed. Please re-authorize in settings."
-                            )
-                    else:
-                        db.close()
-                        raise HTTPException(
-                            status_code=401,
-                            detail="Token expired and no refresh token available. Please re-authorize in settings."
-                        )
-                else:
-                    # Token is still valid
-                    request.state.spotify_token = token_setting.value
-                    
-            except ValueError:
-                db.close()
-                raise HTTPException(
-                    status_code=500,
-                    detail="Invalid token expiration format"
+                    detail="Token expired and no refresh token available. Please re-authorize in settings."
                 )
-            
-        except HTTPException:
-            db.close()
-            raise
+            raise HTTPException(
+                status_code=401,
+                detail="Token expired and refresh failed. Please re-authorize in settings."
+            )
         except Exception as e:
-            db.close()
             raise HTTPException(
                 status_code=500,
                 detail=f"Error getting Spotify token: {str(e)}"
             )
-        
-        db.close()
-        response = await call_next(request)
-        return response
\ No newline at end of file
+
+
+class LazyRouterMiddleware:
+    """Registers the API routers on the first HTTP request instead of at import.
+
+    Keeps worker spawn down to importing FastAPI and the app shell; the cost of
+    importing every route module moves to the first request the worker serves.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.loaded = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if not self.loaded and scope["type"] == "http":
+            await asyncio.to_thread(include_routers, scope["app"])
+            self.loaded = True
+        await self.app(scope, receive, send)
+
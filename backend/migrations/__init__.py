@@ -0,0 +1,120 @@
+# backend/migrations/__init__.py
+"""Versioned schema migrations.
+
+Each migration is a module named mNNNN_<description>.py in this package with an
+`upgrade(connection)` and, unless it is irreversible, a `downgrade(connection)`
+function. Applied versions are
+recorded in the schema_migrations table; `upgrade` applies the missing ones in
+order, each in its own transaction.
+
+    python -m backend.migrations [status | upgrade [version] | downgrade version]
+"""
+import importlib
+import pkgutil
+import re
+from types import ModuleType
+from typing import Dict, List, Optional
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+
+MODULE_PATTERN = re.compile(r"^m(\d{4})_(\w+)$")
+
+_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations", _metadata,
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("name", String(100), nullable=False),
+    Column("applied_at", DateTime(timezone=True), server_default=func.now()),
+)
+
+
+def migrations() -> Dict[int, ModuleType]:
+    """Every migration module by version"""
+    found = {}
+    for module in pkgutil.iter_modules(__path__):
+        match = MODULE_PATTERN.match(module.name)
+        if match:
+            found[int(match.group(1))] = importlib.import_module(f"{__name__}.{module.name}")
+    return dict(sorted(found.items()))
+
+
+def head() -> int:
+    return max(migrations(), default=0)
+
+
+def applied_versions(connection: Connection) -> List[int]:
+    schema_migrations.create(connection, checkfirst=True)
+    return list(connection.scalars(select(schema_migrations.c.version).order_by(schema_migrations.c.version)))
+
+
+def current(engine: Engine) -> int:
+    with engine.begin() as connection:
+        return max(applied_versions(connection), default=0)
+
+
+def upgrade(engine: Engine, target: Optional[int] = None) -> List[int]:
+    """Apply pending migrations up to `target` (default: all); returns the versions applied"""
+    target = head() if target is None else target
+    with engine.begin() as connection:
+        done = set(applied_versions(connection))
+    applied = []
+    for version, module in migrations().items():
+        if version > target or version in done:
+            continue
+        with engine.begin() as connection:
+            module.upgrade(connection)
+            connection.execute(schema_migrations.insert().values(version=version, name=module.__name__.rsplit(".", 1)[1]))
+        applied.append(version)
+    return applied
+
+
+def downgrade(engine: Engine, target: int) -> List[int]:
+    """Revert applied migrations above `target`, newest first; returns the versions reverted"""
+    with engine.begin() as connection:
+        done = set(applied_versions(connection))
+    pending = [(version, module) for version, module in reversed(migrations().items())
+               if version > target and version in done]
+    irreversible = [f"{version:04d}" for version, module in pending if not hasattr(module, "downgrade")]
+    if irreversible:
+        raise ValueError(f"Migration {', '.join(irreversible)} cannot be downgraded")
+    reverted = []
+    for version, module in pending:
+        with engine.begin() as connection:
+            module.downgrade(connection)
+            connection.execute(schema_migrations.delete().where(schema_migrations.c.version == version))
+        reverted.append(version)
+    return reverted
+
+
+# Helpers for migrations: existing databases were built by create_all at various
+# points, so operations check the live schema instead of assuming it
+
+def index_names(connection: Connection, table: str) -> List[str]:
+    inspector = inspect(connection)
+    names = [index["name"] for index in inspector.get_indexes(table)]
+    names += [constraint["name"] for constraint in inspector.get_unique_constraints(table) if constraint["name"]]
+    return names
+
+
+def create_index(connection: Connection, name: str, table: str, columns: List[str], unique: bool = False) -> bool:
+    """CREATE [UNIQUE] INDEX unless an index or unique constraint of that name exists"""
+    if name in index_names(connection, table):
+        return False
+    preparer = connection.dialect.identifier_preparer
+    connection.execute(text(
+        f"CREATE {'UNIQUE ' if unique else ''}INDEX {preparer.quote(name)} ON {preparer.quote(table)} "
+        f"({', '.join(preparer.quote(column) for column in columns)})"
+    ))
+    return True
+
+
+def drop_index(connection: Connection, name: str, table: str) -> bool:
+    """DROP INDEX if it exists (a unique constraint that SQLite built into the table is left alone)"""
+    if name not in [index["name"] for index in inspect(connection).get_indexes(table)]:
+        return False
+    preparer = connection.dialect.identifier_preparer
+    if connection.dialect.name in ("mysql", "mariadb"):
+        connection.execute(text(f"DROP INDEX {preparer.quote(name)} ON {preparer.quote(table)}"))
+    else:
+        connection.execute(text(f"DROP INDEX {preparer.quote(name)}"))
+    return True
@@ -0,0 +1,28 @@
+# backend/migrations/__main__.py
+import sys
+from ..database import engine
+from . import current, downgrade, head, migrations, upgrade
+
+
+def main(argv) -> None:
+    command = argv[0] if argv else "status"
+    if command == "status":
+        version = current(engine)
+        for number, module in migrations().items():
+            print(f"{'*' if number <= version else ' '} {number:04d} {module.__name__.rsplit('.', 1)[1]}")
+        print(f"current {version:04d}, head {head():04d}")
+    elif command == "upgrade":
+        applied = upgrade(engine, int(argv[1]) if len(argv) > 1 else None)
+        print(f"applied {', '.join(f'{v:04d}' for v in applied) or 'nothing'}; now at {current(engine):04d}")
+    elif command == "downgrade" and len(argv) > 1:
+        try:
+            reverted = downgrade(engine, int(argv[1]))
+        except ValueError as e:
+            sys.exit(str(e))
+        print(f"reverted {', '.join(f'{v:04d}' for v in reverted) or 'nothing'}; now at {current(engine):04d}")
+    else:
+        sys.exit("usage: python -m backend.migrations [status | upgrade [version] | downgrade version]")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
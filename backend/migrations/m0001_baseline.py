@@ -0,0 +1,127 @@
+# backend/migrations/m0001_baseline.py
+"""The schema as the app first shipped it, before any migration.
+
+Frozen here rather than taken from the models, so later model changes never leak
+into it; every change since is a migration of its own. Creates only what is
+missing, so a database built earlier by create_all is adopted as-is.
+
+Irreversible, so it has no downgrade: reverting it would drop every table and
+its data. Downgrade to 0001 at most; drop the database to start over.
+"""
+from sqlalchemy import (Boolean, Column, DateTime, Enum, ForeignKey, Integer, MetaData, String, Table,
+                        func)
+from sqlalchemy.engine import Connection
+
+metadata = MetaData()
+
+
+def _timestamps():
+    return (
+        Column("created_at", DateTime(timezone=True), server_default=func.now()),
+        Column("updated_at", DateTime(timezone=True), server_default=func.now()),
+    )
+
+
+Table(
+    "player", metadata,
+    Column("player_id", Integer, primary_key=True, index=True),
+    Column("name", String(100), nullable=False),
+    Column("image_url", String(255), nullable=True),
+    *_timestamps()
+)
+
+Table(
+    "game", metadata,
+    Column("game_id", Integer, primary_key=True, index=True),
+    Column("playlist_id", String(100), nullable=True),
+    Column("current_track_index", Integer, nullable=False),
+    Column("all_time_dj_participant_id", Integer, ForeignKey("participant.participant_id"), nullable=True),
+    Column("songs_per_round", Integer, nullable=False),
+    Column("started_at", DateTime(timezone=True), nullable=True),
+    Column("ended_at", DateTime(timezone=True), nullable=True),
+    *_timestamps()
+)
+
+Table(
+    "participant", metadata,
+    Column("participant_id", Integer, primary_key=True, index=True),
+    Column("game_id", Integer, ForeignKey("game.game_id", ondelete="CASCADE"), nullable=False),
+    Column("player_id", Integer, ForeignKey("player.player_id", ondelete="CASCADE"), nullable=False),
+    Column("seat_number", Integer, nullable=False),
+    *_timestamps()
+)
+
+Table(
+    "round", metadata,
+    Column("round_id", Integer, primary_key=True, index=True),
+    Column("game_id", Integer, ForeignKey("game.game_id", ondelete="CASCADE"), nullable=False),
+    Column("round_number", Integer, nullable=False),
+    Column("is_complete", Boolean, nullable=False),
+    *_timestamps()
+)
+
+Table(
+    "round_team", metadata,
+    Column("round_team_id", Integer, primary_key=True, index=True),
+    Column("round_id", Integer, ForeignKey("round.round_id", ondelete="CASCADE"), nullable=False),
+    Column("role", Enum("PLAYER", "DJ", "STEALER", name="role"), nullable=False, server_default="player"),
+    *_timestamps()
+)
+
+Table(
+    "round_team_player", metadata,
+    Column("round_team_player_id", Integer, primary_key=True, index=True),
+    Column("round_team_id", Integer, ForeignKey("round_team.round_team_id", ondelete="CASCADE"), nullable=False),
+    Column("participant_id", Integer, ForeignKey("participant.participant_id", ondelete="CASCADE"), nullable=False),
+    *_timestamps()
+)
+
+Table(
+    "song", metadata,
+    Column("song_id", Integer, primary_key=True, index=True),
+    Column("spotify_id", String(100), unique=True, nullable=False),
+    Column("title", String(255), nullable=False),
+    *_timestamps()
+)
+
+Table(
+    "artist", metadata,
+    Column("artist_id", Integer, primary_key=True, index=True),
+    Column("spotify_id", String(100), unique=True, nullable=False),
+    Column("name", String(255), nullable=False),
+    *_timestamps()
+)
+
+Table(
+    "track_info", metadata,
+    Column("track_info_id", Integer, primary_key=True, index=True),
+    Column("song_id", Integer, ForeignKey("song.song_id", ondelete="CASCADE"), nullable=False),
+    Column("artist_id", Integer, ForeignKey("artist.artist_id", ondelete="CASCADE"), nullable=False),
+    *_timestamps()
+)
+
+Table(
+    "round_songlist", metadata,
+    Column("round_songlist_id", Integer, primary_key=True, index=True),
+    Column("round_id", Integer, ForeignKey("round.round_id", ondelete="CASCADE"), nullable=False),
+    Column("song_id", Integer, ForeignKey("song.song_id", ondelete="CASCADE"), nullable=False),
+    Column("round_team_id", Integer, ForeignKey("round_team.round_team_id", ondelete="CASCADE"), nullable=False),
+    Column("track_info_id", Integer, ForeignKey("track_info.track_info_id", ondelete="CASCADE"), nullable=False),
+    Column("correct_artist_guess", Boolean),
+    Column("correct_song_title_guess", Boolean),
+    Column("bonus_correct_movie_guess", Boolean),
+    Column("score_type", Enum("STANDARD", "STEAL", name="scoretype"), nullable=False, server_default="standard"),
+    *_timestamps()
+)
+
+Table(
+    "gameplay_settings", metadata,
+    Column("setting_id", Integer, primary_key=True, index=True),
+    Column("key", String(100), unique=True, nullable=False, index=True),
+    Column("value", String(500), nullable=False),
+    *_timestamps()
+)
+
+
+def upgrade(connection: Connection) -> None:
+    metadata.create_all(bind=connection)
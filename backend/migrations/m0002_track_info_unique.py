@@ -0,0 +1,32 @@
+# backend/migrations/m0002_track_info_unique.py
+"""Unique track_info.(song_id, artist_id), the conflict target of the track info upsert.
+
+Duplicate song/artist pairs left by the old get-or-create are merged into the
+lowest track_info_id first, repointing the round_songlist rows that used them.
+"""
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from . import create_index, drop_index
+
+
+def _merge_duplicate_track_infos(connection: Connection) -> None:
+    keep = ("SELECT MIN(t2.track_info_id) FROM track_info t2 "
+            "WHERE t2.song_id = track_info.song_id AND t2.artist_id = track_info.artist_id")
+    duplicates = connection.execute(text(
+        f"SELECT track_info_id, ({keep}) FROM track_info WHERE track_info_id <> ({keep})"
+    )).all()
+    for duplicate_id, keep_id in duplicates:
+        connection.execute(text("UPDATE round_songlist SET track_info_id = :keep WHERE track_info_id = :duplicate"),
+                           {"keep": keep_id, "duplicate": duplicate_id})
+        connection.execute(text("DELETE FROM track_info WHERE track_info_id = :duplicate"),
+                           {"duplicate": duplicate_id})
+
+
+def upgrade(connection: Connection) -> None:
+    _merge_duplicate_track_infos(connection)
+    create_index(connection, "uq_track_info_song_artist", "track_info", ["song_id", "artist_id"], unique=True)
+
+
+def downgrade(connection: Connection) -> None:
+    # The merged duplicates are not restored; they were the same track info
+    drop_index(connection, "uq_track_info_song_artist", "track_info")
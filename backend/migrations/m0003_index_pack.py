@@ -0,0 +1,42 @@
+# backend/migrations/m0003_index_pack.py
+"""Indexes for the filters the methods and routes actually run.
+
+- round_songlist.round_id: songs of a round (round details)
+- round_team.(round_id, role): teams of a round, team by role
+- round_team_player.round_team_id / participant_id: players of a team, cascades
+- participant.(game_id, seat_number): participants of a game in seat order
+- round.(game_id, is_complete): active round of a game
+- round.(game_id, round_number): rounds of a game in order
+- track_info.artist_id: Artist.track_infos, cascades
+"""
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import DBAPIError
+from . import create_index, drop_index
+
+INDEXES = (
+    ("ix_round_songlist_round_id", "round_songlist", ["round_id"]),
+    ("ix_round_team_round_role", "round_team", ["round_id", "role"]),
+    ("ix_round_team_player_round_team_id", "round_team_player", ["round_team_id"]),
+    ("ix_round_team_player_participant_id", "round_team_player", ["participant_id"]),
+    ("ix_participant_game_seat", "participant", ["game_id", "seat_number"]),
+    ("ix_round_game_complete", "round", ["game_id", "is_complete"]),
+    ("ix_round_game_number", "round", ["game_id", "round_number"]),
+    ("ix_track_info_artist_id", "track_info", ["artist_id"]),
+)
+
+
+def upgrade(connection: Connection) -> None:
+    for name, table, columns in INDEXES:
+        create_index(connection, name, table, columns)
+
+
+def downgrade(connection: Connection) -> None:
+    # MySQL refuses to drop an index that is the only one covering a foreign key;
+    # those stay in place (DDL is not transactional there, so carrying on is safe)
+    for name, table, _ in INDEXES:
+        try:
+            drop_index(connection, name, table)
+        except DBAPIError as e:
+            if connection.dialect.name not in ("mysql", "mariadb"):
+                raise
+            print(f"Kept {name}: {e.orig}")
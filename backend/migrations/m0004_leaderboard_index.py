@@ -0,0 +1,19 @@
+# backend/migrations/m0004_leaderboard_index.py
+"""Covering index for the leaderboard's points-per-team aggregate.
+
+round_songlist.(round_team_id, correct_artist_guess, correct_song_title_guess,
+bonus_correct_movie_guess) lets the per-team sum read the index alone, in
+round_team_id order, and also serves lookups of a team's songs.
+"""
+from sqlalchemy.engine import Connection
+from . import create_index, drop_index
+
+COLUMNS = ["round_team_id", "correct_artist_guess", "correct_song_title_guess", "bonus_correct_movie_guess"]
+
+
+def upgrade(connection: Connection) -> None:
+    create_index(connection, "ix_round_songlist_team_scoring", "round_songlist", COLUMNS)
+
+
+def downgrade(connection: Connection) -> None:
+    drop_index(connection, "ix_round_songlist_team_scoring", "round_songlist")
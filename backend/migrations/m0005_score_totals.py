@@ -0,0 +1,68 @@
+# backend/migrations/m0005_score_totals.py
+"""game_score_totals and player_score_totals, backfilled from existing games.
+
+From here on ScoreTotalsMethods keeps them in step with every scoring change;
+`python -m backend.score_totals check` compares them with the source tables.
+The tables and the backfill are spelled out here, as they stood when this
+migration was written, so later model changes never leak into it.
+"""
+from sqlalchemy import Column, DateTime, Index, Integer, MetaData, Table, func, text
+from sqlalchemy.engine import Connection
+
+metadata = MetaData()
+
+game_score_totals = Table(
+    "game_score_totals", metadata,
+    Column("participant_id", Integer, primary_key=True, autoincrement=False),
+    Column("game_id", Integer, nullable=False),
+    Column("player_id", Integer, nullable=False),
+    Column("total_score", Integer, nullable=False),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True), server_default=func.now()),
+    Index("ix_game_score_totals_player_id", "player_id"),
+    Index("ix_game_score_totals_game_id", "game_id"),
+)
+
+player_score_totals = Table(
+    "player_score_totals", metadata,
+    Column("player_id", Integer, primary_key=True, autoincrement=False),
+    Column("total_score", Integer, nullable=False),
+    Column("games_played", Integer, nullable=False),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True), server_default=func.now()),
+    Index("ix_player_score_totals_score", "total_score", "player_id"),
+)
+
+# Each team membership is credited with its team's points: one each for the
+# artist, the title and the movie bonus of every song credited to the team
+BACKFILL_GAMES = """
+INSERT INTO game_score_totals (participant_id, game_id, player_id, total_score)
+SELECT rtp.participant_id, p.game_id, p.player_id,
+       COALESCE(SUM(CASE WHEN rs.correct_artist_guess THEN 1 ELSE 0 END
+                    + CASE WHEN rs.correct_song_title_guess THEN 1 ELSE 0 END
+                    + CASE WHEN rs.bonus_correct_movie_guess THEN 1 ELSE 0 END), 0)
+FROM round_team_player rtp
+JOIN participant p ON p.participant_id = rtp.participant_id
+LEFT OUTER JOIN round_songlist rs ON rs.round_team_id = rtp.round_team_id
+GROUP BY rtp.participant_id, p.game_id, p.player_id
+"""
+
+BACKFILL_PLAYERS = """
+INSERT INTO player_score_totals (player_id, total_score, games_played)
+SELECT player_id, SUM(total_score), COUNT(*)
+FROM game_score_totals
+GROUP BY player_id
+"""
+
+
+def upgrade(connection: Connection) -> None:
+    # Databases built by create_all before migrations existed already have them
+    metadata.create_all(bind=connection)
+    connection.execute(text("DELETE FROM game_score_totals"))
+    connection.execute(text("DELETE FROM player_score_totals"))
+    connection.execute(text(BACKFILL_GAMES))
+    connection.execute(text(BACKFILL_PLAYERS))
+
+
+def downgrade(connection: Connection) -> None:
+    metadata.drop_all(bind=connection)
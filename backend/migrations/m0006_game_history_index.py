@@ -0,0 +1,17 @@
+# backend/migrations/m0006_game_history_index.py
+"""Index for the game history's keyset pagination.
+
+game.(created_at, game_id) is the order of GET /games/summaries: a page starts
+with a range seek past the previous page's last game, so deep pages cost the
+same as the first.
+"""
+from sqlalchemy.engine import Connection
+from . import create_index, drop_index
+
+
+def upgrade(connection: Connection) -> None:
+    create_index(connection, "ix_game_created_at", "game", ["created_at", "game_id"])
+
+
+def downgrade(connection: Connection) -> None:
+    drop_index(connection, "ix_game_created_at", "game")
@@ -0,0 +1,70 @@
+# backend/migrations/m0007_playlist_mirror.py
+"""playlist_mirror, playlist_mirror_track and game_track_deck.
+
+The local copy of a Spotify playlist and each game's shuffled deck of its
+positions. Databases built by create_all before migrations existed already
+have the tables; they only gain the index.
+
+playlist_mirror_track.(playlist_id, position) serves get_track_at_position,
+which play-random calls on every draw to learn which track to wait for.
+"""
+from sqlalchemy import (BigInteger, Column, DateTime, ForeignKey, Index, Integer, LargeBinary, MetaData, String,
+                        Table, UniqueConstraint, func)
+from sqlalchemy.engine import Connection
+from . import create_index
+
+metadata = MetaData()
+
+# Referenced by game_track_deck; created by the baseline
+Table("game", metadata, Column("game_id", Integer, primary_key=True))
+
+playlist_mirror = Table(
+    "playlist_mirror", metadata,
+    Column("playlist_id", String(100), primary_key=True),
+    Column("snapshot_id", String(100), nullable=True),
+    Column("name", String(255), nullable=True),
+    Column("track_count", Integer, nullable=False),
+    Column("synced_at", DateTime(timezone=True), nullable=True),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True), server_default=func.now()),
+)
+
+playlist_mirror_track = Table(
+    "playlist_mirror_track", metadata,
+    Column("playlist_mirror_track_id", Integer, primary_key=True, index=True),
+    Column("playlist_id", String(100), ForeignKey("playlist_mirror.playlist_id", ondelete="CASCADE"), nullable=False),
+    Column("track_index", Integer, nullable=False),
+    Column("position", Integer, nullable=False),
+    Column("spotify_track_id", String(100), nullable=False),
+    Column("title", String(255), nullable=False),
+    Column("artists", String(500), nullable=False),
+    Column("album", String(255), nullable=True),
+    Column("duration_ms", Integer, nullable=False),
+    Column("popularity", Integer, nullable=False),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    UniqueConstraint("playlist_id", "track_index", name="uq_playlist_mirror_track_index"),
+    Index("ix_playlist_mirror_track_spotify", "playlist_id", "spotify_track_id"),
+)
+
+game_track_deck = Table(
+    "game_track_deck", metadata,
+    Column("game_id", Integer, ForeignKey("game.game_id", ondelete="CASCADE"), primary_key=True),
+    Column("playlist_id", String(100), nullable=False),
+    Column("seed", BigInteger, nullable=False),
+    Column("cycle", Integer, nullable=False),
+    Column("size", Integer, nullable=False),
+    Column("positions", LargeBinary(16 * 1024 * 1024), nullable=False),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("updated_at", DateTime(timezone=True), server_default=func.now()),
+)
+
+TABLES = (playlist_mirror, playlist_mirror_track, game_track_deck)
+
+
+def upgrade(connection: Connection) -> None:
+    metadata.create_all(bind=connection, tables=TABLES)
+    create_index(connection, "ix_playlist_mirror_track_position", "playlist_mirror_track", ["playlist_id", "position"])
+
+
+def downgrade(connection: Connection) -> None:
+    metadata.drop_all(bind=connection, tables=TABLES)
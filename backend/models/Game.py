@@ -1,14 +1,18 @@
 # backend/models/Game.py
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, func
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, func, Index
 from sqlalchemy.orm import relationship
 from ..database import Base
 
 class Game(Base):
     __tablename__ = "game"
+    __table_args__ = (
+        # Game history, newest first, one keyset page at a time
+        Index("ix_game_created_at", "created_at", "game_id"),
+    )
 
     game_id = Column(Integer, primary_key=True, index=True)
     playlist_id = Column(String(100), nullable=True)  # Spotify playlist ID
-    current_track_index = Column(Integer, default=0, nullable=False)  # Track position in playlist
+    current_track_index = Column(Integer, default=0, nullable=False)  # Next slot to draw from the game's track deck
     all_time_dj_participant_id = Column(Integer, ForeignKey("participant.participant_id"), nullable=True)  # Optional all-time DJ
     songs_per_round = Column(Integer, default=10, nullable=False)  # Number of songs per round
     started_at = Column(DateTime(timezone=True), nullable=True)
@@ -24,6 +28,7 @@ class Game(Base):
         foreign_keys="Participant.game_id"
     )
     rounds = relationship("Round", back_populates="game", cascade="all, delete-orphan")
+    track_deck = relationship("GameTrackDeck", back_populates="game", uselist=False, cascade="all, delete-orphan")
     all_time_dj = relationship(
         "Participant",
         foreign_keys=[all_time_dj_participant_id],
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, DateTime, Index, func
+from ..database import Base
+
+class GameScoreTotal(Base):
+    """A participant's score in one game, maintained by ScoreTotalsMethods.
+
+    One row per participant who was on at least one team. Denormalized (no
+    foreign keys): rows are written in the same transaction as the songs and
+    team memberships they summarize, and `python -m backend.score_totals check`
+    compares them with the source tables.
+    """
+    __tablename__ = "game_score_totals"
+    __table_args__ = (
+        # A player's games (player totals, date-filtered leaderboard)
+        Index("ix_game_score_totals_player_id", "player_id"),
+        Index("ix_game_score_totals_game_id", "game_id"),
+    )
+
+    participant_id = Column(Integer, primary_key=True, autoincrement=False)
+    game_id = Column(Integer, nullable=False)
+    player_id = Column(Integer, nullable=False)
+    total_score = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, BigInteger, String, LargeBinary, DateTime, ForeignKey, func
+from sqlalchemy.orm import relationship
+from ..database import Base
+
+class GameTrackDeck(Base):
+    __tablename__ = "game_track_deck"
+
+    game_id = Column(Integer, ForeignKey("game.game_id", ondelete="CASCADE"), primary_key=True)
+    playlist_id = Column(String(100), nullable=False)  # Spotify playlist the positions belong to
+    seed = Column(BigInteger, nullable=False)  # Seed of the current shuffle
+    cycle = Column(Integer, default=0, nullable=False)  # Times the deck has been reshuffled
+    size = Column(Integer, nullable=False)
+    positions = Column(LargeBinary(16 * 1024 * 1024), nullable=False)  # Packed little-endian uint32 playlist positions
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    # Relationships
+    game = relationship("Game", back_populates="track_deck")
@@ -1,9 +1,13 @@
-from sqlalchemy import Column, Integer, DateTime, func, ForeignKey
+from sqlalchemy import Column, Integer, DateTime, func, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from ..database import Base
 
 class Participant(Base):
     __tablename__ = "participant"
+    __table_args__ = (
+        # Participants of a game in seat order
+        Index("ix_participant_game_seat", "game_id", "seat_number"),
+    )
 
     participant_id = Column(Integer, primary_key=True, index=True)
     game_id = Column(Integer, ForeignKey("game.game_id", ondelete="CASCADE"), nullable=False)
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, DateTime, Index, func
+from ..database import Base
+
+class PlayerScoreTotal(Base):
+    """A player's all-time score and games played, maintained by ScoreTotalsMethods.
+
+    The sum of the player's GameScoreTotal rows; a player without games has no row.
+    """
+    __tablename__ = "player_score_totals"
+    __table_args__ = (
+        # Top-N leaderboard straight off the index
+        Index("ix_player_score_totals_score", "total_score", "player_id"),
+    )
+
+    player_id = Column(Integer, primary_key=True, autoincrement=False)
+    total_score = Column(Integer, default=0, nullable=False)
+    games_played = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, String, DateTime, func
+from sqlalchemy.orm import relationship
+from ..database import Base
+
+class PlaylistMirror(Base):
+    __tablename__ = "playlist_mirror"
+
+    playlist_id = Column(String(100), primary_key=True)  # Spotify playlist ID
+    snapshot_id = Column(String(100), nullable=True)  # Spotify snapshot the mirrored tracks belong to
+    name = Column(String(255), nullable=True)
+    track_count = Column(Integer, default=0, nullable=False)
+    synced_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    # Relationships
+    tracks = relationship(
+        "PlaylistMirrorTrack",
+        back_populates="playlist",
+        cascade="all, delete-orphan",
+        order_by="PlaylistMirrorTrack.position"
+    )
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, UniqueConstraint, func
+from sqlalchemy.orm import relationship
+from ..database import Base
+
+class PlaylistMirrorTrack(Base):
+    __tablename__ = "playlist_mirror_track"
+    __table_args__ = (
+        UniqueConstraint("playlist_id", "track_index", name="uq_playlist_mirror_track_index"),
+        Index("ix_playlist_mirror_track_spotify", "playlist_id", "spotify_track_id"),
+        Index("ix_playlist_mirror_track_position", "playlist_id", "position"),
+    )
+
+    playlist_mirror_track_id = Column(Integer, primary_key=True, index=True)
+    playlist_id = Column(String(100), ForeignKey("playlist_mirror.playlist_id", ondelete="CASCADE"), nullable=False)
+    track_index = Column(Integer, nullable=False)  # Dense 0..n-1 index over playable tracks
+    position = Column(Integer, nullable=False)  # Position in the Spotify playlist (usable as a playback offset)
+    spotify_track_id = Column(String(100), nullable=False)
+    title = Column(String(255), nullable=False)
+    artists = Column(String(500), nullable=False)  # Comma-separated artist names
+    album = Column(String(255), nullable=True)
+    duration_ms = Column(Integer, nullable=False, default=0)
+    popularity = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Relationships
+    playlist = relationship("PlaylistMirror", back_populates="tracks")
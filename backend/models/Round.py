@@ -1,9 +1,15 @@
-from sqlalchemy import Column, Integer, DateTime, Boolean, func, ForeignKey
+from sqlalchemy import Column, Integer, DateTime, Boolean, func, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from ..database import Base
 
 class Round(Base):
     __tablename__ = "round"
+    __table_args__ = (
+        # Active round of a game
+        Index("ix_round_game_complete", "game_id", "is_complete"),
+        # Rounds of a game in order
+        Index("ix_round_game_number", "game_id", "round_number"),
+    )
 
     round_id = Column(Integer, primary_key=True, index=True)
     game_id = Column(Integer, ForeignKey("game.game_id", ondelete="CASCADE"), nullable=False)
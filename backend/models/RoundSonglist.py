@@ -1,10 +1,17 @@
-from sqlalchemy import Column, Integer, DateTime, func, Boolean, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, DateTime, func, Boolean, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from ..database import Base
 from .Enums import ScoreType
 
 class RoundSonglist(Base):
     __tablename__ = "round_songlist"
+    __table_args__ = (
+        # Songs of a round (round details, selectinload of Round.round_songlists)
+        Index("ix_round_songlist_round_id", "round_id"),
+        # Points per team (leaderboard) without touching the table rows
+        Index("ix_round_songlist_team_scoring", "round_team_id", "correct_artist_guess",
+              "correct_song_title_guess", "bonus_correct_movie_guess"),
+    )
 
     round_songlist_id = Column(Integer, primary_key=True, index=True)
     round_id = Column(Integer, ForeignKey("round.round_id", ondelete="CASCADE"), nullable=False)
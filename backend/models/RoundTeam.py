@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, DateTime, func, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, DateTime, func, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from ..database import Base
 from .Enums import Role
 
 class RoundTeam(Base):
     __tablename__ = "round_team"
+    __table_args__ = (
+        # Teams of a round, and the team playing a given role in it
+        Index("ix_round_team_round_role", "round_id", "role"),
+    )
 
     round_team_id = Column(Integer, primary_key=True, index=True)
     round_id = Column(Integer, ForeignKey("round.round_id", ondelete="CASCADE"), nullable=False)
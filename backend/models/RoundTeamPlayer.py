@@ -1,9 +1,14 @@
-from sqlalchemy import Column, Integer, DateTime, func, ForeignKey
+from sqlalchemy import Column, Integer, DateTime, func, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from ..database import Base
 
 class RoundTeamPlayer(Base):
     __tablename__ = "round_team_player"
+    __table_args__ = (
+        Index("ix_round_team_player_round_team_id", "round_team_id"),
+        # Cascade deletes from participant
+        Index("ix_round_team_player_participant_id", "participant_id"),
+    )
 
     round_team_player_id = Column(Integer, primary_key=True, index=True)
     round_team_id = Column(Integer, ForeignKey("round_team.round_team_id", ondelete="CASCADE"), nullable=False)
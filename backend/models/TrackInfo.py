@@ -1,9 +1,15 @@
-from sqlalchemy import Column, Integer, DateTime, func, ForeignKey
+from sqlalchemy import Column, Integer, DateTime, func, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from ..database import Base
 
 class TrackInfo(Base):
     __tablename__ = "track_info"
+    __table_args__ = (
+        # One row per song/artist pair; the conflict target of the track info upsert
+        UniqueConstraint("song_id", "artist_id", name="uq_track_info_song_artist"),
+        # Artist.track_infos and cascade deletes from artist
+        Index("ix_track_info_artist_id", "artist_id"),
+    )
 
     track_info_id = Column(Integer, primary_key=True, index=True)
     song_id = Column(Integer, ForeignKey("song.song_id", ondelete="CASCADE"), nullable=False)
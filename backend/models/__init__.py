@@ -10,6 +10,11 @@ from .TrackInfo import TrackInfo
 from .RoundSonglist import RoundSonglist
 from .Enums import ScoreType, Role
 from .GameplaySettings import GameplaySettings
+from .PlaylistMirror import PlaylistMirror
+from .PlaylistMirrorTrack import PlaylistMirrorTrack
+from .GameTrackDeck import GameTrackDeck
+from .GameScoreTotal import GameScoreTotal
+from .PlayerScoreTotal import PlayerScoreTotal
 
 __all__ = [
     "Player",
@@ -24,5 +29,10 @@ __all__ = [
     "RoundSonglist",
     "ScoreType",
     "Role",
-    "GameplaySettings"
+    "GameplaySettings",
+    "PlaylistMirror",
+    "PlaylistMirrorTrack",
+    "GameTrackDeck",
+    "GameScoreTotal",
+    "PlayerScoreTotal"
 ]
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from typing import List
 from ..models.Artist import Artist
 from ..schemas import ArtistBase
+from ..methods.UpsertMethods import upsert
 from .. import database
 
 router = APIRouter(prefix="/artists", tags=["artists"])
@@ -22,25 +23,14 @@ def get_artist(artist_id: int, db: Session = Depends(database.get_db)):
 
 @router.post("/", response_model=ArtistBase.Artist, status_code=201)
 def create_artist(artist: ArtistBase.ArtistCreate, db: Session = Depends(database.get_db)):
-    """Create an artist (or return existing if spotify_id exists)"""
-    # Check if artist already exists
-    existing = db.query(Artist).filter(Artist.spotify_id == artist.spotify_id).first()
-    if existing:
-        # Update name if it's different
-        if existing.name != artist.name:
-            existing.name = artist.name
-            db.commit()
-            db.refresh(existing)
-        return existing
-    
-    db_artist = Artist(
-        spotify_id=artist.spotify_id,
-        name=artist.name
+    """Create an artist (or return existing if spotify_id exists, updating its name)"""
+    return upsert(
+        db, Artist,
+        {"spotify_id": artist.spotify_id, "name": artist.name},
+        conflict_columns=["spotify_id"],
+        update_columns=["name"],
+        commit=True
     )
-    db.add(db_artist)
-    db.commit()
-    db.refresh(db_artist)
-    return db_artist
 
 @router.put("/{artist_id}", response_model=ArtistBase.Artist)
 def update_artist(
@@ -0,0 +1,57 @@
+import asyncio
+import json
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session
+from ..methods import CatalogMethods
+from ..schemas import CatalogBase
+from .. import database
+
+router = APIRouter(prefix="/catalog", tags=["catalog"])
+
+@router.post("/tracks", response_model=CatalogBase.CatalogIngestResult, status_code=201)
+def ingest_tracks(
+    ingest: CatalogBase.CatalogIngest,
+    chunk_size: int = Query(CatalogMethods.CHUNK_SIZE, ge=1, le=5000),
+    db: Session = Depends(database.get_db)
+):
+    """Upsert the artists, songs and track infos of a batch of Spotify tracks"""
+    return CatalogMethods.ingest_tracks(db, ingest.tracks, chunk_size=chunk_size)
+
+@router.post("/tracks/ndjson", response_model=CatalogBase.CatalogIngestResult, status_code=201)
+async def ingest_tracks_ndjson(
+    request: Request,
+    chunk_size: int = Query(CatalogMethods.CHUNK_SIZE, ge=1, le=5000),
+    db: Session = Depends(database.get_db)
+):
+    """Upsert Spotify tracks streamed as newline-delimited JSON, one track per line.
+
+    Each chunk is committed as soon as it has been read, so the body is never held
+    in memory. A line that is not JSON stops the ingestion with a 400; the chunks
+    before it are already committed.
+    """
+    result = CatalogMethods.new_result()
+    chunk = []
+    pending = b""
+    line_number = 0
+
+    def parse(line: bytes):
+        try:
+            return json.loads(line)
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Line {line_number} is not valid JSON")
+
+    async for data in request.stream():
+        *lines, pending = (pending + data).split(b"\n")
+        for line in lines:
+            line_number += 1
+            if line.strip():
+                chunk.append(parse(line))
+            if len(chunk) >= chunk_size:
+                await asyncio.to_thread(CatalogMethods.ingest_chunk, db, chunk, result)
+                chunk = []
+    if pending.strip():
+        line_number += 1
+        chunk.append(parse(pending))
+    if chunk:
+        await asyncio.to_thread(CatalogMethods.ingest_chunk, db, chunk, result)
+    return result
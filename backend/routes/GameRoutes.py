@@ -1,62 +1,113 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
-from ..methods import GameMethods
-from ..schemas import GameBase
+from typing import List, Optional
+from ..methods import AsyncGameMethods, GameMethods, GameSummaryMethods, GameTrackDeckMethods, PlaylistMirrorMethods
+from ..schemas import GameBase, GameTrackDeckBase
 from .. import database
 
 router = APIRouter(prefix="/games", tags=["games"])
 
 @router.get("/", response_model=List[GameBase.Game])
-def list_games(skip: int = 0, limit: int = 100, db: Session = Depends(database.get_db)):
+async def list_games(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(database.get_async_db)):
     """Get all games (without relationships for performance)"""
-    return GameMethods.get_games(db, skip=skip, limit=limit)
+    return await AsyncGameMethods.get_games(db, skip=skip, limit=limit)
+
+@router.get("/summaries", response_model=GameBase.GameSummaryPage)
+def list_game_summaries(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: Session = Depends(database.get_db)
+):
+    """Game history, newest first: participants, final scores, winner and rounds played.
+
+    Pass the returned next_cursor to get the following page; it is null on the last one.
+    """
+    try:
+        games, next_cursor = GameSummaryMethods.get_game_summaries(db, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"games": games, "next_cursor": next_cursor}
 
 @router.get("/{game_id}", response_model=GameBase.Game)
-def get_game(game_id: int, db: Session = Depends(database.get_db)):
+async def get_game(game_id: int, db: AsyncSession = Depends(database.get_async_db)):
     """Get a single game"""
-    game = GameMethods.get_game(db, game_id=game_id)
+    game = await AsyncGameMethods.get_game(db, game_id=game_id)
     if game is None:
         raise HTTPException(status_code=404, detail="Game not found")
     return game
 
 @router.get("/{game_id}/with-participants", response_model=GameBase.GameWithParticipants)
-def get_game_with_participants(game_id: int, db: Session = Depends(database.get_db)):
+async def get_game_with_participants(game_id: int, db: AsyncSession = Depends(database.get_async_db)):
     """Get game with all participants and their player details"""
-    game = GameMethods.get_game_with_participants(db, game_id=game_id)
+    game = await AsyncGameMethods.get_game_with_participants(db, game_id=game_id)
     if game is None:
         raise HTTPException(status_code=404, detail="Game not found")
     return game
 
 @router.get("/{game_id}/full", response_model=GameBase.GameFull)
-def get_game_full(game_id: int, db: Session = Depends(database.get_db)):
+async def get_game_full(game_id: int, db: AsyncSession = Depends(database.get_async_db)):
     """Get game with all relationships (participants and rounds)"""
-    game = GameMethods.get_game_full(db, game_id=game_id)
+    game = await AsyncGameMethods.get_game_full(db, game_id=game_id)
     if game is None:
         raise HTTPException(status_code=404, detail="Game not found")
     return game
 
 @router.post("/", response_model=GameBase.Game, status_code=201)
-def create_game(game: GameBase.GameCreate, db: Session = Depends(database.get_db)):
+async def create_game(game: GameBase.GameCreate, db: AsyncSession = Depends(database.get_async_db)):
     """Create a new game"""
-    return GameMethods.create_game(db=db, game=game)
+    return await AsyncGameMethods.create_game(db=db, game=game)
 
 @router.put("/{game_id}", response_model=GameBase.Game)
-def update_game(
+async def update_game(
     game_id: int,
     game: GameBase.GameUpdate,
-    db: Session = Depends(database.get_db)
+    db: AsyncSession = Depends(database.get_async_db)
 ):
     """Update a game"""
-    db_game = GameMethods.update_game(db=db, game_id=game_id, game=game)
+    db_game = await AsyncGameMethods.update_game(db=db, game_id=game_id, game=game)
     if db_game is None:
         raise HTTPException(status_code=404, detail="Game not found")
     return db_game
 
 @router.delete("/{game_id}")
-def delete_game(game_id: int, db: Session = Depends(database.get_db)):
+async def delete_game(game_id: int, db: AsyncSession = Depends(database.get_async_db)):
     """Delete a game (cascades to participants and rounds)"""
-    db_game = GameMethods.delete_game(db, game_id=game_id)
+    db_game = await AsyncGameMethods.delete_game(db, game_id=game_id)
     if db_game is None:
         raise HTTPException(status_code=404, detail="Game not found")
-    return {"message": "Game deleted successfully"}
\ No newline at end of file
+    return {"message": "Game deleted successfully"}
+
+@router.post("/{game_id}/deck", response_model=GameTrackDeckBase.GameTrackDeck, status_code=201)
+def create_track_deck(
+    game_id: int,
+    deck: GameTrackDeckBase.GameTrackDeckCreate,
+    db: Session = Depends(database.get_db)
+):
+    """Shuffle a new non-repeating track deck for the game"""
+    if GameMethods.get_game(db, game_id=game_id) is None:
+        raise HTTPException(status_code=404, detail="Game not found")
+    if deck.track_count is not None:
+        positions = list(range(deck.track_count))
+    else:
+        positions = PlaylistMirrorMethods.get_positions(db, deck.playlist_id)
+        if not positions:
+            raise HTTPException(status_code=409, detail="Playlist not mirrored yet; sync it or pass track_count")
+    return GameTrackDeckMethods.create_deck(db, game_id, deck.playlist_id, positions, seed=deck.seed)
+
+@router.get("/{game_id}/deck", response_model=GameTrackDeckBase.GameTrackDeck)
+def get_track_deck(game_id: int, db: Session = Depends(database.get_db)):
+    """Get the game's track deck"""
+    deck = GameTrackDeckMethods.get_deck(db, game_id)
+    if deck is None:
+        raise HTTPException(status_code=404, detail="Track deck not found")
+    return deck
+
+@router.post("/{game_id}/deck/draw", response_model=GameTrackDeckBase.GameTrackDeckDraw)
+def draw_from_track_deck(game_id: int, db: Session = Depends(database.get_db)):
+    """Draw the next playlist position (no repeats until the whole deck is played)"""
+    drawn = GameTrackDeckMethods.draw_next_position(db, game_id)
+    if drawn is None:
+        raise HTTPException(status_code=404, detail="Track deck not found")
+    index, position = drawn
+    return GameTrackDeckBase.GameTrackDeckDraw(index=index, position=position)
\ No newline at end of file
@@ -1,66 +1,96 @@
 # backend/routes/GameplaySettingsRoutes.py
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
-from ..methods.GameplaySettingsMethods import (
-    get_setting_by_key,
-    get_all_settings,
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from ..methods.AsyncGameplaySettingsMethods import (
+    get_settings_snapshot,
     create_setting,
     update_setting,
     upsert_setting,
+    bulk_upsert_settings,
     delete_setting
 )
 from ..schemas.GameplaySettingsBase import (
     GameplaySettings,
+    GameplaySettingsBase,
     GameplaySettingsCreate,
     GameplaySettingsUpdate
 )
-from ..database import get_db
+from ..database import get_async_db
 
 router = APIRouter(prefix="/gameplay-settings", tags=["gameplay-settings"])
 
+def _not_modified(request: Request, response: Response, version: str) -> bool:
+    """Tag the response with the snapshot version; True if the client's copy is current"""
+    etag = f'"{version}"'
+    response.headers["ETag"] = etag
+    return request.headers.get("if-none-match") == etag
+
 @router.get("/", response_model=List[GameplaySettings])
-def list_settings(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """Get all gameplay settings"""
-    return get_all_settings(db, skip=skip, limit=limit)
+async def list_settings(
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    keys: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get gameplay settings from the cached snapshot
+
+    `?keys=a,b,c` returns just those keys in one request. Answers 304 when
+    If-None-Match carries the current snapshot ETag.
+    """
+    key_list = [key for key in keys.split(",") if key] if keys else None
+    version, settings = await get_settings_snapshot(db, key_list)
+    if _not_modified(request, response, version):
+        return Response(status_code=304, headers={"ETag": response.headers["ETag"]})
+    return settings if key_list is not None else settings[skip:skip + limit]
+
+@router.put("/", response_model=List[GameplaySettings])
+async def bulk_update_settings(settings: List[GameplaySettingsBase], db: AsyncSession = Depends(get_async_db)):
+    """Create or update several settings in one transaction"""
+    return await bulk_upsert_settings(db, settings)
 
 @router.get("/{key}", response_model=GameplaySettings)
-def get_setting(key: str, db: Session = Depends(get_db)):
+async def get_setting(key: str, request: Request, response: Response,
+                      db: AsyncSession = Depends(get_async_db)):
     """Get a specific setting by key"""
-    setting = get_setting_by_key(db, key)
-    if setting is None:
+    version, settings = await get_settings_snapshot(db, [key])
+    if not settings:
         raise HTTPException(status_code=404, detail=f"Setting '{key}' not found")
-    return setting
+    if _not_modified(request, response, version):
+        return Response(status_code=304, headers={"ETag": response.headers["ETag"]})
+    return settings[0]
 
 @router.post("/", response_model=GameplaySettings, status_code=201)
-def create_new_setting(setting: GameplaySettingsCreate, db: Session = Depends(get_db)):
+async def create_new_setting(setting: GameplaySettingsCreate, db: AsyncSession = Depends(get_async_db)):
     """Create a new setting"""
     try:
-        return create_setting(db, setting)
+        return await create_setting(db, setting)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.put("/{key}", response_model=GameplaySettings)
-def update_existing_setting(
+async def update_existing_setting(
     key: str,
     setting: GameplaySettingsUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update an existing setting"""
-    db_setting = update_setting(db, key, setting)
+    db_setting = await update_setting(db, key, setting)
     if db_setting is None:
         raise HTTPException(status_code=404, detail=f"Setting '{key}' not found")
     return db_setting
 
 @router.put("/{key}/upsert", response_model=GameplaySettings)
-def upsert_setting_route(key: str, value: str, db: Session = Depends(get_db)):
+async def upsert_setting_route(key: str, value: str, db: AsyncSession = Depends(get_async_db)):
     """Create or update a setting (upsert)"""
-    return upsert_setting(db, key, value)
+    return await upsert_setting(db, key, value)
 
 @router.delete("/{key}")
-def delete_existing_setting(key: str, db: Session = Depends(get_db)):
+async def delete_existing_setting(key: str, db: AsyncSession = Depends(get_async_db)):
     """Delete a setting"""
-    db_setting = delete_setting(db, key)
+    db_setting = await delete_setting(db, key)
     if db_setting is None:
         raise HTTPException(status_code=404, detail=f"Setting '{key}' not found")
     return {"message": f"Setting '{key}' deleted successfully"}
\ No newline at end of file
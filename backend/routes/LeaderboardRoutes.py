@@ -0,0 +1,26 @@
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from ..methods import LeaderboardMethods
+from ..schemas import LeaderboardBase
+from .. import database
+
+router = APIRouter(prefix="/leaderboard", tags=["leaderboard"])
+
+@router.get("/", response_model=List[LeaderboardBase.LeaderboardEntry])
+def get_leaderboard(
+    limit: int = Query(10, ge=1, le=100),
+    since: Optional[datetime] = Query(None, description="Only games played at or after this time"),
+    until: Optional[datetime] = Query(None, description="Only games played before this time"),
+    min_games: int = Query(1, ge=1, description="Leave out players with fewer games"),
+    db: Session = Depends(database.get_db)
+):
+    """Top players by total score across all games (or the games in a date range)"""
+    if since is not None and until is not None and since >= until:
+        raise HTTPException(status_code=400, detail="'since' must be before 'until'")
+    rows = LeaderboardMethods.get_leaderboard(db, limit=limit, since=since, until=until, min_games=min_games)
+    return [
+        {"rank": rank, "player": player, "total_score": total_score, "games_played": games_played}
+        for rank, (player, total_score, games_played) in enumerate(rows, start=1)
+    ]
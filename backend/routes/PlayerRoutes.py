@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from ..methods import PlayerMethods
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..methods import AsyncPlayerMethods
 from ..schemas import PlayerBase
 from .. import database
 
@@ -9,30 +9,30 @@ router = APIRouter(
 )
 
 @router.get("/", response_model=list[PlayerBase.Player])
-def read_players(skip: int = 0, limit: int = 100, db: Session = Depends(database.get_db)):
-    return PlayerMethods.get_players(db, skip=skip, limit=limit)
+async def read_players(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(database.get_async_db)):
+    return await AsyncPlayerMethods.get_players(db, skip=skip, limit=limit)
 
 @router.get("/{player_id}", response_model=PlayerBase.Player)
-def read_player(player_id: int, db: Session = Depends(database.get_db)):
-    db_player = PlayerMethods.get_player(db, player_id=player_id)
+async def read_player(player_id: int, db: AsyncSession = Depends(database.get_async_db)):
+    db_player = await AsyncPlayerMethods.get_player(db, player_id=player_id)
     if db_player is None:
         raise HTTPException(status_code=404, detail="Player not found")
     return db_player
 
 @router.post("/", response_model=PlayerBase.Player)
-def create_player(player: PlayerBase.PlayerCreate, db: Session = Depends(database.get_db)):
-    return PlayerMethods.create_player(db=db, player=player)
+async def create_player(player: PlayerBase.PlayerCreate, db: AsyncSession = Depends(database.get_async_db)):
+    return await AsyncPlayerMethods.create_player(db=db, player=player)
 
 @router.put("/{player_id}", response_model=PlayerBase.Player)
-def update_player(player_id: int, player: PlayerBase.PlayerUpdate, db: Session = Depends(database.get_db)):
-    db_player = PlayerMethods.update_player(db=db, player_id=player_id, player=player)
+async def update_player(player_id: int, player: PlayerBase.PlayerUpdate, db: AsyncSession = Depends(database.get_async_db)):
+    db_player = await AsyncPlayerMethods.update_player(db=db, player_id=player_id, player=player)
     if db_player is None:
         raise HTTPException(status_code=404, detail="Player not found")
     return db_player
 
 @router.delete("/{player_id}")
-def delete_player(player_id: int, db: Session = Depends(database.get_db)):
-    db_player = PlayerMethods.delete_player(db, player_id=player_id)
+async def delete_player(player_id: int, db: AsyncSession = Depends(database.get_async_db)):
+    db_player = await AsyncPlayerMethods.delete_player(db, player_id=player_id)
     if db_player is None:
         raise HTTPException(status_code=404, detail="Player not found")
     return {"message": "Player deleted"}
\ No newline at end of file
@@ -0,0 +1,51 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import List
+from ..methods import PlaylistMirrorMethods
+from ..schemas import PlaylistMirrorBase
+from .. import database
+
+router = APIRouter(prefix="/playlist-mirror", tags=["playlist-mirror"])
+
+@router.get("/{playlist_id}", response_model=PlaylistMirrorBase.PlaylistMirror)
+def get_mirror(playlist_id: str, db: Session = Depends(database.get_db)):
+    """Get the sync state and track count of a mirrored playlist"""
+    mirror = PlaylistMirrorMethods.get_mirror(db, playlist_id)
+    if mirror is None:
+        raise HTTPException(status_code=404, detail="Playlist has not been mirrored yet")
+    return mirror
+
+@router.get("/{playlist_id}/tracks", response_model=List[PlaylistMirrorBase.PlaylistMirrorTrack])
+def list_tracks(
+    playlist_id: str,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(database.get_db)
+):
+    """Get mirrored tracks in playlist order"""
+    return PlaylistMirrorMethods.get_tracks(db, playlist_id, skip=skip, limit=limit)
+
+@router.get("/{playlist_id}/random", response_model=List[PlaylistMirrorBase.PlaylistMirrorTrack])
+def get_random_tracks(
+    playlist_id: str,
+    count: int = Query(1, ge=1, le=100),
+    db: Session = Depends(database.get_db)
+):
+    """Pick distinct random tracks from the mirror"""
+    return PlaylistMirrorMethods.get_random_tracks(db, playlist_id, count=count)
+
+@router.get("/{playlist_id}/positions/{position}", response_model=PlaylistMirrorBase.PlaylistMirrorTrack)
+def get_track_at_position(playlist_id: str, position: int, db: Session = Depends(database.get_db)):
+    """Get the track at a Spotify playlist position"""
+    track = PlaylistMirrorMethods.get_track_at_position(db, playlist_id, position)
+    if track is None:
+        raise HTTPException(status_code=404, detail="Track not found")
+    return track
+
+@router.get("/{playlist_id}/spotify/{spotify_track_id}", response_model=PlaylistMirrorBase.PlaylistMirrorTrack)
+def get_track_by_spotify_id(playlist_id: str, spotify_track_id: str, db: Session = Depends(database.get_db)):
+    """Look up a mirrored track by its Spotify ID"""
+    track = PlaylistMirrorMethods.get_track_by_spotify_id(db, playlist_id, spotify_track_id)
+    if track is None:
+        raise HTTPException(status_code=404, detail="Track not found")
+    return track
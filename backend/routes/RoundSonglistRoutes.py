@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 from typing import List
 from ..models.RoundSonglist import RoundSonglist
 from ..schemas import RoundSonglistBase
+from ..methods import RoundSonglistMethods
 from .. import database
 
 router = APIRouter(prefix="/round-songlists", tags=["round-songlists"])
@@ -48,6 +50,17 @@ def create_round_songlist(
     db.refresh(db_songlist)
     return db_songlist
 
+@router.post("/played", response_model=RoundSonglistBase.RoundSonglistWithDetails, status_code=201)
+def record_played_track(played: RoundSonglistBase.RecordPlayedTrack, db: Session = Depends(database.get_db)):
+    """Save a played Spotify track (artist, song, track info and songlist entry) in one transaction"""
+    try:
+        return RoundSonglistMethods.record_played_track(db, played.round_id, played.round_team_id, played.track)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Round or round team not found")
+
 @router.put("/{round_songlist_id}", response_model=RoundSonglistBase.RoundSonglist)
 def update_round_songlist(
     round_songlist_id: int,
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from typing import List
 from ..models.Song import Song
 from ..schemas import SongBase
+from ..methods.UpsertMethods import upsert
 from .. import database
 
 router = APIRouter(prefix="/songs", tags=["songs"])
@@ -22,25 +23,14 @@ def get_song(song_id: int, db: Session = Depends(database.get_db)):
 
 @router.post("/", response_model=SongBase.Song, status_code=201)
 def create_song(song: SongBase.SongCreate, db: Session = Depends(database.get_db)):
-    """Create a song (or return existing if spotify_id exists)"""
-    # Check if song already exists
-    existing = db.query(Song).filter(Song.spotify_id == song.spotify_id).first()
-    if existing:
-        # Update title if it's different
-        if existing.title != song.title:
-            existing.title = song.title
-            db.commit()
-            db.refresh(existing)
-        return existing
-    
-    db_song = Song(
-        spotify_id=song.spotify_id,
-        title=song.title
+    """Create a song (or return existing if spotify_id exists, updating its title)"""
+    return upsert(
+        db, Song,
+        {"spotify_id": song.spotify_id, "title": song.title},
+        conflict_columns=["spotify_id"],
+        update_columns=["title"],
+        commit=True
     )
-    db.add(db_song)
-    db.commit()
-    db.refresh(db_song)
-    return db_song
 
 @router.put("/{song_id}", response_model=SongBase.Song)
 def update_song(
@@ -1,5 +1,6 @@
 # backend/routes/SpotifyAuthRoutes.py
-from fastapi import APIRouter, HTTPException, Depends
+import asyncio
+from fastapi import APIRouter, HTTPException, Depends, Request
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 import requests
@@ -10,12 +11,16 @@ from urllib.parse import urlencode
 from datetime import datetime, timedelta
 from ..config import get_settings
 from ..database import get_db
-from ..methods.GameplaySettingsMethods import get_setting_by_key, upsert_setting
+from ..methods.GameplaySettingsMethods import upsert_setting
+from ..services.SpotifyTokenStore import spotify_token_store
+from ..services.SpotifyTokenRefresher import SpotifyTokenRefreshError
+from .. import database
 
 router = APIRouter(prefix="/api/spotify/auth", tags=["spotify-auth"])
 
-# Store state tokens temporarily (in production, use Redis or database)
-state_tokens = {}
+# OAuth state tokens live in the app's shared cache so any worker can finish the flow
+STATE_KEY_PREFIX = "oauth_state:"
+STATE_TTL_SECONDS = 600
 
 settings = get_settings()
 
@@ -39,12 +44,12 @@ SCOPES = [
 
 
 @router.get("/login")
-async def spotify_login():
+async def spotify_login(request: Request):
     """Initiate Spotify OAuth flow"""
     
     # Generate random state for CSRF protection
     state = secrets.token_urlsafe(16)
-    state_tokens[state] = True
+    await asyncio.to_thread(request.app.state.shared_cache.set, STATE_KEY_PREFIX + state, b"1", ttl=STATE_TTL_SECONDS)
     
     # Build authorization URL
     params = {
@@ -62,6 +67,7 @@ async def spotify_login():
 
 @router.get("/callback")
 async def spotify_callback(
+    request: Request,
     code: Optional[str] = None, 
     state: Optional[str] = None, 
     error: Optional[str] = None,
@@ -73,12 +79,11 @@ async def spotify_callback(
         print(f"Spotify returned error: {error}")
         return RedirectResponse(url="http://127.0.0.1:3000/settings?error=" + error)
     
-    if not state or state not in state_tokens:
+    # delete() doubles as the check, so a state token can only be used once
+    if not state or not await asyncio.to_thread(request.app.state.shared_cache.delete, STATE_KEY_PREFIX + state):
         print(f"Invalid state token: {state}")
         return RedirectResponse(url="http://127.0.0.1:3000/settings?error=invalid_state")
     
-    del state_tokens[state]
-    
     if not code:
         print("No authorization code provided")
         return RedirectResponse(url="http://127.0.0.1:3000/settings?error=no_code")
@@ -138,25 +143,26 @@ async def spotify_callback(
 
 
 @router.get("/token")
-async def get_user_token(db: Session = Depends(get_db)):
+async def get_user_token(request: Request):
     """Get the current user's access token (refresh if needed)"""
     
     # Check if token exists and is valid
-    token_setting = get_setting_by_key(db, "SPOTIFY_ACCESS_TOKEN")
-    expires_setting = get_setting_by_key(db, "SPOTIFY_TOKEN_EXPIRES_AT")
+    tokens = await spotify_token_store.read_async(database.SessionLocal)
+    access_token = tokens.access_token
+    expires_value = tokens.expires_at
     
-    if not token_setting or not expires_setting:
+    if not access_token or not expires_value:
         raise HTTPException(
             status_code=401, 
             detail="No Spotify token available. Please authorize in settings."
         )
     
     # Check if token is expired
-    expires_at = datetime.fromisoformat(expires_setting.value)
+    expires_at = datetime.fromisoformat(expires_value)
     if datetime.now() >= expires_at:
         # Try to refresh
         try:
-            new_token = await refresh_user_token(db)
+            new_token = await refresh_user_token(request)
             return {"access_token": new_token}
         except:
             raise HTTPException(
@@ -164,49 +170,28 @@ async def get_user_token(db: Session = Depends(get_db)):
                 detail="Token expired and refresh failed. Please re-authorize in settings."
             )
     
-    return {"access_token": token_setting.value}
+    return {"access_token": access_token}
 
 
 @router.post("/refresh")
-async def refresh_user_token(db: Session = Depends(get_db)):
-    """Refresh the user's access token"""
-    
-    refresh_token_setting = get_setting_by_key(db, "SPOTIFY_REFRESH_TOKEN")
+async def refresh_user_token(request: Request):
+    """Refresh the user's access token.
+
+    Shares the background refresher's lock: a call that arrives while a refresh
+    is running gets that refresh's token instead of starting another.
+    """
     
-    if not refresh_token_setting:
+    tokens = await spotify_token_store.read_async(database.SessionLocal)
+    if not tokens.refresh_token:
         raise HTTPException(
             status_code=401, 
             detail="No refresh token available. Please re-authorize in settings."
         )
     
-    token_data = {
-        "grant_type": "refresh_token",
-        "refresh_token": refresh_token_setting.value,
-        "client_id": settings.spotify_client_id,
-        "client_secret": settings.spotify_client_secret
-    }
-    
     try:
-        response = requests.post(SPOTIFY_TOKEN_URL, data=token_data)
-        response.raise_for_status()
-        tokens = response.json()
-        
-        # Calculate new expiration
-        expires_in = tokens.get("expires_in", 3600)
-        expires_at = (datetime.now() + timedelta(seconds=expires_in)).isoformat()
-        
-        # Update token in gameplay_settings
-        upsert_setting(db, "SPOTIFY_ACCESS_TOKEN", tokens["access_token"])
-        upsert_setting(db, "SPOTIFY_TOKEN_EXPIRES_AT", expires_at)
-        
-        # Update refresh token if a new one was provided
-        if "refresh_token" in tokens:
-            upsert_setting(db, "SPOTIFY_REFRESH_TOKEN", tokens["refresh_token"])
-        
-        return tokens["access_token"]
-        
-    except requests.exceptions.RequestException as e:
-        raise HTTPException(status_code=500, detail=f"Failed to refresh token: {str(e)}")
+        return await request.app.state.spotify_token_refresher.refresh()
+    except SpotifyTokenRefreshError as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/logout")
@@ -226,23 +211,24 @@ async def logout(db: Session = Depends(get_db)):
 
 
 @router.get("/status")
-async def auth_status(db: Session = Depends(get_db)):
+async def auth_status():
     """Check if user is authenticated"""
     
-    token_setting = get_setting_by_key(db, "SPOTIFY_ACCESS_TOKEN")
-    expires_setting = get_setting_by_key(db, "SPOTIFY_TOKEN_EXPIRES_AT")
+    tokens = await spotify_token_store.read_async(database.SessionLocal)
+    access_token = tokens.access_token
+    expires_value = tokens.expires_at
     
-    if not token_setting or not expires_setting:
+    if not access_token or not expires_value:
         return {"authenticated": False, "has_token": False}
     
     # Check if token is expired
     try:
-        expires_at = datetime.fromisoformat(expires_setting.value)
+        expires_at = datetime.fromisoformat(expires_value)
         is_valid = datetime.now() < expires_at
         return {
             "authenticated": is_valid,
             "has_token": True,
-            "expires_at": expires_setting.value
+            "expires_at": expires_value
         }
     except:
         return {"authenticated": False, "has_token": True}
\ No newline at end of file
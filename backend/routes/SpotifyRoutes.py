@@ -1,24 +1,60 @@
+import asyncio
+import json
+import httpx
 from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 from pydantic import BaseModel
+from sqlalchemy.orm import Session
 from ..models.Spotify.Artist import Artist
 from ..models.Spotify.Album import Album
 from ..models.Spotify.Track import Track
 from ..models.Spotify.Playlist import Playlist
 from ..models.Spotify.User import User
-from ..services.SpotifyService import SpotifyService
-from ..schemas import SpotifyBase
+from ..services.AsyncSpotifyService import AsyncSpotifyService
+from ..services.SpotifyTokenStore import spotify_token_store
+from ..services import PlaylistMirrorSync, PlaybackOrchestrator
+from ..schemas import SpotifyBase, PlaylistMirrorBase
+from ..methods import RoundMethods, PlaylistMirrorMethods, RoundSonglistMethods, GameTrackDeckMethods
+from ..models.Enums import Role
+from .. import database
 
 router = APIRouter(prefix="/spotify")
 
 
+def build_spotify_service(app, token: str) -> AsyncSpotifyService:
+    """AsyncSpotifyService for `token` wired to the app's shared Spotify plumbing"""
+    return AsyncSpotifyService(
+        token,
+        app.state.spotify_http.client,
+        cache=app.state.spotify_cache,
+        scheduler=app.state.spotify_scheduler,
+        single_flight=app.state.spotify_single_flight
+    )
+
+
 # Dependency to get Spotify service with auth
-async def get_spotify_service(request: Request) -> SpotifyService:
-    """Get SpotifyService with token from middleware"""
+async def get_spotify_service(request: Request) -> AsyncSpotifyService:
+    """Get AsyncSpotifyService with token from middleware"""
     token = getattr(request.state, "spotify_token", None)
     if not token:
         raise HTTPException(status_code=401, detail="No Spotify authentication token available")
-    return SpotifyService(token)
+    return build_spotify_service(request.app, token)
+
+
+def spotify_http_error(e: Exception) -> HTTPException:
+    """Map an upstream Spotify failure onto the HTTP error we return"""
+    if isinstance(e, httpx.HTTPStatusError):
+        upstream = e.response
+        if upstream.status_code == 429:
+            return HTTPException(
+                status_code=429,
+                detail="Spotify rate limit reached, retry later",
+                headers={"Retry-After": upstream.headers.get("Retry-After", "1")}
+            )
+        if upstream.status_code in (401, 403, 404):
+            return HTTPException(status_code=upstream.status_code, detail=str(e))
+    return HTTPException(status_code=500, detail=str(e))
 
 
 # Pydantic models for request bodies
@@ -29,80 +65,119 @@ class TransferPlaybackRequest(BaseModel):
 
 # User routes
 @router.get("/me", response_model=User)
-async def get_current_user(service: SpotifyService = Depends(get_spotify_service)):
+async def get_current_user(service: AsyncSpotifyService = Depends(get_spotify_service)):
     """Get the current user's profile"""
     try:
-        data = service.get_current_user()
+        data = await service.get_current_user()
         return User.from_dict(data)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise spotify_http_error(e)
 
 
 # Player routes
 @router.get("/me/player/currently-playing")
-async def get_currently_playing(service: SpotifyService = Depends(get_spotify_service)):
+async def get_currently_playing(service: AsyncSpotifyService = Depends(get_spotify_service)):
     """Get the currently playing track - returns raw Spotify data"""
     try:
-        data = service.get_currently_playing()
+        data = await service.get_currently_playing()
         if data and data.get('item'):
             return data['item']
         return None
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise spotify_http_error(e)
 
 
 @router.get("/me/player")
-async def get_playback_state(service: SpotifyService = Depends(get_spotify_service)):
+async def get_playback_state(service: AsyncSpotifyService = Depends(get_spotify_service)):
     """Get current playback state"""
     try:
-        data = service.get_playback_state()
+        data = await service.get_playback_state()
         return data
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise spotify_http_error(e)
+
+
+
+@router.get("/me/player/stream")
+async def stream_playback_state(request: Request, service: AsyncSpotifyService = Depends(get_spotify_service)):
+    """Server-Sent Events feed of playback state: a full `state` event, then `diff` events.
+
+    All viewers of one account share a single upstream poller, which polls fast while
+    playing and backs off while paused or idle.
+    """
+    try:
+        account_id = (await service.get_current_user())["id"]
+    except Exception as e:
+        raise spotify_http_error(e)
 
+    app = request.app
+
+    async def current_service() -> Optional[AsyncSpotifyService]:
+        # Re-read the token each poll so the stream outlives token refreshes
+        tokens = await asyncio.to_thread(spotify_token_store.snapshot)
+        token = tokens.access_token if tokens else None
+        return build_spotify_service(app, token) if token else None
+
+    poller = app.state.player_state_hub.poller_for(account_id, current_service)
+    queue = poller.subscribe()
+
+    async def events():
+        try:
+            while not await request.is_disconnected():
+                try:
+                    event, data = await asyncio.wait_for(queue.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+        finally:
+            poller.unsubscribe(queue)
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
 
 @router.get("/me/player/devices")
-async def get_available_devices(service: SpotifyService = Depends(get_spotify_service)):
+async def get_available_devices(service: AsyncSpotifyService = Depends(get_spotify_service)):
     """Get user's available Spotify devices"""
     try:
-        data = service.get_available_devices()
+        data = await service.get_available_devices()
         return data
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise spotify_http_error(e)
 
 
 @router.put("/me/player/transfer")
 async def transfer_playback(
     request: TransferPlaybackRequest,
-    service: SpotifyService = Depends(get_spotify_service)
+    service: AsyncSpotifyService = Depends(get_spotify_service)
 ):
     """Transfer playback to a specific device"""
     try:
-        service.transfer_playback([request.device_id], request.play)
+        await service.transfer_playback([request.device_id], request.play)
         return {"message": "Playback transferred successfully"}
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise spotify_http_error(e)
 
 
 @router.put("/me/player/pause")
-async def pause_playback(service: SpotifyService = Depends(get_spotify_service)):
+async def pause_playback(service: AsyncSpotifyService = Depends(get_spotify_service)):
     """Pause playback on the user's active device"""
     try:
-        service.pause_playback()
+        await service.pause_playback()
         return {"message": "Playback paused"}
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise spotify_http_error(e)
 
 
 @router.put("/me/player/play")
 async def start_playback(
     request: SpotifyBase.PlaybackRequest,
     device_id: Optional[str] = Query(None, description="Device ID to play on"),
-    service: SpotifyService = Depends(get_spotify_service)
+    service: AsyncSpotifyService = Depends(get_spotify_service)
 ):
     """Start or resume playback"""
     try:
-        service.start_playback(
+        await service.start_playback(
             context_uri=request.context_uri,
             uris=request.uris,
             position_ms=request.position_ms,
@@ -111,54 +186,54 @@ async def start_playback(
         )
         return {"message": "Playback started"}
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise spotify_http_error(e)
 
 
 @router.put("/me/player/shuffle")
 async def set_shuffle(
     state: bool = Query(..., description="true to turn on shuffle, false to turn off"),
-    service: SpotifyService = Depends(get_spotify_service)
+    service: AsyncSpotifyService = Depends(get_spotify_service)
 ):
     """Toggle shuffle on or off for user's playback"""
     try:
-        service.set_shuffle(state)
+        await service.set_shuffle(state)
         return {"message": f"Shuffle {'enabled' if state else 'disabled'}"}
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise spotify_http_error(e)
 
 
 @router.post("/me/player/next")
-async def skip_to_next(service: SpotifyService = Depends(get_spotify_service)):
+async def skip_to_next(service: AsyncSpotifyService = Depends(get_spotify_service)):
     """Skip to next track"""
     try:
-        service.skip_to_next()
+        await service.skip_to_next()
         return {"message": "Skipped to next track"}
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise spotify_http_error(e)
 
 
 # Playlist routes  
 @router.get("/me/playlists", response_model=List[Playlist])
 async def get_user_playlists(
     limit: int = Query(50, ge=1, le=50),
-    service: SpotifyService = Depends(get_spotify_service)
+    service: AsyncSpotifyService = Depends(get_spotify_service)
 ):
     """Get current user's playlists"""
     try:
-        data = service.get_user_playlists(limit)
+        data = await service.get_user_playlists(limit)
         return [Playlist.from_dict(playlist) for playlist in data['items']]
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise spotify_http_error(e)
 
 
 @router.get("/playlists/{playlist_id}", response_model=Playlist)
-async def get_playlist(playlist_id: str, service: SpotifyService = Depends(get_spotify_service)):
+async def get_playlist(playlist_id: str, service: AsyncSpotifyService = Depends(get_spotify_service)):
     """Get a playlist by ID including track count"""
     try:
-        data = service.get_playlist(playlist_id)
+        data = await service.get_playlist(playlist_id)
         return Playlist.from_dict(data)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise spotify_http_error(e)
 
 
 @router.get("/playlists/{playlist_id}/tracks/paginated")
@@ -166,11 +241,113 @@ async def get_playlist_tracks_paginated(
     playlist_id: str,
     offset: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    service: SpotifyService = Depends(get_spotify_service)
+    service: AsyncSpotifyService = Depends(get_spotify_service)
 ):
     """Get playlist tracks with pagination"""
     try:
-        data = service.get_playlist_tracks_paginated(playlist_id, offset, limit)
+        data = await service.get_playlist_tracks_paginated(playlist_id, offset, limit)
         return data
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise spotify_http_error(e)
+
+
+
+@router.get("/playlists/{playlist_id}/tracks/stream")
+async def stream_playlist_tracks(
+    playlist_id: str,
+    concurrency: int = Query(4, ge=1, le=8),
+    service: AsyncSpotifyService = Depends(get_spotify_service)
+):
+    """Stream every track of a playlist as NDJSON, one normalized Track per line, in order"""
+    pages = service.iter_playlist_track_pages(
+        playlist_id, PlaylistMirrorSync.PAGE_SIZE, concurrency=concurrency,
+        fields=PlaylistMirrorSync.TRACK_FIELDS
+    )
+    try:
+        # Fetch the first page up front so auth/not-found errors still get a proper status
+        first = await pages.__anext__()
+    except Exception as e:
+        raise spotify_http_error(e)
+
+    def to_lines(page: dict) -> str:
+        return "".join(
+            Track.from_dict(item["track"]).model_dump_json() + "\n"
+            for item in page.get("items", [])
+            if item and item.get("track") and item["track"].get("id")
+        )
+
+    async def ndjson():
+        yield to_lines(first[1])
+        try:
+            async for _, page in pages:
+                yield to_lines(page)
+        except Exception as e:
+            yield json.dumps({"error": str(e)}) + "\n"
+        finally:
+            await pages.aclose()
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+@router.post("/playlists/{playlist_id}/sync", response_model=PlaylistMirrorBase.PlaylistSyncStatus, status_code=202)
+async def sync_playlist_mirror(playlist_id: str, service: AsyncSpotifyService = Depends(get_spotify_service)):
+    """Refresh the local playlist mirror in the background (no-op if snapshot_id is unchanged)"""
+    status = PlaylistMirrorSync.start_sync(service, playlist_id)
+    return PlaylistMirrorBase.PlaylistSyncStatus(playlist_id=playlist_id, status=status)
+
+
+@router.post("/rounds/{round_id}/play-random", response_model=SpotifyBase.PlayRandomTrackResponse)
+async def play_random_track(
+    round_id: int,
+    request: SpotifyBase.PlayRandomTrackRequest,
+    service: AsyncSpotifyService = Depends(get_spotify_service),
+    db: Session = Depends(database.get_db)
+):
+    """Play the next track from the game's shuffled deck and record it on the round in one call"""
+    round_obj = await asyncio.to_thread(RoundMethods.get_round, db, round_id)
+    if round_obj is None:
+        raise HTTPException(status_code=404, detail="Round not found")
+    game_id = round_obj.game_id
+
+    round_team_id = request.round_team_id
+    if round_team_id is None:
+        player_team = await asyncio.to_thread(RoundMethods.get_round_team_by_role, db, round_id, Role.PLAYER)
+        if player_team is None:
+            raise HTTPException(status_code=404, detail="No player team found in round")
+        round_team_id = player_team.round_team_id
+
+    try:
+        # Resync in the background if the playlist changed on Spotify; decks are re-dealt when it lands
+        PlaylistMirrorSync.refresh_if_stale(service, request.playlist_id)
+        # Draw from the game's shuffled deck so songs don't repeat
+        drawn = await asyncio.to_thread(GameTrackDeckMethods.draw_for_playlist, db, game_id, request.playlist_id)
+        if drawn is None:
+            # Not mirrored yet: deal the deck from the playlist's track total
+            playlist = await service.get_playlist(request.playlist_id)
+            positions = list(range(playlist["tracks"]["total"]))
+            await asyncio.to_thread(GameTrackDeckMethods.create_deck, db, game_id, request.playlist_id, positions)
+            drawn = await asyncio.to_thread(GameTrackDeckMethods.draw_next_position, db, game_id)
+            if drawn is None:
+                raise HTTPException(status_code=409, detail="Playlist has no tracks")
+        position = drawn[1]
+
+        # With a mirror we know exactly which track to wait for
+        mirrored = await asyncio.to_thread(PlaylistMirrorMethods.get_track_at_position, db, request.playlist_id, position)
+        expected_track_id = mirrored.spotify_track_id if mirrored else None
+
+        track = await PlaybackOrchestrator.play_playlist_position(
+            service, request.playlist_id, position,
+            device_id=request.device_id, expected_track_id=expected_track_id
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise spotify_http_error(e)
+
+    if track is None:
+        # Nothing is recorded: the round only gets tracks Spotify confirmed playing
+        raise HTTPException(status_code=504, detail="Spotify did not start the drawn track in time")
+
+    songlist = await asyncio.to_thread(
+        RoundSonglistMethods.record_played_track, db, round_id, round_team_id, track
+    )
+    return SpotifyBase.PlayRandomTrackResponse(position=position, track=track, round_songlist=songlist)
\ No newline at end of file
@@ -1,10 +1,10 @@
 # Save as: backend/routes/TrackInfoRoutes.py
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
 from typing import List
 from ..models.TrackInfo import TrackInfo
 from ..schemas import TrackInfoBase
+from ..methods.UpsertMethods import upsert
 from .. import database
 
 router = APIRouter(prefix="/track-infos", tags=["track-infos"])
@@ -25,24 +25,12 @@ def get_track_info(track_info_id: int, db: Session = Depends(database.get_db)):
 @router.post("/", response_model=TrackInfoBase.TrackInfo, status_code=201)
 def create_track_info(track_info: TrackInfoBase.TrackInfoCreate, db: Session = Depends(database.get_db)):
     """Create a track info (or return existing if song_id + artist_id combination exists)"""
-    # Check if this song/artist combo already exists
-    existing = db.query(TrackInfo).filter(
-        and_(
-            TrackInfo.song_id == track_info.song_id,
-            TrackInfo.artist_id == track_info.artist_id
-        )
-    ).first()
-    if existing:
-        return existing
-    
-    db_track_info = TrackInfo(
-        song_id=track_info.song_id,
-        artist_id=track_info.artist_id
+    return upsert(
+        db, TrackInfo,
+        {"song_id": track_info.song_id, "artist_id": track_info.artist_id},
+        conflict_columns=["song_id", "artist_id"],
+        commit=True
     )
-    db.add(db_track_info)
-    db.commit()
-    db.refresh(db_track_info)
-    return db_track_info
 
 @router.delete("/{track_info_id}")
 def delete_track_info(track_info_id: int, db: Session = Depends(database.get_db)):
@@ -1,22 +1,73 @@
 # Update: backend/routes/__init__.py
-from .PlayerRoutes import router as player_router
-from .GameRoutes import router as game_router
-from .ParticipantRoutes import router as participant_router
-from .RoundRoutes import router as round_router
-from .RoundTeamRoutes import router as round_team_router
-from .RoundTeamPlayerRoutes import router as round_team_player_router
-from .UploadRoutes import router as upload_router
-from .SpotifyRoutes import router as spotify_router
-from .SpotifyAuthRoutes import router as spotify_auth_router
+"""Every API router, imported on demand.
+
+Importing this package is cheap: a router module is only imported when
+include_routers() (or attribute access such as `routes.player_router`) needs it.
+"""
+import importlib
+import threading
+from typing import Tuple
+
+# (module, prefix, tags) in registration order
+ROUTERS: Tuple[Tuple[str, str, list], ...] = (
+    ("PlayerRoutes", "/api", ["players"]),
+    ("GameRoutes", "/api", ["games"]),
+    ("ParticipantRoutes", "/api", ["participants"]),
+    ("RoundRoutes", "/api", ["rounds"]),
+    ("RoundTeamRoutes", "/api", ["round-teams"]),
+    ("RoundTeamPlayerRoutes", "/api", ["round-team-players"]),
+    ("SongRoutes", "/api", ["songs"]),
+    ("ArtistRoutes", "/api", ["artists"]),
+    ("TrackInfoRoutes", "/api", ["track-infos"]),
+    ("CatalogRoutes", "/api", ["catalog"]),
+    ("RoundSonglistRoutes", "/api", ["round-songlists"]),
+    ("LeaderboardRoutes", "/api", ["leaderboard"]),
+    ("UploadRoutes", "/api", ["upload"]),
+    ("SpotifyRoutes", "/api", ["spotify"]),
+    ("SpotifyAuthRoutes", "", ["spotify-auth"]),
+    ("GameplaySettingsRoutes", "/api", ["gameplay-settings"]),
+    ("PlaylistMirrorRoutes", "/api", ["playlist-mirror"]),
+)
+
+_include_lock = threading.Lock()
+
+
+def load_router(module_name: str):
+    return importlib.import_module(f"{__name__}.{module_name}").router
+
+
+def include_routers(app) -> bool:
+    """Import every router and add it to `app`; only the first call does anything"""
+    with _include_lock:
+        if getattr(app.state, "routers_included", False):
+            return False
+        for module_name, prefix, tags in ROUTERS:
+            app.include_router(load_router(module_name), prefix=prefix, tags=tags)
+        app.state.routers_included = True
+        return True
+
+
+_ALIASES = {
+    "player_router": "PlayerRoutes",
+    "game_router": "GameRoutes",
+    "participant_router": "ParticipantRoutes",
+    "round_router": "RoundRoutes",
+    "round_team_router": "RoundTeamRoutes",
+    "round_team_player_router": "RoundTeamPlayerRoutes",
+    "upload_router": "UploadRoutes",
+    "spotify_router": "SpotifyRoutes",
+    "spotify_auth_router": "SpotifyAuthRoutes",
+}
+
+
+def __getattr__(name: str):
+    if name in _ALIASES:
+        return load_router(_ALIASES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
-    "player_router",
-    "game_router",
-    "participant_router",
-    "round_router",
-    "round_team_router",
-    "round_team_player_router",
-    "upload_router",
-    "spotify_router",
-    "spotify_auth_router"
-]
\ No newline at end of file
+    "ROUTERS",
+    "include_routers",
+    *_ALIASES,
+]
@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List
+
+class CatalogIngest(BaseModel):
+    """Spotify track objects (or playlist items wrapping them) to add to the catalog"""
+    tracks: List[Dict[str, Any]] = Field(..., max_length=50000)
+
+class CatalogIngestResult(BaseModel):
+    tracks: int  # tracks catalogued
+    skipped: int  # local or unavailable tracks without a Spotify id
+    songs: Dict[str, int]  # song Spotify id -> song_id
+    artists: Dict[str, int]  # artist Spotify id -> artist_id
+    track_infos: Dict[str, int]  # song Spotify id -> track_info_id
@@ -73,4 +73,28 @@ class GameWithParticipants(Game):
 
 class GameFull(Game):
     participants: List[ParticipantInGame] = []
-    rounds: List[RoundInGame] = []
\ No newline at end of file
+    rounds: List[RoundInGame] = []
+
+# Game history
+class GameSummaryParticipant(BaseModel):
+    participant_id: int
+    seat_number: int
+    player: Optional[PlayerInParticipant] = None
+    total_score: int
+
+class GameSummary(BaseModel):
+    game_id: int
+    playlist_id: Optional[str] = None
+    songs_per_round: int
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    ended_at: Optional[datetime] = None
+    duration_seconds: Optional[int] = None
+    rounds: int
+    rounds_played: int
+    participants: List[GameSummaryParticipant] = []
+    winner: Optional[PlayerInParticipant] = None
+
+class GameSummaryPage(BaseModel):
+    games: List[GameSummary]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,24 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+
+class GameTrackDeckCreate(BaseModel):
+    playlist_id: str
+    track_count: Optional[int] = None  # deal positions 0..n-1; defaults to the synced playlist mirror
+    seed: Optional[int] = None
+
+class GameTrackDeck(BaseModel):
+    """A game's shuffled track deck (without the packed positions)"""
+    game_id: int
+    playlist_id: str
+    seed: int
+    cycle: int
+    size: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
+
+class GameTrackDeckDraw(BaseModel):
+    index: int  # slot drawn (the game's current_track_index before the draw)
+    position: int  # playlist position to play
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+from .PlayerBase import Player
+
+class LeaderboardEntry(BaseModel):
+    rank: int
+    player: Player
+    total_score: int
+    games_played: int
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,30 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+
+class PlaylistMirror(BaseModel):
+    """Sync state of a locally mirrored Spotify playlist"""
+    playlist_id: str
+    snapshot_id: Optional[str] = None
+    name: Optional[str] = None
+    track_count: int = 0
+    synced_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
+
+class PlaylistMirrorTrack(BaseModel):
+    """A track row from the local playlist mirror"""
+    track_index: int
+    position: int
+    spotify_track_id: str
+    title: str
+    artists: str
+    album: Optional[str] = None
+    duration_ms: int = 0
+    popularity: int = 0
+
+    model_config = {"from_attributes": True}
+
+class PlaylistSyncStatus(BaseModel):
+    playlist_id: str
+    status: str  # "started" or "running" (a sync was already in flight)
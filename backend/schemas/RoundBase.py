@@ -1,6 +1,7 @@
 from pydantic import BaseModel
 from datetime import datetime
 from typing import List, Optional
+from ..models.Enums import Role
 from .RoundTeamBase import RoundTeamWithPlayers, RoundTeam
 from .RoundSonglistBase import RoundSonglist, RoundSonglistWithDetails
 
@@ -14,6 +15,17 @@ class RoundCreate(BaseModel):
     round_number: int
     # is_complete defaults to False, not included in create
 
+class RoundTeamAssignment(BaseModel):
+    """One team of a round being set up"""
+    role: Role
+    participant_ids: List[int]
+
+class RoundSetup(BaseModel):
+    """A round with its teams and their players, created in one request"""
+    game_id: int
+    round_number: int
+    teams: List[RoundTeamAssignment]
+
 class RoundUpdate(BaseModel):
     round_number: Optional[int] = None
     is_complete: Optional[bool] = None  # NEW
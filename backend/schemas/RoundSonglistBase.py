@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 from ..models.Enums import ScoreType 
 from .SongBase import Song
 from .ArtistBase import Artist
@@ -19,6 +19,12 @@ class RoundSonglistBase(BaseModel):
 class RoundSonglistCreate(RoundSonglistBase):
     pass
 
+class RecordPlayedTrack(BaseModel):
+    """A track as Spotify returned it, to be saved as the next song of a round"""
+    round_id: int
+    round_team_id: int
+    track: Dict[str, Any]
+
 class RoundSonglistUpdate(BaseModel):
     round_team_id: Optional[int] = None
     correct_artist_guess: Optional[bool] = None
@@ -3,6 +3,7 @@
 
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
+from .RoundSonglistBase import RoundSonglistWithDetails
 
 class PlaybackRequest(BaseModel):
     context_uri: Optional[str] = None
@@ -16,4 +17,14 @@ class CreatePlaylistRequest(BaseModel):
     description: str = ""
 
 class AddTracksRequest(BaseModel):
-    track_ids: List[str]
\ No newline at end of file
+    track_ids: List[str]
+
+class PlayRandomTrackRequest(BaseModel):
+    playlist_id: str
+    device_id: Optional[str] = None
+    round_team_id: Optional[int] = None  # defaults to the round's player team
+
+class PlayRandomTrackResponse(BaseModel):
+    position: int
+    track: Dict[str, Any]  # raw Spotify track object, as currently-playing returns it
+    round_songlist: RoundSonglistWithDetails
@@ -10,6 +10,10 @@ from . import TrackInfoBase
 from . import RoundSonglistBase
 from . import SpotifyBase
 from . import GameplaySettingsBase
+from . import PlaylistMirrorBase
+from . import GameTrackDeckBase
+from . import CatalogBase
+from . import LeaderboardBase
 
 __all__ = [
     "PlayerBase",
@@ -23,5 +27,9 @@ __all__ = [
     "TrackInfoBase",
     "RoundSonglistBase",
     "SpotifyBase",
-    "GameplaySettingsBase"
+    "GameplaySettingsBase",
+    "PlaylistMirrorBase",
+    "GameTrackDeckBase",
+    "CatalogBase",
+    "LeaderboardBase"
 ]
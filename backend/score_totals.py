@@ -0,0 +1,36 @@
+# backend/score_totals.py
+"""Check or rebuild the maintained score totals.
+
+    python -m backend.score_totals [check | rebuild]
+
+`check` lists rows of game_score_totals and player_score_totals that differ
+from what the games add up to (exit status 1 if any); `rebuild` recomputes
+both tables in one transaction.
+"""
+import sys
+from .database import engine
+from . import models  # noqa: F401 -- every mapper registered before the first query
+from .methods import ScoreTotalsMethods
+
+
+def main(argv) -> None:
+    command = argv[0] if argv else "check"
+    if command == "check":
+        with engine.connect() as connection:
+            differences = ScoreTotalsMethods.check(connection)
+        for table, rows in differences.items():
+            print(f"{table}: {len(rows)} rows differ")
+            for key, stored, expected in rows[:20]:
+                print(f"  {key}: stored {stored}, expected {expected}")
+        if any(differences.values()):
+            sys.exit(1)
+    elif command == "rebuild":
+        with engine.begin() as connection:
+            counts = ScoreTotalsMethods.rebuild(connection)
+        print(f"rebuilt {counts['game_rows']} game rows and {counts['player_rows']} player rows")
+    else:
+        sys.exit("usage: python -m backend.score_totals [check | rebuild]")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
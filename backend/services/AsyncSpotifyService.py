@@ -0,0 +1,316 @@
+import asyncio
+import hashlib
+import json
+import time
+import httpx
+from collections import deque
+from typing import List, Optional, Dict, Any, AsyncIterator, Tuple
+from urllib.parse import urlencode
+from .SpotifyResponseCache import SpotifyResponseCache
+from .SpotifyRequestScheduler import SpotifyRequestScheduler, Priority
+from .SpotifySingleFlight import SpotifySingleFlight
+
+
+class AsyncSpotifyService:
+    """Async variant of SpotifyService built on a shared, pooled httpx client"""
+
+    BASE_URL = "https://api.spotify.com/v1"
+
+    def __init__(self, access_token: str, client: httpx.AsyncClient,
+                 cache: Optional[SpotifyResponseCache] = None,
+                 scheduler: Optional[SpotifyRequestScheduler] = None,
+                 priority: Optional[Priority] = None,
+                 single_flight: Optional[SpotifySingleFlight] = None):
+        self.access_token = access_token
+        self.client = client
+        self.cache = cache
+        self.scheduler = scheduler
+        self.priority = priority
+        self.single_flight = single_flight
+        self.headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json"
+        }
+
+    def with_priority(self, priority: Priority) -> "AsyncSpotifyService":
+        """Copy of this service whose requests are scheduled at `priority`"""
+        return AsyncSpotifyService(self.access_token, self.client, cache=self.cache,
+                                   scheduler=self.scheduler, priority=priority,
+                                   single_flight=self.single_flight)
+
+    def _priority_for(self, endpoint: str) -> Priority:
+        if self.priority is not None:
+            return self.priority
+        return Priority.INTERACTIVE if endpoint.startswith("me/player") else Priority.DEFAULT
+
+    async def _send(self, method: str, endpoint: str, data: Optional[Dict] = None,
+                    params: Optional[Dict] = None, headers: Optional[Dict] = None,
+                    reuse_recent: bool = True) -> httpx.Response:
+        """Send a request to the Spotify API (through the rate-limit scheduler) and return the raw response
+
+        Args:
+            reuse_recent: Allow a just-finished identical player-state GET to be reused
+        """
+        url = f"{self.BASE_URL}/{endpoint}"
+        request_headers = {**self.headers, **headers} if headers else self.headers
+
+        async def send() -> httpx.Response:
+            return await self.client.request(method, url, headers=request_headers, json=data, params=params)
+
+        async def scheduled_send() -> httpx.Response:
+            if self.scheduler is None:
+                return await send()
+            return await self.scheduler.execute(send, idempotent=method == "GET",
+                                                priority=self._priority_for(endpoint))
+
+        if self.single_flight is None:
+            return await scheduled_send()
+        if method != "GET":
+            response = await scheduled_send()
+            if endpoint.startswith("me/player"):
+                # Playback changed: don't serve windowed player state from before it
+                self.single_flight.forget(lambda key: key[0].startswith("me/player"))
+            return response
+
+        # Identical concurrent GETs (same endpoint, params, token and validator) share one call
+        key = (
+            self._cache_key(endpoint, params, per_user=True),
+            request_headers.get("If-None-Match")
+        )
+        volatile = reuse_recent and endpoint.startswith("me/player")
+        window = self.single_flight.player_state_window if volatile else 0.0
+        return await self.single_flight.do(key, scheduled_send, result_window=window,
+                                           keep=lambda response: response.is_success)
+
+    async def _request(self, method: str, endpoint: str, data: Optional[Dict] = None,
+                       params: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
+        """Send a request to the Spotify API, returning the JSON body if there is one"""
+        response = await self._send(method, endpoint, data=data, params=params)
+        response.raise_for_status()
+        return response.json() if response.content else None
+
+    def _cache_key(self, endpoint: str, params: Optional[Dict], per_user: bool) -> str:
+        key = f"{endpoint}?{urlencode(sorted(params.items()))}" if params else endpoint
+        if per_user:
+            # Tie user-specific responses to the account's token
+            key += "#" + hashlib.sha256(self.access_token.encode()).hexdigest()[:16]
+        return key
+
+    async def _cached_get(self, kind: str, endpoint: str, params: Optional[Dict] = None,
+                          per_user: bool = False) -> Dict[str, Any]:
+        """GET through the response cache, revalidating stale entries with If-None-Match"""
+        if self.cache is None:
+            return await self._get(endpoint, params=params)
+
+        key = self._cache_key(endpoint, params, per_user)
+        entry = await self.cache.lookup(key)
+        if entry is not None and entry.is_fresh(time.time()):
+            return json.loads(entry.body)
+
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+        response = await self._send("GET", endpoint, params=params, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            await self.cache.mark_revalidated(key, entry)
+            return json.loads(entry.body)
+
+        response.raise_for_status()
+        await self.cache.store(key, response.content, response.headers.get("ETag"), self.cache.ttl_for(kind))
+        return response.json()
+
+    async def _get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Make GET request to Spotify API"""
+        return await self._request("GET", endpoint, params=params)
+
+    async def _post(self, endpoint: str, data: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
+        """Make POST request to Spotify API"""
+        return await self._request("POST", endpoint, data=data)
+
+    async def _put(self, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
+        """Make PUT request to Spotify API"""
+        return await self._request("PUT", endpoint, data=data, params=params)
+
+    async def _delete(self, endpoint: str, data: Optional[Dict] = None) -> None:
+        """Make DELETE request to Spotify API"""
+        await self._request("DELETE", endpoint, data=data)
+
+    # User endpoints
+    async def get_current_user(self) -> Dict[str, Any]:
+        return await self._cached_get("me", "me", per_user=True)
+
+    async def get_user_profile(self, user_id: str) -> Dict[str, Any]:
+        return await self._get(f"users/{user_id}")
+
+    # Track endpoints
+    async def get_track(self, track_id: str) -> Dict[str, Any]:
+        return await self._cached_get("track", f"tracks/{track_id}")
+
+    async def get_tracks(self, track_ids: List[str]) -> Dict[str, Any]:
+        ids_param = ",".join(track_ids)
+        return await self._cached_get("tracks", "tracks", params={"ids": ids_param})
+
+    async def search_tracks(self, query: str, limit: int = 20) -> Dict[str, Any]:
+        return await self._get("search", params={"q": query, "type": "track", "limit": limit})
+
+    # Artist endpoints
+    async def get_artist(self, artist_id: str) -> Dict[str, Any]:
+        return await self._cached_get("artist", f"artists/{artist_id}")
+
+    async def get_artist_albums(self, artist_id: str, limit: int = 20) -> Dict[str, Any]:
+        return await self._get(f"artists/{artist_id}/albums", params={"limit": limit})
+
+    async def get_artist_top_tracks(self, artist_id: str, market: str = "US") -> Dict[str, Any]:
+        return await self._get(f"artists/{artist_id}/top-tracks", params={"market": market})
+
+    # Album endpoints
+    async def get_album(self, album_id: str) -> Dict[str, Any]:
+        return await self._cached_get("album", f"albums/{album_id}")
+
+    async def get_album_tracks(self, album_id: str, limit: int = 50) -> Dict[str, Any]:
+        return await self._cached_get("album_tracks", f"albums/{album_id}/tracks", params={"limit": limit})
+
+    # Playlist endpoints
+    async def get_playlist(self, playlist_id: str) -> Dict[str, Any]:
+        return await self._cached_get("playlist", f"playlists/{playlist_id}")
+
+    async def get_playlist_snapshot(self, playlist_id: str) -> Dict[str, Any]:
+        """Get just a playlist's name, snapshot_id and track total (never cached)"""
+        return await self._get(f"playlists/{playlist_id}",
+                        params={"fields": "name,snapshot_id,tracks.total"})
+
+    async def get_user_playlists(self, limit: int = 50) -> Dict[str, Any]:
+        return await self._get("me/playlists", params={"limit": limit})
+
+    async def create_playlist(self, user_id: str, name: str, public: bool = True, description: str = "") -> Dict[str, Any]:
+        data = {"name": name, "public": public, "description": description}
+        return await self._post(f"users/{user_id}/playlists", data)
+
+    async def add_tracks_to_playlist(self, playlist_id: str, track_uris: List[str]) -> None:
+        await self._post(f"playlists/{playlist_id}/tracks", data={"uris": track_uris})
+
+    # Player endpoints
+    async def get_currently_playing(self, reuse_recent: bool = True) -> Optional[Dict[str, Any]]:
+        """Get the currently playing item
+
+        Args:
+            reuse_recent: False to always ask Spotify (e.g. while waiting for a track change)
+        """
+        response = await self._send("GET", "me/player/currently-playing", reuse_recent=reuse_recent)
+        response.raise_for_status()
+        return response.json() if response.content else None
+
+    async def get_recently_played(self, limit: int = 20) -> Dict[str, Any]:
+        return await self._get("me/player/recently-played", params={"limit": limit})
+
+    async def pause_playback(self) -> None:
+        """Pause playback on the user's active device"""
+        await self._put("me/player/pause")
+
+    async def start_playback(self, context_uri: str = None, uris: List[str] = None,
+                    position_ms: int = 0, offset: Dict[str, Any] = None,
+                    device_id: str = None) -> None:
+        """Start or resume playback
+
+        Args:
+            context_uri: Spotify URI of context (album, artist, playlist)
+            uris: List of Spotify track URIs to play
+            position_ms: Position in milliseconds to start playback
+            offset: Indicates from where in context playback should start
+            device_id: The device to play on (optional)
+        """
+        data = {}
+        if context_uri:
+            data["context_uri"] = context_uri
+        if uris:
+            data["uris"] = uris
+        if position_ms:
+            data["position_ms"] = position_ms
+        if offset:
+            data["offset"] = offset
+
+        params = {}
+        if device_id:
+            params["device_id"] = device_id
+
+        await self._put("me/player/play", data=data, params=params)
+
+    async def skip_to_next(self) -> None:
+        """Skip to next track in user's queue"""
+        await self._post("me/player/next")
+
+    async def skip_to_previous(self) -> None:
+        """Skip to previous track in user's queue"""
+        await self._post("me/player/previous")
+
+    async def get_playback_state(self) -> Optional[Dict[str, Any]]:
+        """Get information about user's current playback"""
+        return await self._get("me/player")
+
+    async def get_available_devices(self) -> Dict[str, Any]:
+        """Get information about user's available devices"""
+        return await self._get("me/player/devices")
+
+    async def transfer_playback(self, device_ids: List[str], play: bool = False) -> None:
+        """Transfer playback to a new device
+
+        Args:
+            device_ids: List containing the ID of the device to transfer to
+            play: Whether to start playing after transfer
+        """
+        await self._put("me/player", data={
+            "device_ids": device_ids,
+            "play": play
+        })
+
+    async def set_shuffle(self, state: bool) -> None:
+        """Toggle shuffle on or off for user's playback
+
+        Args:
+            state: True to turn on shuffle, False to turn off
+        """
+        await self._put("me/player/shuffle", params={"state": str(state).lower()})
+
+    async def get_playlist_tracks_paginated(self, playlist_id: str, offset: int = 0,
+                                    limit: int = 100, fields: Optional[str] = None) -> Dict[str, Any]:
+        """Get playlist tracks with pagination support
+
+        Args:
+            fields: Optional Spotify field filter to trim the payload
+        """
+        params = {"limit": limit, "offset": offset}
+        if fields:
+            params["fields"] = fields
+        return await self._get(f"playlists/{playlist_id}/tracks", params=params)
+
+    async def iter_playlist_track_pages(self, playlist_id: str, page_size: int = 100,
+                                        concurrency: int = 4, fields: Optional[str] = None
+                                        ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """Yield (offset, page) for every page of a playlist, in order.
+
+        The first page reveals `total`; the rest are fetched concurrently with at most
+        `concurrency` requests (and pages) in flight, so memory stays flat however
+        large the playlist is.
+        """
+        first = await self.get_playlist_tracks_paginated(playlist_id, 0, page_size, fields=fields)
+        yield 0, first
+
+        offsets = iter(range(page_size, first.get("total", 0), page_size))
+        pending = deque()
+
+        def schedule_next() -> None:
+            offset = next(offsets, None)
+            if offset is not None:
+                pending.append((offset, asyncio.ensure_future(
+                    self.get_playlist_tracks_paginated(playlist_id, offset, page_size, fields=fields)
+                )))
+
+        for _ in range(concurrency):
+            schedule_next()
+        try:
+            while pending:
+                offset, task = pending.popleft()
+                page = await task
+                schedule_next()
+                yield offset, page
+        finally:
+            for _, task in pending:
+                task.cancel()
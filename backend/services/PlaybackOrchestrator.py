@@ -0,0 +1,48 @@
+import asyncio
+import time
+from typing import Any, Dict, Optional
+from .AsyncSpotifyService import AsyncSpotifyService
+
+
+async def wait_for_track_change(service: AsyncSpotifyService, previous_track_id: Optional[str],
+                                expected_track_id: Optional[str] = None, timeout: float = 6.0,
+                                initial_delay: float = 0.1, max_delay: float = 0.8) -> Optional[Dict[str, Any]]:
+    """Poll currently-playing with growing delays until the new track is actually playing.
+
+    Returns the playing track object, or None if `timeout` runs out first: the
+    item Spotify reports then may be the previous, a paused or an unexpected track.
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    while True:
+        data = await service.get_currently_playing(reuse_recent=False)
+        track = data.get("item") if data else None
+        if track and data.get("is_playing"):
+            if expected_track_id is not None:
+                if track.get("id") == expected_track_id:
+                    return track
+            elif track.get("id") != previous_track_id:
+                return track
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 1.6, max_delay)
+
+
+async def play_playlist_position(service: AsyncSpotifyService, playlist_id: str, position: int,
+                                 device_id: Optional[str] = None,
+                                 expected_track_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Start a playlist at `position` and return the track once Spotify reports it playing (None on timeout)"""
+    state = await service.get_playback_state()
+    previous_item = (state or {}).get("item") or {}
+    if state and state.get("is_playing"):
+        await service.pause_playback()
+
+    await service.start_playback(
+        context_uri=f"spotify:playlist:{playlist_id}",
+        offset={"position": position},
+        device_id=device_id
+    )
+    return await wait_for_track_change(service, previous_item.get("id"), expected_track_id)
@@ -0,0 +1,149 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+from .AsyncSpotifyService import AsyncSpotifyService
+
+# Progress drift (ms) beyond which we treat it as a seek and publish it
+SEEK_THRESHOLD_MS = 2000
+
+
+def summarize_playback(state: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Reduce Spotify's playback state to the fields viewers display"""
+    if not state:
+        return {"active": False, "is_playing": False, "track": None, "device": None, "progress_ms": None}
+    item = state.get("item") or {}
+    device = state.get("device") or {}
+    return {
+        "active": True,
+        "is_playing": bool(state.get("is_playing")),
+        "track": {
+            "id": item.get("id"),
+            "name": item.get("name"),
+            "artists": [artist["name"] for artist in item.get("artists", [])],
+            "album": (item.get("album") or {}).get("name"),
+            "duration_ms": item.get("duration_ms"),
+        } if item else None,
+        "device": {"id": device.get("id"), "name": device.get("name")} if device else None,
+        "progress_ms": state.get("progress_ms"),
+    }
+
+
+class PlayerStatePoller:
+    """One upstream poll loop per Spotify account, fanned out to any number of subscribers"""
+
+    def __init__(self, service_for: Callable[[], Awaitable[Optional[AsyncSpotifyService]]],
+                 playing_interval: float, paused_interval: float, idle_interval: float,
+                 on_idle: Callable[[], None]):
+        self.service_for = service_for
+        self.playing_interval = playing_interval
+        self.paused_interval = paused_interval
+        self.idle_interval = idle_interval
+        self.on_idle = on_idle
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.snapshot: Optional[Dict[str, Any]] = None
+        self.polls = 0
+        self._snapshot_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=16)
+        if self.snapshot is not None:
+            queue.put_nowait(("state", self.snapshot))
+        self.subscribers.add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self.subscribers.discard(queue)
+
+    def _publish(self, event: str, data: Dict[str, Any]) -> None:
+        for queue in self.subscribers:
+            try:
+                queue.put_nowait((event, data))
+            except asyncio.QueueFull:
+                # Slow viewer: drop its backlog and resync it with the full state
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(("state", self.snapshot))
+
+    def _diff(self, snapshot: Dict[str, Any], now: float) -> Dict[str, Any]:
+        previous = self.snapshot or {}
+        diff = {key: value for key, value in snapshot.items()
+                if key != "progress_ms" and previous.get(key) != value}
+        progress, last_progress = snapshot.get("progress_ms"), previous.get("progress_ms")
+        if progress is not None:
+            expected = last_progress
+            if last_progress is not None and previous.get("is_playing"):
+                expected = last_progress + (now - self._snapshot_at) * 1000
+            if diff or expected is None or abs(progress - expected) > SEEK_THRESHOLD_MS:
+                diff["progress_ms"] = progress
+        return diff
+
+    def _interval(self) -> float:
+        if not self.snapshot or not self.snapshot["active"]:
+            return self.idle_interval
+        return self.playing_interval if self.snapshot["is_playing"] else self.paused_interval
+
+    async def _run(self) -> None:
+        try:
+            while self.subscribers:
+                try:
+                    service = await self.service_for()
+                    if service is not None:
+                        state = await service.get_playback_state()
+                        self.polls += 1
+                        now = time.monotonic()
+                        snapshot = summarize_playback(state)
+                        if self.snapshot is None:
+                            self.snapshot = snapshot
+                            self._publish("state", snapshot)
+                        else:
+                            diff = self._diff(snapshot, now)
+                            self.snapshot = snapshot
+                            if diff:
+                                self._publish("diff", diff)
+                        self._snapshot_at = now
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    print(f"Player state poll failed: {str(e)}")
+                await asyncio.sleep(self._interval())
+        finally:
+            self.on_idle()
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+
+class PlayerStateHub:
+    """Keeps one PlayerStatePoller per authorized Spotify account"""
+
+    def __init__(self, playing_interval: float = 1.0, paused_interval: float = 5.0,
+                 idle_interval: float = 15.0):
+        self.playing_interval = playing_interval
+        self.paused_interval = paused_interval
+        self.idle_interval = idle_interval
+        self.pollers: Dict[str, PlayerStatePoller] = {}
+
+    def poller_for(self, account_id: str,
+                   service_for: Callable[[], Awaitable[Optional[AsyncSpotifyService]]]) -> PlayerStatePoller:
+        poller = self.pollers.get(account_id)
+        if poller is None:
+            poller = PlayerStatePoller(
+                service_for, self.playing_interval, self.paused_interval, self.idle_interval,
+                on_idle=lambda: self.pollers.pop(account_id, None)
+            )
+            self.pollers[account_id] = poller
+        return poller
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            account_id: {"subscribers": len(poller.subscribers), "polls": poller.polls}
+            for account_id, poller in self.pollers.items()
+        }
+
+    def close(self) -> None:
+        for poller in list(self.pollers.values()):
+            poller.stop()
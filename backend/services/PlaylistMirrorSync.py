@@ -0,0 +1,109 @@
+import asyncio
+import time
+from typing import Dict, List, Any, Optional
+from ..config import get_settings
+from ..database import SessionLocal
+from ..methods import PlaylistMirrorMethods
+from .AsyncSpotifyService import AsyncSpotifyService
+from .SpotifyRequestScheduler import Priority
+
+PAGE_SIZE = 100
+# Only ask Spotify for the columns the mirror stores
+TRACK_FIELDS = "total,items(track(id,name,duration_ms,popularity,artists(name),album(name)))"
+
+# In-flight syncs, so concurrent triggers for one playlist share a single crawl
+_running: Dict[str, asyncio.Task] = {}
+# When refresh_if_stale last checked each playlist (time.monotonic())
+_checked: Dict[str, float] = {}
+
+
+def track_rows(page: Dict[str, Any], offset: int) -> List[Dict[str, Any]]:
+    """Turn one page of playlist items into mirror rows, skipping local/unavailable tracks"""
+    rows = []
+    for i, item in enumerate(page.get("items", [])):
+        track = item.get("track") if item else None
+        if not track or not track.get("id"):
+            continue
+        rows.append({
+            "position": offset + i,
+            "spotify_track_id": track["id"],
+            "title": track["name"][:255],
+            "artists": ", ".join(artist["name"] for artist in track.get("artists", []))[:500],
+            "album": (track.get("album") or {}).get("name"),
+            "duration_ms": track.get("duration_ms") or 0,
+            "popularity": track.get("popularity") or 0,
+        })
+    return rows
+
+
+def _stored_snapshot(playlist_id: str) -> Optional[str]:
+    db = SessionLocal()
+    try:
+        mirror = PlaylistMirrorMethods.get_mirror(db, playlist_id)
+        return mirror.snapshot_id if mirror else None
+    finally:
+        db.close()
+
+
+def _store(playlist_id: str, snapshot_id: str, name: str, rows: List[Dict[str, Any]]) -> None:
+    db = SessionLocal()
+    try:
+        PlaylistMirrorMethods.replace_tracks(db, playlist_id, snapshot_id, name, rows)
+    finally:
+        db.close()
+
+
+async def sync_playlist(service: AsyncSpotifyService, playlist_id: str,
+                        concurrency: int = 4) -> bool:
+    """Refresh the local mirror if the playlist's snapshot_id changed.
+
+    Returns True if the mirror was rewritten, False if it was already current.
+    """
+    meta = await service.get_playlist_snapshot(playlist_id)
+    snapshot_id = meta.get("snapshot_id")
+    if snapshot_id and snapshot_id == await asyncio.to_thread(_stored_snapshot, playlist_id):
+        return False
+
+    rows = []
+    async for offset, page in service.iter_playlist_track_pages(
+            playlist_id, PAGE_SIZE, concurrency=concurrency, fields=TRACK_FIELDS):
+        rows.extend(track_rows(page, offset))
+
+    await asyncio.to_thread(_store, playlist_id, snapshot_id, meta.get("name"), rows)
+    return True
+
+
+async def _run_sync(service: AsyncSpotifyService, playlist_id: str) -> None:
+    try:
+        await sync_playlist(service, playlist_id)
+    except Exception as e:
+        print(f"Playlist mirror sync failed for {playlist_id}: {str(e)}")
+    finally:
+        _running.pop(playlist_id, None)
+
+
+def start_sync(service: AsyncSpotifyService, playlist_id: str) -> str:
+    """Kick off a background sync; returns "running" if one is already in flight"""
+    if playlist_id in _running:
+        return "running"
+    background_service = service.with_priority(Priority.BACKGROUND)
+    _running[playlist_id] = asyncio.create_task(_run_sync(background_service, playlist_id))
+    return "started"
+
+
+def refresh_if_stale(service: AsyncSpotifyService, playlist_id: str) -> str:
+    """Start a background sync unless the playlist was checked in the last check interval.
+
+    The caller never waits: it keeps dealing from the mirror it has (or from the
+    playlist total before the first sync), and decks are re-dealt when the sync
+    lands. Returns "fresh" if the playlist was checked recently.
+    """
+    now = time.monotonic()
+    if now - _checked.get(playlist_id, float("-inf")) < get_settings().playlist_mirror_check_interval:
+        return "fresh"
+    _checked[playlist_id] = now
+    return start_sync(service, playlist_id)
+
+
+def is_syncing(playlist_id: str) -> bool:
+    return playlist_id in _running
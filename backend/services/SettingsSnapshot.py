@@ -0,0 +1,75 @@
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from ..models.GameplaySettings import GameplaySettings
+from .SharedCache import CacheBackend, MemoryCacheBackend, control_key
+from .VersionedSnapshot import VersionedSnapshot
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+VERSION_KEY = control_key("gameplay_settings:version")
+SNAPSHOT_KEY = control_key("gameplay_settings:snapshot")
+
+
+def setting_row(setting: GameplaySettings) -> Dict[str, Any]:
+    return {
+        "setting_id": setting.setting_id,
+        "key": setting.key,
+        "value": setting.value,
+        "created_at": setting.created_at.isoformat() if setting.created_at else None,
+        "updated_at": setting.updated_at.isoformat() if setting.updated_at else None,
+    }
+
+
+def setting_rows(settings) -> Dict[str, Dict[str, Any]]:
+    return {setting.key: setting_row(setting) for setting in settings}
+
+
+class SettingsSnapshot:
+    """Versioned copy of the whole gameplay_settings table, in a VersionedSnapshot.
+
+    Every committed write invalidates it, and each process re-reads only when the
+    version has moved. The version doubles as the ETag of the settings endpoints.
+    """
+
+    def __init__(self, cache: Optional[CacheBackend] = None):
+        self.snapshots = VersionedSnapshot(
+            VERSION_KEY, SNAPSHOT_KEY,
+            cache if cache is not None else MemoryCacheBackend(max_entries=16, max_bytes=4 * 1024 * 1024)
+        )
+
+    @property
+    def loads(self) -> int:
+        return self.snapshots.loads
+
+    def use(self, cache: CacheBackend) -> None:
+        """Switch to another cache backend (forgets the local copy)"""
+        self.snapshots.use(cache)
+
+    def get(self, session_factory: Callable[[], Session]) -> Tuple[str, Dict[str, Dict[str, Any]]]:
+        """(version, rows by key), loading the table if the cached copy is missing or stale"""
+        def load() -> Dict[str, Dict[str, Any]]:
+            db = session_factory()
+            try:
+                return setting_rows(db.query(GameplaySettings).all())
+            finally:
+                db.close()
+
+        return self.snapshots.load(load)
+
+    async def get_async(self, db: "AsyncSession") -> Tuple[str, Dict[str, Dict[str, Any]]]:
+        """get() for async routes, loading through their AsyncSession"""
+        current = await self.snapshots.call(self.snapshots.current)
+        if current is not None:
+            return current
+        version = await self.snapshots.call(self.snapshots.load_version)
+        rows = setting_rows((await db.scalars(select(GameplaySettings))).all())
+        return await self.snapshots.call(self.snapshots.publish, version, rows)
+
+    def invalidate(self) -> None:
+        """Called after every committed write"""
+        self.snapshots.invalidate()
+
+
+settings_snapshot = SettingsSnapshot()
@@ -0,0 +1,281 @@
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from ..config import Settings
+
+# Keys under this prefix (snapshot versions, snapshots, locks) are never evicted to
+# make room: they go only when deleted or when their TTL runs out
+CONTROL_PREFIX = "control:"
+
+
+def control_key(name: str) -> str:
+    return CONTROL_PREFIX + name
+
+
+class CacheBackend(ABC):
+    """Small key/value cache interface: bytes values, optional TTL, atomic counters.
+
+    `delete` reports whether the key was present, so get-and-consume (one-time
+    OAuth state) is a single atomic call on every backend. Size limits apply to
+    ordinary keys only; control keys (see control_key) are kept apart from them.
+
+    `shared` backends live outside the process, so a lookup is I/O and belongs off
+    the event loop; lookups on the others are plain dictionary reads.
+    """
+
+    shared = False
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """The live value of `key`, or None"""
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """Store `value`, expiring after `ttl` seconds if given"""
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        """Remove `key`; True if it was present"""
+
+    @abstractmethod
+    def incr(self, key: str, amount: int = 1, ttl: Optional[float] = None) -> int:
+        """Add `amount` to an integer counter, creating it (with `ttl`) if missing"""
+
+    def stats(self) -> Dict[str, int]:
+        return {}
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Per-process LRU bounded by entry count and total value bytes"""
+
+    def __init__(self, max_entries: int = 2048, max_bytes: int = 32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # key -> (value, expires_at or None)
+        self._entries: "OrderedDict[str, Tuple[bytes, Optional[float]]]" = OrderedDict()
+        # Control keys, outside the LRU and its limits
+        self._control: Dict[str, Tuple[bytes, Optional[float]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _table(self, key: str) -> Dict[str, Tuple[bytes, Optional[float]]]:
+        return self._control if key.startswith(CONTROL_PREFIX) else self._entries
+
+    def _live(self, key: str, now: float) -> Optional[Tuple[bytes, Optional[float]]]:
+        item = self._table(key).get(key)
+        if item is None:
+            return None
+        if item[1] is not None and item[1] <= now:
+            self._pop(key)
+            return None
+        return item
+
+    def _pop(self, key: str) -> bool:
+        table = self._table(key)
+        item = table.pop(key, None)
+        if item is None:
+            return False
+        if table is self._entries:
+            self.total_bytes -= len(item[0])
+        return True
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            item = self._live(key, time.monotonic())
+            if item is None:
+                return None
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            return item[0]
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._pop(key)
+            if len(value) > self.max_bytes and not key.startswith(CONTROL_PREFIX):
+                return
+            self._insert(key, value, time.monotonic() + ttl if ttl else None)
+
+    def _insert(self, key: str, value: bytes, expires_at: Optional[float]) -> None:
+        if key.startswith(CONTROL_PREFIX):
+            self._control[key] = (value, expires_at)
+            return
+        self._entries[key] = (value, expires_at)
+        self.total_bytes += len(value)
+        while len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes:
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self.total_bytes -= len(evicted)
+            self.evictions += 1
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._live(key, time.monotonic()) is not None and self._pop(key)
+
+    def incr(self, key: str, amount: int = 1, ttl: Optional[float] = None) -> int:
+        with self._lock:
+            now = time.monotonic()
+            item = self._live(key, now)
+            if item is None:
+                value, expires_at = amount, (now + ttl if ttl else None)
+            else:
+                value, expires_at = int(item[0]) + amount, item[1]
+                self._pop(key)
+            self._insert(key, str(value).encode(), expires_at)
+            return value
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.total_bytes,
+            "evictions": self.evictions,
+            "control_entries": len(self._control),
+        }
+
+
+# Ordinary keys, and the control keys pruning never evicts
+TABLES = ("shared_cache", "shared_cache_control")
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Cache in a SQLite file in WAL mode, shared by every worker process on the host.
+
+    Bounded by `max_entries` and by `max_bytes` of values: every `prune_every`
+    writes, expired rows are dropped and then the oldest-written rows beyond
+    either limit. Control keys live in their own table, which only loses expired
+    rows.
+    """
+
+    shared = True
+
+    def __init__(self, path: str, max_entries: int = 20000, max_bytes: int = 64 * 1024 * 1024,
+                 prune_every: int = 64):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.prune_every = prune_every
+        self.evictions = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=5.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for table in TABLES:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                "expires_at REAL, stored_at REAL NOT NULL)"
+            )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_shared_cache_stored_at ON shared_cache (stored_at)")
+        with self._lock:
+            self._prune(time.time())
+
+    @staticmethod
+    def _table(key: str) -> str:
+        return "shared_cache_control" if key.startswith(CONTROL_PREFIX) else "shared_cache"
+
+    def _prune(self, now: float) -> None:
+        for table in TABLES:
+            self._conn.execute(f"DELETE FROM {table} WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+        # Keep the newest rows while both the count and the running byte total fit
+        cursor = self._conn.execute(
+            "DELETE FROM shared_cache WHERE key IN ("
+            "SELECT key FROM (SELECT key, "
+            "ROW_NUMBER() OVER newest AS n, SUM(LENGTH(value)) OVER newest AS total "
+            "FROM shared_cache WINDOW newest AS (ORDER BY stored_at DESC, key)) "
+            "WHERE n > ? OR total > ?)",
+            (self.max_entries, self.max_bytes)
+        )
+        self.evictions += max(cursor.rowcount, 0)
+
+    def _wrote(self, now: float) -> None:
+        self._writes += 1
+        if self._writes % self.prune_every == 0:
+            self._prune(now)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value FROM {self._table(key)} WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, time.time())
+            ).fetchone()
+        return bytes(row[0]) if row is not None else None
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        now = time.time()
+        table = self._table(key)
+        with self._lock:
+            if len(value) > self.max_bytes and table == "shared_cache":
+                self._conn.execute("DELETE FROM shared_cache WHERE key = ?", (key,))
+                return
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {table} (key, value, expires_at, stored_at) VALUES (?, ?, ?, ?)",
+                (key, value, now + ttl if ttl else None, now)
+            )
+            self._wrote(now)
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                f"DELETE FROM {self._table(key)} WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, time.time())
+            )
+        return cursor.rowcount > 0
+
+    def incr(self, key: str, amount: int = 1, ttl: Optional[float] = None) -> int:
+        now = time.time()
+        with self._lock:
+            # BEGIN IMMEDIATE takes the write lock up front, so the read-modify-write
+            # is atomic across processes
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    f"SELECT value, expires_at FROM {self._table(key)} WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None or (row[1] is not None and row[1] <= now):
+                    value, expires_at = amount, (now + ttl if ttl else None)
+                else:
+                    value, expires_at = int(row[0]) + amount, row[1]
+                self._conn.execute(
+                    f"INSERT OR REPLACE INTO {self._table(key)} (key, value, expires_at, stored_at) VALUES (?, ?, ?, ?)",
+                    (key, str(value).encode(), expires_at, now)
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._wrote(now)
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            entries, total_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(value)), 0) FROM shared_cache"
+            ).fetchone()
+            control_entries = self._conn.execute("SELECT COUNT(*) FROM shared_cache_control").fetchone()[0]
+        return {"entries": entries, "bytes": total_bytes, "evictions": self.evictions,
+                "control_entries": control_entries}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def create_cache_backend(settings: Settings) -> CacheBackend:
+    """The app-wide cache: per-process memory, or a SQLite file shared by all workers"""
+    if settings.cache_backend == "sqlite":
+        return SQLiteCacheBackend(settings.cache_path, settings.cache_max_entries, settings.cache_max_bytes)
+    if settings.cache_backend == "memory":
+        return MemoryCacheBackend(settings.cache_max_entries, settings.cache_max_bytes)
+    raise ValueError(f"Unknown cache backend '{settings.cache_backend}' (expected 'memory' or 'sqlite')")
@@ -0,0 +1,68 @@
+import httpx
+from typing import Optional
+from ..config import Settings
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional `h2` package (pip install httpx[http2])"""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class SpotifyHttpClient:
+    """Owns the long-lived, connection-pooled HTTP client shared by all Spotify calls.
+
+    One instance is created in the app lifespan and stored on `app.state`, so every
+    request reuses the same keep-alive connections instead of doing a new TCP+TLS
+    handshake per call.
+    """
+
+    def __init__(self, max_connections: int = 20, max_keepalive_connections: int = 10,
+                 keepalive_expiry: float = 30.0, connect_timeout: float = 5.0,
+                 read_timeout: float = 10.0, pool_timeout: float = 5.0,
+                 http2: bool = True):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.timeout = httpx.Timeout(
+            connect=connect_timeout,
+            read=read_timeout,
+            write=read_timeout,
+            pool=pool_timeout
+        )
+        self.http2 = http2 and _http2_available()
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "SpotifyHttpClient":
+        return cls(
+            max_connections=settings.spotify_http_max_connections,
+            max_keepalive_connections=settings.spotify_http_max_keepalive_connections,
+            keepalive_expiry=settings.spotify_http_keepalive_expiry,
+            connect_timeout=settings.spotify_http_connect_timeout,
+            read_timeout=settings.spotify_http_read_timeout,
+            pool_timeout=settings.spotify_http_pool_timeout,
+            http2=settings.spotify_http2
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared client, created lazily on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                limits=self.limits,
+                timeout=self.timeout,
+                http2=self.http2
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pool (called on app shutdown)"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
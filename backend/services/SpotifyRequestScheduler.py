@@ -0,0 +1,138 @@
+import asyncio
+import heapq
+import itertools
+import random
+import time
+from enum import IntEnum
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+import httpx
+
+RETRYABLE_STATUSES = {500, 502, 503, 504}
+
+
+class Priority(IntEnum):
+    """Lower values are dispatched first"""
+    INTERACTIVE = 0  # playback control / player state a user is waiting on
+    DEFAULT = 1
+    BACKGROUND = 2  # playlist crawls, batch lookups
+
+
+class SpotifyRequestScheduler:
+    """Central gate for every Spotify API call.
+
+    A token bucket sized to Spotify's rolling rate-limit window meters requests out
+    in priority order. A 429 blocks the whole bucket for `Retry-After` seconds, and
+    idempotent GETs are retried with jittered exponential backoff.
+    """
+
+    def __init__(self, requests_per_window: int = 150, window_seconds: float = 30.0,
+                 burst: int = 20, max_retries: int = 3, base_backoff: float = 0.5,
+                 max_backoff: float = 8.0):
+        self.rate = requests_per_window / window_seconds
+        self.burst = burst
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        self.dispatched = 0
+        self.throttled = 0
+        self.retries = 0
+
+    # Token bucket
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+
+    def _pump(self) -> None:
+        """Hand out available tokens to waiters, highest priority first"""
+        now = time.monotonic()
+        self._refill(now)
+        while self._waiters and now >= self._blocked_until and self._tokens >= 1:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():  # waiter was cancelled
+                continue
+            self._tokens -= 1
+            future.set_result(None)
+
+        if self._waiters and self._timer is None:
+            delay = max(self._blocked_until - now, (1 - self._tokens) / self.rate, 0)
+            self._timer = asyncio.get_running_loop().call_later(delay, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._pump()
+
+    async def acquire(self, priority: Priority = Priority.DEFAULT) -> None:
+        """Wait for a request slot"""
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._seq), future))
+        self._pump()
+        await future
+        self.dispatched += 1
+
+    def block_for(self, seconds: float) -> None:
+        """Stop dispatching anything for `seconds` (Spotify told us to back off)"""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    # Request execution
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_backoff, self.base_backoff * 2 ** attempt))
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> float:
+        try:
+            return max(float(response.headers.get("Retry-After", 1)), 0)
+        except ValueError:
+            return 1.0
+
+    async def execute(self, send: Callable[[], Awaitable[httpx.Response]], idempotent: bool,
+                      priority: Priority = Priority.DEFAULT) -> httpx.Response:
+        """Run `send` under the rate limit, retrying idempotent requests on 429/5xx/network errors"""
+        attempt = 0
+        while True:
+            await self.acquire(priority)
+            try:
+                response = await send()
+            except httpx.TransportError:
+                if not idempotent or attempt >= self.max_retries:
+                    raise
+                await self._sleep_before_retry(attempt)
+                attempt += 1
+                continue
+
+            if response.status_code == 429:
+                self.throttled += 1
+                self.block_for(self._retry_after(response))
+                if idempotent and attempt < self.max_retries:
+                    # acquire() waits out Retry-After; the jitter spreads the retries
+                    await self._sleep_before_retry(attempt)
+                    attempt += 1
+                    continue
+            elif response.status_code in RETRYABLE_STATUSES and idempotent and attempt < self.max_retries:
+                await self._sleep_before_retry(attempt)
+                attempt += 1
+                continue
+            return response
+
+    async def _sleep_before_retry(self, attempt: int) -> None:
+        self.retries += 1
+        await asyncio.sleep(self._backoff(attempt))
+
+    def queue_depth(self) -> int:
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "queue_depth": self.queue_depth(),
+            "dispatched": self.dispatched,
+            "throttled": self.throttled,
+            "retries": self.retries,
+            "blocked_for_seconds": round(max(self._blocked_until - time.monotonic(), 0), 3),
+        }
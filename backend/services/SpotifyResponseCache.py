@@ -0,0 +1,120 @@
+import asyncio
+import struct
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+from .SharedCache import CacheBackend, MemoryCacheBackend
+
+KEY_PREFIX = "spotify:response:"
+# stored_at, ttl, etag length
+HEADER = struct.Struct("<ddH")
+
+
+@dataclass
+class CacheEntry:
+    """A cached Spotify response body plus what is needed to revalidate it"""
+    body: bytes
+    etag: Optional[str]
+    stored_at: float
+    ttl: float
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+    def is_fresh(self, now: float) -> bool:
+        return now - self.stored_at < self.ttl
+
+    def encode(self) -> bytes:
+        etag = (self.etag or "").encode()
+        return HEADER.pack(self.stored_at, self.ttl, len(etag)) + etag + self.body
+
+    @classmethod
+    def decode(cls, data: bytes) -> "CacheEntry":
+        stored_at, ttl, etag_length = HEADER.unpack_from(data)
+        etag_end = HEADER.size + etag_length
+        etag = data[HEADER.size:etag_end].decode() or None
+        return cls(body=data[etag_end:], etag=etag, stored_at=stored_at, ttl=ttl)
+
+
+class SpotifyResponseCache:
+    """Two-tier cache for Spotify catalog reads: a per-process memory tier over an
+    optional shared tier (e.g. the SQLite backend every worker can see).
+
+    Entries past their TTL are not dropped; they are handed back as stale so the
+    caller can revalidate them with `If-None-Match` and pay for a 304 instead of
+    the full payload.
+    """
+
+    # Seconds an entry is served without asking Spotify, per endpoint kind
+    DEFAULT_TTLS: Dict[str, float] = {
+        "track": 24 * 3600,
+        "tracks": 24 * 3600,
+        "artist": 24 * 3600,
+        "album": 24 * 3600,
+        "album_tracks": 24 * 3600,
+        "playlist": 5 * 60,
+        "me": 10 * 60,
+    }
+
+    def __init__(self, max_entries: int = 2048, max_bytes: int = 32 * 1024 * 1024,
+                 shared: Optional[CacheBackend] = None, ttls: Optional[Dict[str, float]] = None):
+        self.memory = MemoryCacheBackend(max_entries, max_bytes)
+        self.shared = shared
+        self.ttls = {**self.DEFAULT_TTLS, **(ttls or {})}
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.revalidated = 0
+        self.shared_hits = 0
+
+    def ttl_for(self, kind: str) -> float:
+        return self.ttls.get(kind, 0)
+
+    async def lookup(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry for `key` from memory, falling back to the shared tier (fresh or stale)"""
+        key = KEY_PREFIX + key
+        data = self.memory.get(key)
+        if data is None and self.shared is not None:
+            data = await asyncio.to_thread(self.shared.get, key)
+            if data is not None:
+                self.shared_hits += 1
+                self.memory.set(key, data)
+        entry = CacheEntry.decode(data) if data is not None else None
+        if entry is None:
+            self.misses += 1
+        elif entry.is_fresh(time.time()):
+            self.hits += 1
+        else:
+            self.stale_hits += 1
+        return entry
+
+    async def store(self, key: str, body: bytes, etag: Optional[str], ttl: float) -> CacheEntry:
+        entry = CacheEntry(body=body, etag=etag, stored_at=time.time(), ttl=ttl)
+        data = entry.encode()
+        self.memory.set(KEY_PREFIX + key, data)
+        if self.shared is not None:
+            await asyncio.to_thread(self.shared.set, KEY_PREFIX + key, data)
+        return entry
+
+    async def mark_revalidated(self, key: str, entry: CacheEntry) -> CacheEntry:
+        """Spotify answered 304: the stale body is good for another TTL"""
+        self.revalidated += 1
+        return await self.store(key, entry.body, entry.etag, entry.ttl)
+
+    async def invalidate(self, key: str) -> None:
+        self.memory.delete(KEY_PREFIX + key)
+        if self.shared is not None:
+            await asyncio.to_thread(self.shared.delete, KEY_PREFIX + key)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale_hits": self.stale_hits,
+            "revalidated": self.revalidated,
+            "shared_hits": self.shared_hits,
+            "evictions": self.memory.evictions,
+            "entries": len(self.memory),
+            "bytes": self.memory.total_bytes,
+        }
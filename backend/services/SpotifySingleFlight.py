@@ -0,0 +1,70 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class SpotifySingleFlight:
+    """Coalesces identical in-flight Spotify GETs onto one upstream call.
+
+    The first caller for a key starts the request; everyone arriving while it is in
+    flight awaits the same task. Optionally the result is kept for a short window
+    so a burst of pollers (host laptop, TV, phones) costs one upstream call.
+    """
+
+    def __init__(self, player_state_window: float = 0.0):
+        self.player_state_window = player_state_window  # result window for volatile player state
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._recent: Dict[Hashable, Tuple[float, Any]] = {}
+        self.leaders = 0
+        self.coalesced = 0
+        self.window_hits = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]],
+                 result_window: float = 0.0, keep: Callable[[Any], bool] = lambda _: True) -> Any:
+        """Run `fn` once per key at a time, sharing its result (or exception)
+
+        Args:
+            result_window: Seconds to keep serving a finished result
+            keep: Whether a result may be reused within the window
+        """
+        now = time.monotonic()
+        recent = self._recent.get(key)
+        if recent is not None:
+            if recent[0] > now:
+                self.window_hits += 1
+                return recent[1]
+            del self._recent[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.leaders += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done, result_window, keep))
+        else:
+            self.coalesced += 1
+        # shield: a caller going away must not cancel the call the others are waiting on
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task, result_window: float,
+                keep: Callable[[Any], bool]) -> None:
+        self._inflight.pop(key, None)
+        if result_window > 0 and not task.cancelled() and task.exception() is None:
+            result = task.result()
+            if keep(result):
+                self._recent[key] = (time.monotonic() + result_window, result)
+        if len(self._recent) > 256:
+            now = time.monotonic()
+            self._recent = {k: v for k, v in self._recent.items() if v[0] > now}
+
+    def forget(self, match: Callable[[Hashable], bool]) -> None:
+        """Drop windowed results whose key matches (e.g. after a playback change)"""
+        self._recent = {k: v for k, v in self._recent.items() if not match(k)}
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "in_flight": len(self._inflight),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "window_hits": self.window_hits,
+        }
@@ -0,0 +1,178 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional
+import httpx
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from .SpotifyHttpClient import SpotifyHttpClient
+from .SharedCache import control_key
+from .SpotifyTokenStore import SpotifyTokens, SpotifyTokenStore
+
+SPOTIFY_TOKEN_URL = "https://accounts.spotify.com/api/token"
+# Cross-worker refresh lease in the token store's cache
+LEASE_KEY = control_key("spotify_token:refresh_lease")
+
+
+class SpotifyTokenRefreshError(Exception):
+    """The access token could not be refreshed (no refresh token, or Spotify said no)"""
+
+
+class SpotifyTokenRefresher:
+    """Refreshes the Spotify access token ahead of expiry.
+
+    A background task refreshes `margin` seconds before SPOTIFY_TOKEN_EXPIRES_AT,
+    so request handlers normally find a valid token in the store. Every refresh --
+    background, middleware fallback, /auth/refresh, /auth/token -- goes through one
+    lock, and a caller that waited on the lock reuses the token the previous holder
+    just fetched instead of refreshing again. Across worker processes a lease in the
+    shared cache does the same job: the worker that loses waits for the winner's token.
+    Store and cache calls run in a thread: the cache may be a SQLite file.
+    """
+
+    def __init__(self, http: SpotifyHttpClient, store: SpotifyTokenStore,
+                 session_factory: Callable[[], Session], client_id: str, client_secret: str,
+                 margin: float = 300.0, retry_interval: float = 30.0, idle_interval: float = 60.0,
+                 lease_seconds: float = 15.0):
+        self.http = http
+        self.store = store
+        self.session_factory = session_factory
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.margin = margin
+        self.retry_interval = retry_interval
+        self.idle_interval = idle_interval  # how often to look again when there is no token
+        self.lease_seconds = lease_seconds
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.refreshes = 0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+
+    def seconds_until_due(self, tokens: Optional[SpotifyTokens]) -> Optional[float]:
+        """Seconds until the background refresh of `tokens` should run; None if there is nothing to refresh"""
+        if tokens is None or not tokens.refresh_token:
+            return None
+        try:
+            expires_at = tokens.expires_at_datetime()
+        except ValueError:
+            return 0.0
+        if expires_at is None:
+            return 0.0
+        return (expires_at - timedelta(seconds=self.margin) - datetime.now()).total_seconds()
+
+    async def _read(self) -> SpotifyTokens:
+        return await self.store.read_async(self.session_factory)
+
+    async def refresh(self) -> str:
+        """Refresh the access token, or return the one a concurrent refresh just stored"""
+        seen_token = (await self._read()).access_token
+        async with self._lock:
+            tokens = await self._read()
+            if tokens.access_token != seen_token and tokens.access_token:
+                return tokens.access_token
+
+            refresh_token = tokens.refresh_token
+            if not refresh_token:
+                raise SpotifyTokenRefreshError("No refresh token available. Please re-authorize in settings.")
+
+            cache = self.store.cache
+            if await asyncio.to_thread(cache.incr, LEASE_KEY, ttl=self.lease_seconds) != 1:
+                return await self._wait_for_other_worker(seen_token)
+            try:
+                return await self._refresh(refresh_token)
+            finally:
+                await asyncio.to_thread(cache.delete, LEASE_KEY)
+
+    async def _wait_for_other_worker(self, seen_token: Optional[str]) -> str:
+        deadline = asyncio.get_running_loop().time() + self.lease_seconds
+        while asyncio.get_running_loop().time() < deadline:
+            await asyncio.sleep(0.2)
+            tokens = await asyncio.to_thread(self.store.snapshot)
+            token = tokens.access_token if tokens else None
+            if token and token != seen_token:
+                return token
+        raise SpotifyTokenRefreshError("Timed out waiting for another worker to refresh the token")
+
+    async def _refresh(self, refresh_token: str) -> str:
+        token_data = {
+            "grant_type": "refresh_token",
+            "refresh_token": refresh_token,
+            "client_id": self.client_id,
+            "client_secret": self.client_secret
+        }
+        try:
+            response = await self.http.client.post(SPOTIFY_TOKEN_URL, data=token_data)
+            response.raise_for_status()
+            tokens = response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            self.failures += 1
+            self.last_error = str(e)
+            raise SpotifyTokenRefreshError(f"Failed to refresh token: {str(e)}") from e
+
+        await asyncio.to_thread(self._save, tokens)
+        self.refreshes += 1
+        self.last_error = None
+        return tokens["access_token"]
+
+    def _save(self, tokens: Dict[str, Any]) -> None:
+        # Imported here: GameplaySettingsMethods itself imports the token store
+        from ..methods.GameplaySettingsMethods import upsert_setting
+
+        expires_in = tokens.get("expires_in", 3600)
+        expires_at = (datetime.now() + timedelta(seconds=expires_in)).isoformat()
+        db = self.session_factory()
+        try:
+            upsert_setting(db, "SPOTIFY_ACCESS_TOKEN", tokens["access_token"])
+            upsert_setting(db, "SPOTIFY_TOKEN_EXPIRES_AT", expires_at)
+            if "refresh_token" in tokens:
+                upsert_setting(db, "SPOTIFY_REFRESH_TOKEN", tokens["refresh_token"])
+        finally:
+            db.close()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                tokens = await self._read()
+            except SQLAlchemyError as e:
+                # The app starts without its database; keep trying until it is up
+                print(f"Spotify token refresher could not load the token: {str(e)}")
+                await asyncio.sleep(self.retry_interval)
+                continue
+            due = self.seconds_until_due(tokens)
+            if due is None:
+                await asyncio.sleep(self.idle_interval)
+                continue
+            if due > 0:
+                # Wake up periodically so a re-authorization is picked up
+                await asyncio.sleep(min(due, self.idle_interval))
+                continue
+            try:
+                await self.refresh()
+            except SpotifyTokenRefreshError as e:
+                print(f"Background Spotify token refresh failed: {str(e)}")
+                await asyncio.sleep(self.retry_interval)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        tokens = self.store.snapshot()
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "refreshing": self._lock.locked(),
+            "expires_at": tokens.expires_at if tokens else None,
+            "seconds_until_refresh": self.seconds_until_due(tokens),
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "last_error": self.last_error,
+        }
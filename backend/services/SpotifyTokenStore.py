@@ -0,0 +1,128 @@
+import asyncio
+from datetime import datetime
+from typing import Callable, Dict, Optional
+from sqlalchemy.orm import Session
+from ..models.GameplaySettings import GameplaySettings
+from .SharedCache import CacheBackend, MemoryCacheBackend, control_key
+from .VersionedSnapshot import VersionedSnapshot
+
+ACCESS_TOKEN_KEY = "SPOTIFY_ACCESS_TOKEN"
+REFRESH_TOKEN_KEY = "SPOTIFY_REFRESH_TOKEN"
+EXPIRES_AT_KEY = "SPOTIFY_TOKEN_EXPIRES_AT"
+TOKEN_KEYS = (ACCESS_TOKEN_KEY, REFRESH_TOKEN_KEY, EXPIRES_AT_KEY)
+
+# Cache keys: a random version that changes on every write, and the settings snapshot taken at it
+VERSION_KEY = control_key("spotify_token:version")
+SNAPSHOT_KEY = control_key("spotify_token:settings")
+
+
+class SpotifyTokens:
+    """The SPOTIFY_* settings as one read of the store saw them"""
+
+    def __init__(self, values: Dict[str, str]):
+        self.values = values
+
+    def get(self, key: str) -> Optional[str]:
+        return self.values.get(key)
+
+    @property
+    def access_token(self) -> Optional[str]:
+        return self.get(ACCESS_TOKEN_KEY)
+
+    @property
+    def refresh_token(self) -> Optional[str]:
+        return self.get(REFRESH_TOKEN_KEY)
+
+    @property
+    def expires_at(self) -> Optional[str]:
+        """Raw ISO timestamp as stored"""
+        return self.get(EXPIRES_AT_KEY)
+
+    def expires_at_datetime(self) -> Optional[datetime]:
+        """Parsed expiry; raises ValueError on a malformed value"""
+        raw = self.expires_at
+        return datetime.fromisoformat(raw) if raw else None
+
+
+class SpotifyTokenStore:
+    """Cached copy of the SPOTIFY_* rows of gameplay_settings.
+
+    A VersionedSnapshot in a CacheBackend (the app's shared cache once the app has
+    started) whose version every write through upsert_setting/delete_setting
+    replaces: reading the current token costs one cache lookup and no database
+    round trip, and with a shared backend a refresh in one worker is seen by all
+    of them.
+
+    A cache lookup may be a SQLite query: read the store once per request and use
+    the SpotifyTokens it returns. Async callers use `read_async`, which only leaves
+    the event loop when the lookup is I/O.
+    """
+
+    def __init__(self, cache: Optional[CacheBackend] = None):
+        self.snapshots = VersionedSnapshot(
+            VERSION_KEY, SNAPSHOT_KEY, cache if cache is not None else MemoryCacheBackend(max_entries=16)
+        )
+
+    @property
+    def cache(self) -> CacheBackend:
+        return self.snapshots.cache
+
+    @property
+    def loads(self) -> int:
+        return self.snapshots.loads
+
+    def use(self, cache: CacheBackend) -> None:
+        """Switch to another cache backend (forgets the local copy)"""
+        self.snapshots.use(cache)
+
+    def snapshot(self) -> Optional[SpotifyTokens]:
+        """The tokens for the current version, or None if they must be loaded"""
+        current = self.snapshots.current()
+        return SpotifyTokens(current[1]) if current is not None else None
+
+    def read(self, session_factory: Callable[[], Session]) -> SpotifyTokens:
+        """The current tokens, loading them from the database if the cache has none"""
+        def load() -> Dict[str, str]:
+            db = session_factory()
+            try:
+                rows = db.query(GameplaySettings.key, GameplaySettings.value)\
+                    .filter(GameplaySettings.key.in_(TOKEN_KEYS))\
+                    .all()
+            finally:
+                db.close()
+            return {row.key: row.value for row in rows}
+
+        return SpotifyTokens(self.snapshots.load(load)[1])
+
+    async def read_async(self, session_factory: Callable[[], Session]) -> SpotifyTokens:
+        """read() for async callers: an in-process snapshot directly, anything else in a thread"""
+        if not self.cache.shared:
+            tokens = self.snapshot()
+            if tokens is not None:
+                return tokens
+        return await asyncio.to_thread(self.read, session_factory)
+
+    def load(self, values: Dict[str, str]) -> None:
+        """Seed the store directly (benchmarks, tools)"""
+        self.snapshots.replace(dict(values))
+
+    def apply(self, key: str, value: Optional[str]) -> None:
+        """Record a committed write (value None = deleted)"""
+        if not key.startswith("SPOTIFY_"):
+            return
+        current = self.snapshots.current()
+        if current is None:
+            # Nothing loaded: make sure no stale snapshot survives the write
+            self.invalidate()
+            return
+        values = {k: v for k, v in current[1].items() if k != key}
+        if value is not None:
+            values[key] = value
+        self.snapshots.replace(values)
+
+    def invalidate(self) -> None:
+        """Forget everything; the next reader reloads from the database"""
+        self.snapshots.invalidate()
+
+
+spotify_token_store = SpotifyTokenStore()
@@ -0,0 +1,104 @@
+import asyncio
+import json
+import secrets
+import threading
+from typing import Any, Callable, Optional, Tuple
+from .SharedCache import CacheBackend
+
+
+class VersionedSnapshot:
+    """A JSON value cached next to a random version that every write replaces.
+
+    The value sits in a CacheBackend under `snapshot_key`, tagged with the version
+    stored under `version_key`. Each process keeps the copy it last saw and only
+    re-reads the value when the version has moved, so a read is one cache lookup
+    and no database round trip -- and with a shared backend, a write in one worker
+    is seen by all of them. Use control keys (SharedCache.control_key) so the cache
+    never evicts them to make room.
+
+    A lookup may be a SQLite query: read once per request, off the event loop.
+    """
+
+    def __init__(self, version_key: str, snapshot_key: str, cache: CacheBackend):
+        self.version_key = version_key
+        self.snapshot_key = snapshot_key
+        self.cache = cache
+        self._lock = threading.Lock()
+        self._version: Optional[bytes] = None
+        self._data: Any = None
+        self.loads = 0
+
+    def use(self, cache: CacheBackend) -> None:
+        """Switch to another cache backend (forgets the local copy)"""
+        with self._lock:
+            self.cache = cache
+            self._version = None
+            self._data = None
+
+    async def call(self, method: Callable[..., Any], *args: Any) -> Any:
+        """Await one of the methods below from async code: in a thread only if the cache is I/O"""
+        if self.cache.shared:
+            return await asyncio.to_thread(method, *args)
+        return method(*args)
+
+    def current(self) -> Optional[Tuple[str, Any]]:
+        """(version, value), or None if the value must be loaded"""
+        version = self.cache.get(self.version_key)
+        if version is None:
+            return None
+        if version == self._version:
+            return version.decode(), self._data
+        data = self.cache.get(self.snapshot_key)
+        if data is not None:
+            snapshot = json.loads(data)
+            if snapshot.get("version") == version.decode() and "data" in snapshot:
+                with self._lock:
+                    self._version, self._data = version, snapshot["data"]
+                return version.decode(), snapshot["data"]
+        return None
+
+    def load_version(self) -> bytes:
+        """The version to publish a fresh load under, taken before reading the source.
+
+        A write that lands while the source is read replaces the version, which
+        makes the value published afterwards stale for every reader.
+        """
+        version = self.cache.get(self.version_key)
+        if version is None:
+            version = self._new_version()
+        return version
+
+    def publish(self, version: bytes, data: Any) -> Tuple[str, Any]:
+        """Store `data` as the value of `version` (from load_version)"""
+        self.cache.set(self.snapshot_key, json.dumps({"version": version.decode(), "data": data}).encode())
+        with self._lock:
+            self._version, self._data = version, data
+        self.loads += 1
+        return version.decode(), data
+
+    def load(self, loader: Callable[[], Any]) -> Tuple[str, Any]:
+        """(version, value), calling `loader` for the value if the cached copy is missing or stale"""
+        current = self.current()
+        if current is not None:
+            return current
+        version = self.load_version()
+        return self.publish(version, loader())
+
+    def replace(self, data: Any) -> None:
+        """Make `data` the current value under a new version"""
+        version = secrets.token_hex(8).encode()
+        # Value first, then the version, so readers never see a version without its value
+        self.cache.set(self.snapshot_key, json.dumps({"version": version.decode(), "data": data}).encode())
+        self.cache.set(self.version_key, version)
+        with self._lock:
+            self._version, self._data = version, data
+
+    def invalidate(self) -> None:
+        """Forget the value; the next reader loads it again"""
+        self._new_version()
+        self.cache.delete(self.snapshot_key)
+
+    def _new_version(self) -> bytes:
+        version = secrets.token_hex(8).encode()
+        self.cache.set(self.version_key, version)
+        return version
@@ -0,0 +1,55 @@
+# backend/tests/test_game_track_deck.py
+from backend.methods import GameTrackDeckMethods, PlaylistMirrorMethods
+from backend.models.Game import Game
+
+PLAYLIST_ID = "playlist"
+
+
+def mirror_rows(track_ids):
+    return [{"position": position, "spotify_track_id": track_id, "title": track_id, "artists": "Artist"}
+            for position, track_id in enumerate(track_ids)]
+
+
+def draw_track_id(db, game_id):
+    _, position = GameTrackDeckMethods.draw_for_playlist(db, game_id, PLAYLIST_ID)
+    return PlaylistMirrorMethods.get_track_at_position(db, PLAYLIST_ID, position).spotify_track_id
+
+
+def test_resync_keeps_drawn_tracks_out_of_the_deck(db):
+    game = Game()
+    db.add(game)
+    db.commit()
+    before = [f"t{i}" for i in range(6)]
+    PlaylistMirrorMethods.replace_tracks(db, PLAYLIST_ID, "s1", "Mix", mirror_rows(before))
+
+    drawn = [draw_track_id(db, game.game_id) for _ in range(3)]
+
+    # Reordered on Spotify, with one undrawn track removed and two added
+    removed = next(track_id for track_id in before if track_id not in drawn)
+    after = [track_id for track_id in reversed(before) if track_id != removed] + ["t6", "t7"]
+    PlaylistMirrorMethods.replace_tracks(db, PLAYLIST_ID, "s2", "Mix", mirror_rows(after))
+
+    deck = GameTrackDeckMethods.get_deck(db, game.game_id)
+    db.refresh(game)
+    assert game.current_track_index == len(drawn)
+    assert deck.size == len(after)
+
+    drawn += [draw_track_id(db, game.game_id) for _ in range(len(after) - len(drawn))]
+    assert len(drawn) == len(set(drawn))
+    assert set(drawn) == set(after)
+
+
+def test_resync_of_a_deck_dealt_before_mirroring(db):
+    game = Game()
+    db.add(game)
+    db.commit()
+    # Cold start: the deck is dealt from the playlist's track total
+    GameTrackDeckMethods.create_deck(db, game.game_id, PLAYLIST_ID, list(range(5)))
+    drawn_positions = [GameTrackDeckMethods.draw_next_position(db, game.game_id)[1] for _ in range(2)]
+
+    track_ids = [f"t{i}" for i in range(5)]
+    PlaylistMirrorMethods.replace_tracks(db, PLAYLIST_ID, "s1", "Mix", mirror_rows(track_ids))
+
+    drawn = [track_ids[position] for position in drawn_positions]
+    drawn += [draw_track_id(db, game.game_id) for _ in range(3)]
+    assert sorted(drawn) == track_ids
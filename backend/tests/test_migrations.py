@@ -0,0 +1,31 @@
+# backend/tests/test_migrations.py
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from backend import migrations
+from backend.methods.UpsertMethods import upsert_id
+from backend.models.TrackInfo import TrackInfo
+
+
+def test_track_info_upsert_works_right_after_the_unique_migration():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    migrations.upgrade(engine, 1)
+    with engine.begin() as connection:
+        connection.execute(text("INSERT INTO song (song_id, spotify_id, title) VALUES (1, 's', 'Song')"))
+        connection.execute(text("INSERT INTO artist (artist_id, spotify_id, name) VALUES (1, 'a', 'Artist')"))
+        connection.execute(text("INSERT INTO track_info (track_info_id, song_id, artist_id) VALUES (1, 1, 1), (2, 1, 1)"))
+        connection.execute(text("INSERT INTO game (game_id, current_track_index, songs_per_round) VALUES (1, 0, 3)"))
+        connection.execute(text("INSERT INTO round (round_id, game_id, round_number, is_complete) VALUES (1, 1, 1, 0)"))
+        connection.execute(text("INSERT INTO round_team (round_team_id, round_id, role) VALUES (1, 1, 'PLAYER')"))
+        connection.execute(text("INSERT INTO round_songlist (round_songlist_id, round_id, song_id, round_team_id, "
+                                "track_info_id, score_type) VALUES (1, 1, 1, 1, 2, 'STANDARD')"))
+
+    assert migrations.upgrade(engine, 2) == [2]
+
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT track_info_id FROM track_info")).scalars().all() == [1]
+        assert connection.execute(text("SELECT track_info_id FROM round_songlist")).scalar_one() == 1
+    with Session(engine) as db:
+        assert upsert_id(db, TrackInfo, {"song_id": 1, "artist_id": 1}, ["song_id", "artist_id"]) == 1
+    engine.dispose()
@@ -36,15 +36,6 @@ const RoundSetupModal = ({ gameId, participants, onClose, onRoundCreated }) => {
     try {
       console.log('Starting round...', { gameId, nextRoundNumber });
       
-      // Create the round
-      const roundResponse = await axios.post('http://localhost:8000/api/rounds/', {
-        game_id: gameId,
-        round_number: nextRoundNumber
-      });
-
-      console.log('Round created:', roundResponse.data);
-      const roundId = roundResponse.data.round_id;
-      
       const sortedParticipants = [...participants].sort((a, b) => a.seat_number - b.seat_number);
       console.log('Sorted participants:', sortedParticipants.map(p => ({
         name: p.player.name,
@@ -59,55 +50,25 @@ const RoundSetupModal = ({ gameId, participants, onClose, onRoundCreated }) => {
       );
       console.log('Roles assigned:', roles);
       
-      // Create round teams and assign participants
-      // DJ team
-      console.log('Creating DJ team...');
-      const djTeamResponse = await axios.post('http://localhost:8000/api/round-teams/', {
-        round_id: roundId,
-        role: 'dj'
-      });
-      console.log('DJ team created:', djTeamResponse.data);
-      
-      await axios.post('http://localhost:8000/api/round-team-players/', {
-        round_team_id: djTeamResponse.data.round_team_id,
-        participant_id: roles.dj.participant_id
-      });
-      console.log('DJ assigned to team');
-
-      // Player team
+      // DJ team, player team and stealer team
+      const teams = [{ role: 'dj', participant_ids: [roles.dj.participant_id] }];
       if (roles.players.length > 0) {
-        console.log('Creating player team...');
-        const playerTeamResponse = await axios.post('http://localhost:8000/api/round-teams/', {
-          round_id: roundId,
-          role: 'player'
-        });
-        console.log('Player team created:', playerTeamResponse.data);
-        
-        for (const player of roles.players) {
-          await axios.post('http://localhost:8000/api/round-team-players/', {
-            round_team_id: playerTeamResponse.data.round_team_id,
-            participant_id: player.participant_id
-          });
-          console.log('Player assigned:', player.player.name);
-        }
+        teams.push({ role: 'player', participant_ids: roles.players.map(player => player.participant_id) });
       }
-
-      // Stealer team
       if (roles.stealer) {
-        console.log('Creating stealer team...');
-        const stealerTeamResponse = await axios.post('http://localhost:8000/api/round-teams/', {
-          round_id: roundId,
-          role: 'stealer'
-        });
-        console.log('Stealer team created:', stealerTeamResponse.data);
-        
-        await axios.post('http://localhost:8000/api/round-team-players/', {
-          round_team_id: stealerTeamResponse.data.round_team_id,
-          participant_id: roles.stealer.participant_id
-        });
-        console.log('Stealer assigned:', roles.stealer.player.name);
+        teams.push({ role: 'stealer', participant_ids: [roles.stealer.participant_id] });
       }
 
+      // Create the round with all teams and players in one transaction
+      const roundResponse = await axios.post('http://localhost:8000/api/rounds/setup', {
+        game_id: gameId,
+        round_number: nextRoundNumber,
+        teams
+      });
+
+      console.log('Round created:', roundResponse.data);
+      const roundId = roundResponse.data.round_id;
+
       console.log('All teams created successfully. Calling onRoundCreated...');
       onRoundCreated(roundId);
     } catch (error) {
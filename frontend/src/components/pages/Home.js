@@ -30,23 +30,11 @@ const Home = ({ setCurrentPage, setCurrentGameId }) => {
 
   const checkForActiveGame = async () => {
     try {
-      const response = await axios.get('http://127.0.0.1:8000/api/games/');
-      const games = response.data;
-      
-      if (games.length === 0) {
-        setActiveGame(null);
-        setLoading(false);
-        return;
-      }
-
-      // Get the most recent game
-      const mostRecent = games.sort((a, b) => {
-        const dateA = new Date(a.started_at || a.created_at);
-        const dateB = new Date(b.started_at || b.created_at);
-        return dateB - dateA;
-      })[0];
-      
-      setActiveGame(mostRecent);
+      // Summaries come newest first: the first one is the most recent game
+      const response = await axios.get('http://127.0.0.1:8000/api/games/summaries', {
+        params: { limit: 1 }
+      });
+      setActiveGame(response.data.games[0] || null);
     } catch (error) {
       console.error('Error checking for active game:', error);
     } finally {
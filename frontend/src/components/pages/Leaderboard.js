@@ -5,6 +5,7 @@ import { Trophy, TrendingUp, Calendar, Users, Eye } from 'lucide-react';
 const Leaderboard = ({ setCurrentPage, setCurrentGameId }) => {
   const [leaderboard, setLeaderboard] = useState([]);
   const [gameHistory, setGameHistory] = useState([]);
+  const [historyCursor, setHistoryCursor] = useState(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
 
@@ -15,70 +16,16 @@ const Leaderboard = ({ setCurrentPage, setCurrentGameId }) => {
 
   const fetchLeaderboardData = async () => {
     try {
-      // Fetch all games
-      const gamesResponse = await axios.get('http://localhost:8000/api/games/');
-      const games = gamesResponse.data;
-
-      // Fetch detailed data for each game
-      const gamesWithDetails = await Promise.all(
-        games.map(async (game) => {
-          const detailsResponse = await axios.get(`http://localhost:8000/api/games/${game.game_id}/with-participants`);
-          const roundsResponse = await axios.get(`http://localhost:8000/api/rounds/game/${game.game_id}`);
-          
-          const roundsWithDetails = await Promise.all(
-            roundsResponse.data.map(async (round) => {
-              const roundDetails = await axios.get(`http://localhost:8000/api/rounds/${round.round_id}/details`);
-              return roundDetails.data;
-            })
-          );
-
-          return {
-            game: detailsResponse.data,
-            rounds: roundsWithDetails
-          };
-        })
-      );
-
-      // Calculate total scores for all players
-      const playerScores = {};
-
-      gamesWithDetails.forEach(({ game, rounds }) => {
-        rounds.forEach(round => {
-          round.round_teams?.forEach(team => {
-            const teamScore = calculateTeamScore(round, team.round_team_id);
-            
-            team.round_team_players?.forEach(teamPlayer => {
-              const participant = game.participants?.find(p => p.participant_id === teamPlayer.participant_id);
-              if (participant) {
-                const playerId = participant.player.player_id;
-                
-                if (!playerScores[playerId]) {
-                  playerScores[playerId] = {
-                    player: participant.player,
-                    totalScore: 0,
-                    gamesPlayed: new Set()
-                  };
-                }
-                
-                playerScores[playerId].totalScore += teamScore;
-                playerScores[playerId].gamesPlayed.add(game.game_id);
-              }
-            });
-          });
-        });
+      // Totals are aggregated server-side: one point each for artist, title and movie bonus
+      const response = await axios.get('http://localhost:8000/api/leaderboard/', {
+        params: { limit: 10 }
       });
 
-      // Convert to array, filter players with score > 0, sort by score, and take top 10
-      const sortedLeaderboard = Object.values(playerScores)
-        .filter(p => p.totalScore > 0)
-        .map(p => ({
-          ...p,
-          gamesPlayed: p.gamesPlayed.size
-        }))
-        .sort((a, b) => b.totalScore - a.totalScore)
-        .slice(0, 10);
-
-      setLeaderboard(sortedLeaderboard);
+      setLeaderboard(response.data.map(entry => ({
+        player: entry.player,
+        totalScore: entry.total_score,
+        gamesPlayed: entry.games_played
+      })));
     } catch (error) {
       console.error('Error fetching leaderboard:', error);
       setError('Failed to load leaderboard data');
@@ -87,90 +34,20 @@ const Leaderboard = ({ setCurrentPage, setCurrentGameId }) => {
     }
   };
 
-  const fetchGameHistory = async () => {
+  const fetchGameHistory = async (cursor = null) => {
     try {
-      const response = await axios.get('http://localhost:8000/api/games/');
-      
-      // Fetch full details for each game to determine winner
-      const gamesWithWinners = await Promise.all(
-        response.data.map(async (game) => {
-          const detailsResponse = await axios.get(`http://localhost:8000/api/games/${game.game_id}/with-participants`);
-          const roundsResponse = await axios.get(`http://localhost:8000/api/rounds/game/${game.game_id}`);
-          
-          const roundsWithDetails = await Promise.all(
-            roundsResponse.data.map(async (round) => {
-              const roundDetails = await axios.get(`http://localhost:8000/api/rounds/${round.round_id}/details`);
-              return roundDetails.data;
-            })
-          );
-
-          // Calculate winner
-          const winner = calculateGameWinner(detailsResponse.data, roundsWithDetails);
-
-          return {
-            ...game,
-            participants: detailsResponse.data.participants,
-            winner: winner
-          };
-        })
-      );
-
-      // Sort by most recent first
-      const sortedGames = gamesWithWinners.sort((a, b) => {
-        const dateA = new Date(a.started_at || a.created_at);
-        const dateB = new Date(b.started_at || b.created_at);
-        return dateB - dateA;
+      // One page of summaries (participants, final scores, winner), newest first
+      const response = await axios.get('http://localhost:8000/api/games/summaries', {
+        params: cursor ? { limit: 20, cursor } : { limit: 20 }
       });
 
-      setGameHistory(sortedGames);
+      setGameHistory(previous => cursor ? [...previous, ...response.data.games] : response.data.games);
+      setHistoryCursor(response.data.next_cursor);
     } catch (error) {
       console.error('Error fetching game history:', error);
     }
   };
 
-  const calculateTeamScore = (round, teamId) => {
-    let score = 0;
-    
-    round.round_songlists?.forEach(songlist => {
-      if (songlist.round_team_id === teamId) {
-        if (songlist.correct_artist_guess) score += 1;
-        if (songlist.correct_song_title_guess) score += 1;
-        if (songlist.bonus_correct_movie_guess) score += 1;
-      }
-    });
-    
-    return score;
-  };
-
-  const calculateGameWinner = (game, rounds) => {
-    const scores = {};
-    
-    // Initialize scores for all participants
-    game.participants?.forEach(participant => {
-      scores[participant.participant_id] = {
-        player: participant.player,
-        totalScore: 0
-      };
-    });
-
-    // Sum up scores from all rounds
-    rounds.forEach(round => {
-      round.round_teams?.forEach(team => {
-        const teamScore = calculateTeamScore(round, team.round_team_id);
-        
-        team.round_team_players?.forEach(teamPlayer => {
-          if (scores[teamPlayer.participant_id]) {
-            scores[teamPlayer.participant_id].totalScore += teamScore;
-          }
-        });
-      });
-    });
-
-    // Find the winner
-    const sortedScores = Object.values(scores).sort((a, b) => b.totalScore - a.totalScore);
-    return sortedScores[0]?.player || null;
-  };
-
   const handleViewGame = (gameId) => {
     setCurrentGameId(gameId);
     setCurrentPage('game-summary');
@@ -448,6 +325,15 @@ const Leaderboard = ({ setCurrentPage, setCurrentGameId }) => {
                 </button>
               </div>
             ))}
+            {historyCursor && (
+              <button
+                className="btn-secondary"
+                style={{ alignSelf: 'center', padding: '8px 16px' }}
+                onClick={() => fetchGameHistory(historyCursor)}
+              >
+                Load More Games
+              </button>
+            )}
           </div>
         )}
       </div>
@@ -4,6 +4,7 @@ import { Music, Play, SkipForward, CheckCircle, Award, Trophy, Volume2, Edit2, T
 import SongScoring from '../SongScoring';
 import DeleteConfirmationModal from '../DeleteConfirmationModal';
 import { useSpotifyPlayback, SpotifyDeviceManager } from './SpotifyPlaybackManager';
+import { fetchSettings } from '../../services/gameplaySettings';
 
 const RoundGameplay = ({ gameId, roundId, onRoundComplete }) => {
   const [game, setGame] = useState(null);
@@ -20,7 +21,6 @@ const RoundGameplay = ({ gameId, roundId, onRoundComplete }) => {
   const [isAuthenticated, setIsAuthenticated] = useState(false);
   const [availableDevices, setAvailableDevices] = useState([]);
   const [showDevicePicker, setShowDevicePicker] = useState(false);
-  const [playlistTrackCount, setPlaylistTrackCount] = useState(null);
   const [editingSongIndex, setEditingSongIndex] = useState(null);
   const [deleteModalOpen, setDeleteModalOpen] = useState(false);
   const [songToDelete, setSongToDelete] = useState(null);
@@ -70,9 +70,13 @@ const RoundGameplay = ({ gameId, roundId, onRoundComplete }) => {
 
   const fetchSpotifyPlaylistSetting = async () => {
     try {
-      const response = await axios.get('http://localhost:8000/api/gameplay-settings/SPOTIFY_PLAYLIST');
-      setSpotifyPlaylistId(response.data.value);
-      console.log('Spotify playlist ID:', response.data.value);
+      const settings = await fetchSettings(['SPOTIFY_PLAYLIST']);
+      if (settings.SPOTIFY_PLAYLIST === undefined) {
+        setError('Spotify playlist not configured. Please contact administrator.');
+        return;
+      }
+      setSpotifyPlaylistId(settings.SPOTIFY_PLAYLIST);
+      console.log('Spotify playlist ID:', settings.SPOTIFY_PLAYLIST);
     } catch (error) {
       console.error('Error fetching Spotify playlist setting:', error);
       setError('Spotify playlist not configured. Please contact administrator.');
@@ -205,79 +209,18 @@ const RoundGameplay = ({ gameId, roundId, onRoundComplete }) => {
 
       console.log('Using device:', targetDeviceId);
 
-      // Step 2: Check if something is currently playing and pause it
-      try {
-        const stateResponse = await axios.get('http://localhost:8000/api/spotify/me/player');
-        if (stateResponse?.data && stateResponse.data.is_playing) {
-          await pausePlayback();
-          await new Promise(resolve => setTimeout(resolve, 500));
-        }
-      } catch (stateError) {
-        console.warn('Error checking playback state:', stateError);
-      }
-
-      // Step 2.5: Get playlist info to determine total track count (cached)
-      let totalTracks = playlistTrackCount || 100; // Use cached value or default
-
-      if (!playlistTrackCount) {
-        console.log('Fetching playlist info to get track count...');
-        console.log('Playlist ID:', spotifyPlaylistId);
-        try {
-          const playlistResponse = await axios.get(`http://localhost:8000/api/spotify/playlists/${spotifyPlaylistId}`);
-          console.log('Playlist response:', playlistResponse.data);
-
-          if (playlistResponse.data && playlistResponse.data.tracks_total) {
-            totalTracks = playlistResponse.data.tracks_total;
-            setPlaylistTrackCount(totalTracks); // Cache it
-            console.log(`✅ Playlist has ${totalTracks} total tracks (cached for future use)`);
-          } else {
-            console.warn('Playlist response missing tracks_total:', playlistResponse.data);
-          }
-        } catch (playlistError) {
-          console.error('❌ Could not fetch playlist info:', playlistError);
-          console.error('Error response:', playlistError.response?.data);
-          console.error('Error status:', playlistError.response?.status);
-          console.warn('Using default track count of 100');
-        }
-      } else {
-        console.log(`Using cached track count: ${totalTracks}`);
-      }
-
-      // Step 3: Start playing from playlist at random position
-      console.log('Playing from playlist at random position...');
-
-      // Generate a random position based on actual playlist size
-      const randomPosition = Math.floor(Math.random() * totalTracks);
-      console.log(`Random position: ${randomPosition} out of ${totalTracks}`);
-
-      // Start playback at random position
-      await axios.put(`http://localhost:8000/api/spotify/me/player/play?device_id=${targetDeviceId}`, {
-        context_uri: `spotify:playlist:${spotifyPlaylistId}`,
-        offset: { position: randomPosition }
+      // Step 2: Pick a random playlist track, start it and record it on the round (server-side)
+      const playResponse = await axios.post(`http://localhost:8000/api/spotify/rounds/${roundId}/play-random`, {
+        playlist_id: spotifyPlaylistId,
+        device_id: targetDeviceId
       });
-      console.log('Play command sent with random offset');
-
-      // Wait for playback to start and stabilize
-      await new Promise(resolve => setTimeout(resolve, 1200));
-
-      // Step 4: Get current track info
-      console.log('Getting currently playing track...');
-
-      const nowPlayingResponse = await axios.get('http://localhost:8000/api/spotify/me/player/currently-playing');
-      console.log('Now playing response:', nowPlayingResponse.data);
+      console.log('Now playing:', playResponse.data.track, 'at position', playResponse.data.position);
 
-      const track = nowPlayingResponse.data.item || nowPlayingResponse.data;
-      console.log('Track extracted:', track);
+      setCurrentTrack(playResponse.data.track);
 
-      setCurrentTrack(track);
-
-      if (track) {
-        console.log('Track exists, calling saveTrackToRound with round data');
-        await saveTrackToRound(track, round);
-      } else {
-        console.error('No track found in response');
-        setError('Failed to get track information from Spotify');
-      }
+      const newSongsLength = await fetchRoundDetails();
+      setCurrentSongIndex(newSongsLength - 1);
+      setShowScoring(true);
     } catch (err) {
       console.error('Error playing track:', err);
       console.log('Setting spotifyError to true');
@@ -367,108 +310,6 @@ const RoundGameplay = ({ gameId, roundId, onRoundComplete }) => {
     }
   };
 
-  const saveTrackToRound = async (track, currentRound = null) => {
-    try {
-      console.log('=== SAVING TRACK ===');
-      console.log('Full track object:', JSON.stringify(track, null, 2));
-      console.log('Track ID:', track?.id);
-      console.log('Track name:', track?.name);
-      console.log('Track artists:', track?.artists);
-
-      // Use the passed round or the state round
-      const roundToUse = currentRound || round;
-      console.log('Round object:', roundToUse);
-      console.log('Round.round_teams:', roundToUse?.round_teams);
-      console.log('Round keys:', Object.keys(roundToUse || {}));
-
-      if (!roundToUse) {
-        console.error('Round is undefined!');
-        throw new Error('Round data not loaded');
-      }
-
-      if (!roundToUse.round_teams) {
-        console.error('Round exists but has no round_teams property!');
-        console.error('Available round properties:', Object.keys(roundToUse));
-        throw new Error('Round teams not loaded - please refresh the page');
-      }
-
-      if (!track) {
-        throw new Error('No track provided');
-      }
-
-      if (!track.artists || track.artists.length === 0) {
-        console.error('Track has no artists. Full track:', track);
-        throw new Error('Track has no artists');
-      }
-
-      if (!track.id) {
-        console.error('Track has no ID. Full track:', track);
-        throw new Error('Track has no ID');
-      }
-
-      if (!track.name) {
-        console.error('Track has no name. Full track:', track);
-        throw new Error('Track has no name');
-      }
-
-      console.log('Creating artist...');
-      const artistResponse = await axios.post('http://localhost:8000/api/artists/', {
-        spotify_id: track.artists[0].id,
-        name: track.artists[0].name
-      });
-      console.log('Artist created:', artistResponse.data);
-      const artistId = artistResponse.data.artist_id;
-
-      console.log('Creating song...');
-      const songResponse = await axios.post('http://localhost:8000/api/songs/', {
-        spotify_id: track.id,
-        title: track.name
-      });
-      console.log('Song created:', songResponse.data);
-      const songId = songResponse.data.song_id;
-
-      console.log('Creating track info...');
-      const trackInfoResponse = await axios.post('http://localhost:8000/api/track-infos/', {
-        song_id: songId,
-        artist_id: artistId
-      });
-      console.log('Track info created:', trackInfoResponse.data);
-      const trackInfoId = trackInfoResponse.data.track_info_id;
-
-      const playerTeam = roundToUse.round_teams.find(t => t.role === 'player');
-      if (!playerTeam) {
-        throw new Error('No player team found in round');
-      }
-
-      console.log('Creating round songlist entry...');
-      await axios.post('http://localhost:8000/api/round-songlists/', {
-        round_id: roundId,
-        song_id: songId,
-        round_team_id: playerTeam.round_team_id,
-        track_info_id: trackInfoId,
-        correct_artist_guess: false,
-        correct_song_title_guess: false,
-        bonus_correct_movie_guess: false,
-        score_type: 'standard'
-      });
-      console.log('Round songlist created successfully');
-
-      console.log('Fetching updated round details...');
-      const newSongsLength = await fetchRoundDetails();
-      setCurrentSongIndex(newSongsLength - 1);
-
-      console.log('Showing scoring modal');
-      setShowScoring(true);
-      console.log('=== TRACK SAVED SUCCESSFULLY ===');
-    } catch (error) {
-      console.error('=== ERROR SAVING TRACK ===');
-      console.error('Error details:', error);
-      console.error('Error response:', error.response?.data);
-      console.error('Error status:', error.response?.status);
-      setError(`Failed to save track: ${error.response?.data?.detail || error.message}`);
-    }
-  };
-
   const handleScoringComplete = async (scoringData) => {
     try {
       const songIndex = editingSongIndex !== null ? editingSongIndex : currentSongIndex;
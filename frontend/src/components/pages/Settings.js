@@ -2,6 +2,7 @@
 import React, { useState, useEffect } from 'react';
 import axios from 'axios';
 import { Music, CheckCircle, AlertCircle, RefreshCw } from 'lucide-react';
+import { fetchSettings, saveSetting } from '../../services/gameplaySettings';
 
 const Settings = () => {
   const [isAuthenticated, setIsAuthenticated] = useState(false);
@@ -38,11 +39,15 @@ const Settings = () => {
 
   const fetchPlaylistSetting = async () => {
     try {
-      const response = await axios.get('http://127.0.0.1:8000/api/gameplay-settings/SPOTIFY_PLAYLIST');
-      setPlaylistId(response.data.value);
-      setSavedPlaylistId(response.data.value);
+      const settings = await fetchSettings(['SPOTIFY_PLAYLIST']);
+      if (settings.SPOTIFY_PLAYLIST === undefined) {
+        console.log('No playlist configured yet');
+        return;
+      }
+      setPlaylistId(settings.SPOTIFY_PLAYLIST);
+      setSavedPlaylistId(settings.SPOTIFY_PLAYLIST);
     } catch (error) {
-      console.log('No playlist configured yet');
+      console.error('Error fetching settings:', error);
     }
   };
 
@@ -76,7 +81,7 @@ const Settings = () => {
 
     setSaving(true);
     try {
-      await axios.put(`http://127.0.0.1:8000/api/gameplay-settings/SPOTIFY_PLAYLIST/upsert?value=${encodeURIComponent(playlistId)}`);
+      await saveSetting('SPOTIFY_PLAYLIST', playlistId);
       setSavedPlaylistId(playlistId);
       setMessage('Playlist ID saved successfully!');
     } catch (error) {
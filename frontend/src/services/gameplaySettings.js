@@ -0,0 +1,49 @@
+// frontend/src/services/gameplaySettings.js
+import axios from 'axios';
+
+const SETTINGS_URL = 'http://127.0.0.1:8000/api/gameplay-settings/';
+
+// Last bulk read per key list: { etag, settings }
+const cache = new Map();
+
+/**
+ * Fetches several gameplay settings in one request
+ * @param {Array<string>} keys - Setting keys to read
+ * @returns {Object} - Map of key to value; keys that are not configured are left out
+ *
+ * Sends the ETag of the previous read as If-None-Match; on a 304 the cached
+ * values are reused.
+ */
+export const fetchSettings = async (keys) => {
+  const keyList = [...keys].sort().join(',');
+  const cached = cache.get(keyList);
+  const response = await axios.get(SETTINGS_URL, {
+    params: { keys: keyList },
+    headers: cached ? { 'If-None-Match': cached.etag } : {},
+    validateStatus: (status) => status === 200 || status === 304
+  });
+
+  if (response.status === 304 && cached) {
+    return cached.settings;
+  }
+
+  const settings = {};
+  response.data.forEach(({ key, value }) => {
+    settings[key] = value;
+  });
+  if (response.headers.etag) {
+    cache.set(keyList, { etag: response.headers.etag, settings });
+  }
+  return settings;
+};
+
+/**
+ * Creates or updates one gameplay setting
+ * @param {string} key - Setting key
+ * @param {string} value - New value
+ */
+export const saveSetting = async (key, value) => {
+  await axios.put(`${SETTINGS_URL}${key}/upsert`, null, { params: { value } });
+  // Every write changes the snapshot version, so no cached read is current
+  cache.clear();
+};